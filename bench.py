@@ -0,0 +1,959 @@
+# bench.py
+"""
+성능 측정 스크립트 (운영 DB는 건드리지 않고 임시 SQLite 파일에서 실행)
+
+    python bench.py checkout      # 일괄 대여: 단말 수별 락 점유 시간 (기존 루프 vs 일괄)
+    python bench.py return        # 일괄 반납: 배치 크기별 소요 시간 (기존 루프 vs 일괄)
+    python bench.py concurrency   # 관리자 조회 부하 중 대여/반납 지연 (rollback journal vs WAL 프로파일)
+    python bench.py search        # 게시판 검색: 게시글 수별(최대 10만) LIKE vs 한글 n-gram 색인
+    python bench.py export        # 장비 내보내기: 형식별 처리량/파일 크기 (기존 pandas xlsx vs xlsx/csv/parquet 스트리밍)
+    python bench.py import        # 주소록 가져오기: 5만 행 xlsx (기존 행별 INSERT vs 청크 upsert), 재가져오기 포함
+    python bench.py manual        # 업무 메뉴얼: manual_data.json 로드 (매번 파싱 vs 문서 캐시) + 이미지 목록 (listdir vs 색인)
+    python bench.py manual-writes # 업무 메뉴얼 동시 편집: 4 프로세스 항목 추가 (기존 덮어쓰기 vs 잠금+원자적 교체)
+    python bench.py manual-images # 메뉴얼 이미지: 휴대폰 사진 원본 vs WebP/AVIF 파생본 페이지 용량, 직렬 vs 워커 풀
+    python bench.py manual-dedup  # 메뉴얼 이미지 저장 용량: 같은 스크린샷을 여러 폴더에 업로드 + 항목 삭제 (uuid 파일 vs 내용 주소)
+    python bench.py manual-upload # 메뉴얼 이미지 200MB 일괄 업로드: request.files + 저장 vs 스트리밍 저장 (시간/메모리/디스크 쓰기)
+    python bench.py manual-revisit # /admin/manual 재방문 전송량: ETag 재검증만 vs 지문 URL + immutable (브라우저 캐시 흉내)
+    python bench.py importtime    # app import 시간/메모리 (pandas·openpyxl 선로딩 / 키오스크 전용 기능 구성과 비교)
+"""
+import argparse
+import io
+import json
+import multiprocessing
+import os
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine, event, text
+
+# rentalapp.db import 시 엔진이 만들어지므로 운영 DB 대신 임시 파일을 가리킨다
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.gettempdir(), "bench_boot.db")
+
+import pandas as pd
+
+from openpyxl import Workbook
+
+from rentalapp.contacts import import_companies, read_company_frames
+from rentalapp.db import SQLITE_PRAGMAS, apply_sqlite_pragmas
+from rentalapp.exports import csv_chunks, parquet_chunks, xlsx_chunks
+from rentalapp import manual as manual_mod
+from rentalapp import manual_images
+from rentalapp.migrations import run_migrations
+from rentalapp.rental import checkout_units, return_units
+from rentalapp.search import initials_of, parse_search_query, search_table, sync_search_index
+
+INFO = {
+    "user_name": "홍길동", "dept": "운영팀", "phone": "01012345678",
+    "start_date": "2025-01-01", "end_date": "2025-01-02", "signature": "data:image/png;base64,",
+}
+
+
+def _temp_engine(pragmas: dict = None):
+    fd, path = tempfile.mkstemp(suffix=".db", prefix="bench_")
+    os.close(fd)
+    eng = create_engine(f"sqlite:///{path}", future=True)
+    if pragmas:
+        event.listen(eng, "connect", lambda dbapi_conn, _: apply_sqlite_pragmas(dbapi_conn, pragmas))
+    return eng, path
+
+
+def _remove_db(path):
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+def _create_rental_schema(eng, units: int):
+    run_migrations(eng)
+    with eng.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO walkie_talkie_units (unit_no, serial_no, item_name)
+            VALUES (:unit_no, :serial_no, '무전기')
+        """), [{"unit_no": f"No.{i}", "serial_no": f"{i:06d}"} for i in range(1, units + 1)])
+
+
+def _legacy_checkout(conn, info, unit_nos, rental_date):
+    """기존 rental_items() 방식: 단말마다 SELECT + INSERT"""
+    for unit_no in unit_nos:
+        row = conn.execute(
+            text("SELECT serial_no, COALESCE(item_name,'무전기') FROM walkie_talkie_units WHERE unit_no = :unit_no"),
+            {"unit_no": unit_no},
+        ).first()
+        serial_no = row[0] if row else f"Unknown-{unit_no}"
+        conn.execute(text("""
+            INSERT INTO rental (
+                user_name, dept, phone, start_date, end_date,
+                signature, serial_no, qty, rental_date, status, unit_no
+            ) VALUES (
+                :user_name, :dept, :phone, :start_date, :end_date,
+                :signature, :serial_no, 1, :rental_date, 'rented', :unit_no
+            )
+        """), {**info, "serial_no": serial_no, "rental_date": rental_date, "unit_no": unit_no})
+
+
+def _legacy_return(conn, info, serial_nos, returned_at):
+    """기존 return_items() 방식: 시리얼마다 SELECT + UPDATE + unit_state 정리 + INSERT"""
+    for serial_no in serial_nos:
+        row = conn.execute(text("""
+            SELECT id FROM rental
+            WHERE dept = :dept AND serial_no = :serial_no AND status = 'rented'
+            ORDER BY id DESC LIMIT 1
+        """), {"dept": info["dept"], "serial_no": serial_no}).first()
+        if not row:
+            continue
+        conn.execute(text("""
+            UPDATE rental SET status = 'returned', end_date = :end_date
+            WHERE id = :id AND status = 'rented'
+        """), {"end_date": returned_at, "id": row[0]})
+        conn.execute(text("DELETE FROM unit_state WHERE rental_id = :id"), {"id": row[0]})
+        conn.execute(text("""
+            INSERT INTO returns_log (rental_id, dept, returner_name, returner_phone, returned_at)
+            VALUES (:rental_id, :dept, :returner_name, :returner_phone, :returned_at)
+        """), {"rental_id": row[0], "dept": info["dept"], "returner_name": info["user_name"],
+               "returner_phone": info["phone"], "returned_at": returned_at})
+
+
+def _reset(eng):
+    with eng.begin() as conn:
+        conn.execute(text("DELETE FROM returns_log"))
+        conn.execute(text("DELETE FROM unit_state"))
+        conn.execute(text("DELETE FROM rental"))
+
+
+def _time_tx(eng, fn, *args):
+    t0 = time.perf_counter()
+    with eng.begin() as conn:
+        fn(conn, *args)
+    return (time.perf_counter() - t0) * 1000
+
+
+def bench_checkout(repeat: int):
+    sizes = [1, 5, 10, 20, 40, 80]
+    eng, path = _temp_engine()
+    try:
+        _create_rental_schema(eng, max(sizes))
+
+        print(f"{'units':>6} {'legacy ms':>10} {'bulk ms':>10} {'speedup':>8}")
+        for n in sizes:
+            units = [f"No.{i}" for i in range(1, n + 1)]
+            legacy, bulk = [], []
+            for _ in range(repeat):
+                legacy.append(_time_tx(eng, _legacy_checkout, INFO, units, "2025-01-01 09:00:00"))
+                _reset(eng)
+                bulk.append(_time_tx(eng, checkout_units, INFO, units, "2025-01-01 09:00:00"))
+                _reset(eng)
+            lm, bm = statistics.median(legacy), statistics.median(bulk)
+            print(f"{n:>6} {lm:>10.2f} {bm:>10.2f} {lm / bm:>7.1f}x")
+    finally:
+        eng.dispose()
+        _remove_db(path)
+
+
+def bench_return(repeat: int):
+    sizes = [1, 5, 10, 20, 40, 80]
+    eng, path = _temp_engine()
+    try:
+        _create_rental_schema(eng, max(sizes))
+
+        print(f"{'units':>6} {'legacy ms':>10} {'bulk ms':>10} {'speedup':>8}")
+        for n in sizes:
+            units = [f"No.{i}" for i in range(1, n + 1)]
+            serials = [f"{i:06d}" for i in range(1, n + 1)]
+            legacy, bulk = [], []
+            for _ in range(repeat):
+                for fn, out in ((_legacy_return, legacy), (return_units, bulk)):
+                    with eng.begin() as conn:
+                        checkout_units(conn, INFO, units, "2025-01-01 09:00:00")
+                    out.append(_time_tx(eng, fn, INFO, serials, "2025-01-01 18:00:00"))
+                    _reset(eng)
+            lm, bm = statistics.median(legacy), statistics.median(bulk)
+            print(f"{n:>6} {lm:>10.2f} {bm:>10.2f} {lm / bm:>7.1f}x")
+    finally:
+        eng.dispose()
+        _remove_db(path)
+
+
+def _run_concurrency(pragmas: dict, seconds: float, readers: int):
+    eng, path = _temp_engine(pragmas)
+    units = [f"No.{i}" for i in range(1, 21)]
+    serials = [f"{i:06d}" for i in range(1, 21)]
+    try:
+        _create_rental_schema(eng, len(units))
+        with eng.begin() as conn:
+            # 관리자 화면이 훑는 대여 이력
+            conn.execute(text("""
+                INSERT INTO rental (user_name, dept, phone, serial_no, rental_date, status, unit_no, end_date)
+                VALUES ('과거', '운영팀', '010', :serial_no, '2024-01-01', 'returned', :unit_no, '2024-01-02')
+            """), [{"serial_no": f"{i % 20 + 1:06d}", "unit_no": f"No.{i % 20 + 1}"} for i in range(200_000)])
+
+        stop = threading.Event()
+        reads = [0]
+
+        def reader():
+            with eng.connect() as conn:
+                while not stop.is_set():
+                    try:
+                        conn.execute(text("""
+                            SELECT dept, COUNT(*), MAX(end_date) FROM rental
+                             WHERE user_name LIKE '%과%' GROUP BY dept
+                        """)).all()
+                        reads[0] += 1
+                    except Exception:
+                        pass
+                    conn.rollback()
+
+        threads = [threading.Thread(target=reader, daemon=True) for _ in range(readers)]
+        for t in threads:
+            t.start()
+
+        latencies, errors = [], 0
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            try:
+                latencies.append(_time_tx(eng, checkout_units, INFO, units, "2025-01-01 09:00:00"))
+                latencies.append(_time_tx(eng, return_units, INFO, serials, "2025-01-01 18:00:00"))
+            except Exception:
+                errors += 1
+        stop.set()
+        for t in threads:
+            t.join()
+    finally:
+        eng.dispose()
+        _remove_db(path)
+
+    latencies.sort()
+    p = lambda q: latencies[min(int(len(latencies) * q), len(latencies) - 1)] if latencies else float("nan")
+    return len(latencies), errors, reads[0], p(0.5), p(0.95), p(0.99)
+
+
+def bench_concurrency(repeat: int):
+    profiles = {
+        "rollback journal": {"journal_mode": "DELETE"},  # 기존 기본값 (pysqlite timeout 5초)
+        "WAL (app 기본값)": SQLITE_PRAGMAS,
+    }
+    seconds = max(repeat / 4, 2)
+    print(f"{'profile':<18} {'writes':>7} {'errors':>7} {'reads':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, pragmas in profiles.items():
+        writes, errors, reads, p50, p95, p99 = _run_concurrency(pragmas, seconds, readers=4)
+        print(f"{name:<18} {writes:>7} {errors:>7} {reads:>7} {p50:>8.2f} {p95:>8.2f} {p99:>8.2f}")
+
+
+SYLLABLES = "가나다라마바사아자차카타파하강남동서무전기배터리채널점검교체충전안테나선석야드크레인작업일정변경보고요청완료고장수리반납"
+
+
+def _vocabulary(rnd, size: int = 5000):
+    """합성 한국어 어휘 (2~3음절) — 앞쪽 단어일수록 자주 쓰이도록 1/순위 가중치"""
+    words = list(dict.fromkeys(
+        "".join(rnd.choice(SYLLABLES) for _ in range(rnd.choice((2, 3)))) for _ in range(size * 2)
+    ))[:size]
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    return words, weights
+
+
+def _insert_posts(eng, start: int, count: int, rnd, vocab):
+    words, weights = vocab
+    rows = []
+    for i in range(start, start + count):
+        title = " ".join(rnd.choices(words, weights, k=4))
+        content = " ".join(w + rnd.choice(("을", "를", "이", "은", "")) for w in rnd.choices(words, weights, k=40))
+        rows.append({"id": i, "title": f"{title} #{i}", "content": content})
+    with eng.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO board (id, title, content, category, is_pinned, board_type)
+            VALUES (:id, :title, :content, '공지', 0, 'work')
+        """), rows)
+        sync_search_index(conn, "board", [r["id"] for r in rows])
+
+
+def bench_search(repeat: int):
+    sizes = [1_000, 10_000, 100_000]
+    rnd = random.Random(7)
+    vocab = _vocabulary(rnd)
+    words = vocab[0]
+    long_word = next(w for w in words[200:] if len(w) == 3)
+    queries = {
+        "흔한 단어": words[50],
+        "드문 단어": words[800],
+        "부분 음절": long_word[1:],                      # 단어 중간/끝 음절
+        "한 글자": long_word[-1],                       # 단어 끝 음절 하나
+        "초성": initials_of(long_word),
+        "두 단어": f"{words[20]} {words[300]}",
+        "제외어만": f"-{words[50]}",
+    }
+    eng, path = _temp_engine(SQLITE_PRAGMAS)
+    try:
+        run_migrations(eng)
+        print(f"{'posts':>7} {'query':<10} {'q':<10} {'hits':>6} {'LIKE ms':>9} {'ngram ms':>9}")
+        loaded = 0
+        for n in sizes:
+            _insert_posts(eng, loaded + 1, n - loaded, rnd, vocab)
+            loaded = n
+            for label, q in queries.items():
+                terms = parse_search_query(q)
+                like_where = " ".join(f"AND {'NOT ' if t['negate'] else ''}(title LIKE :l{i} OR content LIKE :l{i})"
+                                      for i, t in enumerate(terms))
+                like_params = {f"l{i}": f"%{t['text']}%" for i, t in enumerate(terms)}
+                like, ngram = [], []
+                with eng.connect() as conn:
+                    for _ in range(repeat):
+                        t0 = time.perf_counter()
+                        conn.execute(text(f"SELECT COUNT(*) FROM board WHERE 1=1 {like_where}"), like_params).scalar_one()
+                        conn.execute(text(f"""
+                            SELECT id, title FROM board WHERE 1=1 {like_where}
+                            ORDER BY is_pinned DESC, id DESC LIMIT 10
+                        """), like_params).all()
+                        like.append((time.perf_counter() - t0) * 1000)
+
+                        t0 = time.perf_counter()
+                        hits, _ = search_table(conn, "board", terms, "t.id, t.title", "WHERE 1=1", {}, 10, 0)
+                        ngram.append((time.perf_counter() - t0) * 1000)
+                print(f"{n:>7} {label:<10} {q:<10} {hits:>6} {statistics.median(like):>9.2f} {statistics.median(ngram):>9.2f}")
+    finally:
+        eng.dispose()
+        _remove_db(path)
+
+
+EQUIPMENT_COLUMNS = [("ID", "int"), ("장비 이름", "str"), ("모델명", "str"), ("카테고리", "str"),
+                     ("위치", "str"), ("총 수량", "int"), ("사용 가능", "int")]
+EQUIPMENT_SQL = """
+    SELECT id, item_name, model_name, category, location, total_qty, available_qty
+    FROM equipment ORDER BY id DESC
+"""
+
+
+def _legacy_xlsx(conn):
+    """기존 export_equipment(): 전체 fetch → DataFrame → ExcelWriter(BytesIO)"""
+    rows = conn.execute(text(EQUIPMENT_SQL)).all()
+    df = pd.DataFrame(rows, columns=[name for name, _ in EQUIPMENT_COLUMNS])
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine="openpyxl") as writer:
+        df.to_excel(writer, index=False, sheet_name="장비목록")
+    yield buf.getvalue()
+
+
+def _streamed(conn, make_chunks):
+    result = conn.execution_options(stream_results=True, yield_per=2000).execute(text(EQUIPMENT_SQL))
+    yield from make_chunks(row for part in result.partitions() for row in part)
+
+
+def bench_export(repeat: int):
+    sizes = [10_000, 100_000]
+    header = [name for name, _ in EQUIPMENT_COLUMNS]
+    writers = {
+        "xlsx (pandas)": _legacy_xlsx,
+        "xlsx": lambda conn: _streamed(conn, lambda rows: xlsx_chunks("장비목록", header, rows)),
+        "csv": lambda conn: _streamed(conn, lambda rows: csv_chunks(header, rows)),
+        "parquet": lambda conn: _streamed(conn, lambda rows: parquet_chunks(EQUIPMENT_COLUMNS, rows)),
+    }
+    rnd = random.Random(7)
+    eng, path = _temp_engine(SQLITE_PRAGMAS)
+    try:
+        run_migrations(eng)
+        print(f"{'rows':>7} {'format':<14} {'sec':>7} {'rows/s':>9} {'MB':>7} {'first chunk ms':>15}")
+        loaded = 0
+        for n in sizes:
+            with eng.begin() as conn:
+                conn.execute(text("""
+                    INSERT INTO equipment (item_name, model_name, category, location, total_qty, available_qty)
+                    VALUES (:item_name, :model_name, :category, :location, :total_qty, :available_qty)
+                """), [{
+                    "item_name": f"무전기 {i}", "model_name": rnd.choice(("XiR P8668i", "XiR C2660", "TLK 100")),
+                    "category": rnd.choice(("무전기", "배터리", "충전기")),
+                    "location": f"{rnd.choice('ABCD')}동 {rnd.randint(1, 40)}번 선반",
+                    "total_qty": rnd.randint(1, 20), "available_qty": rnd.randint(0, 20),
+                } for i in range(loaded, n)])
+            loaded = n
+            for name, writer in writers.items():
+                times, firsts, size = [], [], 0
+                for _ in range(max(1, repeat // 10)):
+                    with eng.connect() as conn:
+                        t0 = time.perf_counter()
+                        first, size = None, 0
+                        for chunk in writer(conn):
+                            if first is None:
+                                first = (time.perf_counter() - t0) * 1000
+                            size += len(chunk)
+                        times.append(time.perf_counter() - t0)
+                        firsts.append(first)
+                sec = statistics.median(times)
+                print(f"{n:>7} {name:<14} {sec:>7.2f} {n / sec:>9.0f} {size / 1e6:>7.2f} {statistics.median(firsts):>15.1f}")
+    finally:
+        eng.dispose()
+        _remove_db(path)
+
+
+def _vendor_xlsx(rows: int, rnd) -> bytes:
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Companies")
+    ws.append(["name", "manager", "phone", "group_name", "memo"])
+    for i in range(rows):
+        phone = f"010-{rnd.randint(1000, 9999)}-{rnd.randint(1000, 9999)}" if i % 50 else "연락처 없음"
+        ws.append([f"협력업체 {i}", rnd.choice(("김", "이", "박")) + "담당", phone,
+                   rnd.choice(("LPR", "UPS", "PDA", None)), None if i % 3 else "정기 점검"])
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def _legacy_import(conn, data: bytes):
+    """기존 import_excel(): read_excel 전체 → 행마다 INSERT (NaN 그대로)"""
+    df = pd.read_excel(io.BytesIO(data))
+    for r in df.to_dict(orient="records"):
+        conn.execute(text("""
+            INSERT INTO companies (name, manager, phone, group_name, memo)
+            VALUES (:name, :manager, :phone, :group_name, :memo)
+        """), {"name": r.get("name", ""), "manager": r.get("manager", ""), "phone": r.get("phone", ""),
+               "group_name": r.get("group_name", ""), "memo": r.get("memo", "")})
+
+
+def bench_import(repeat: int):
+    rows = 50_000
+    data = _vendor_xlsx(rows, random.Random(7))
+    print(f"{rows}행 xlsx {len(data) / 1e6:.2f} MB")
+    print(f"{'path':<24} {'sec':>7} {'rows/s':>9}  result")
+
+    eng, path = _temp_engine(SQLITE_PRAGMAS)
+    try:
+        run_migrations(eng)
+        with eng.begin() as conn:
+            conn.execute(text("DROP INDEX uq_companies_name_phone"))   # 기존 방식은 중복을 그대로 넣음
+            t0 = time.perf_counter()
+            _legacy_import(conn, data)
+            sec = time.perf_counter() - t0
+        print(f"{'행별 INSERT (기존)':<24} {sec:>7.2f} {rows / sec:>9.0f}  {rows}행 추가 (검색 색인 없음)")
+    finally:
+        eng.dispose()
+        _remove_db(path)
+
+    eng, path = _temp_engine(SQLITE_PRAGMAS)
+    try:
+        run_migrations(eng)
+        for label in ("청크 upsert", "청크 upsert (재가져오기)"):
+            with eng.begin() as conn:
+                t0 = time.perf_counter()
+                report = import_companies(conn, read_company_frames(io.BytesIO(data), "vendors.xlsx"))
+                sec = time.perf_counter() - t0
+            print(f"{label:<24} {sec:>7.2f} {rows / sec:>9.0f}  "
+                  f"+{report['inserted']} ~{report['updated']} 제외 {report['rejected_count']}")
+    finally:
+        eng.dispose()
+        _remove_db(path)
+
+
+def _manual_app(root: str, sections: int = 20, items: int = 15, images: int = 6):
+    """임시 root 아래 static/manual/... 이미지와 manual_data.json 을 만들고 그 경로를 보는 앱 반환"""
+    from rentalapp import create_app
+
+    doc = {"last_updated": "2025-01-01", "sections": []}
+    for s in range(sections):
+        sec = {"id": f"sec_{s}", "title": f"섹션 {s}", "items": []}
+        for i in range(items):
+            rel = f"manual/guide_{s}_{i}"
+            os.makedirs(os.path.join(root, "static", rel), exist_ok=True)
+            for k in range(images):
+                with open(os.path.join(root, "static", rel, f"{k:02d}.png"), "wb") as f:
+                    f.write(b"\x89PNG\r\n\x1a\n" + os.urandom(64))
+            sec["items"].append({
+                "id": f"item_{s}_{i}", "name": f"항목 {i}", "images_dir": rel,
+                "description": "무전기 채널 설정 " * 20, "actions": ["전원 확인", "채널 확인"] * 5,
+                "notes": "", "contacts": ["010-0000-0000"],
+            })
+        doc["sections"].append(sec)
+    with open(os.path.join(root, "manual_data.json"), "w", encoding="utf-8") as f:
+        json.dump(doc, f, ensure_ascii=False, indent=2)
+
+    app = create_app("manual", migrate=False)
+    app.root_path = root
+    app.static_folder = os.path.join(root, "static")
+    app.instance_path = os.path.join(root, "instance")
+    app.template_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+    return app
+
+
+def _legacy_load_manual():
+    """기존 load_manual_data(): 후보 경로 탐색 + 매번 json 파싱"""
+    for p in manual_mod._manual_json_path_candidates():
+        if os.path.isfile(p):
+            with open(p, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+
+def _time_calls(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def _legacy_collect_images(manual: dict):
+    """기존 collect_manual_images(): 항목마다 os.listdir + 정렬"""
+    from flask import current_app, url_for
+
+    for sec in manual.get("sections", []):
+        for item in sec.get("items", []):
+            images_dir = (item.get("images_dir") or "").strip().lstrip("/\\")
+            abs_dir = os.path.join(current_app.static_folder, images_dir)
+            item["images"] = [
+                url_for("static", filename=f"{images_dir}/{fn}") for fn in sorted(os.listdir(abs_dir))
+                if manual_images.is_image_name(fn)
+            ] if os.path.isdir(abs_dir) else []
+    return manual
+
+
+class _FsCalls:
+    """디렉터리 읽기(os.listdir / os.scandir)와 os.stat 호출 수 세기"""
+
+    def __enter__(self):
+        self.reads = self.stats = 0
+        self._orig = os.listdir, os.scandir, os.stat
+
+        def counted(orig, field):
+            def wrapper(*args, **kwargs):
+                setattr(self, field, getattr(self, field) + 1)
+                return orig(*args, **kwargs)
+            return wrapper
+        os.listdir, os.scandir = counted(os.listdir, "reads"), counted(os.scandir, "reads")
+        os.stat = counted(os.stat, "stats")
+        return self
+
+    def __exit__(self, *exc):
+        os.listdir, os.scandir, os.stat = self._orig
+
+
+def bench_manual(repeat: int):
+    root = tempfile.mkdtemp(prefix="bench_manual_")
+    try:
+        app = _manual_app(root)
+        size_kb = os.path.getsize(os.path.join(root, "manual_data.json")) / 1024
+        with app.test_request_context():
+            manual_mod.load_manual_data()  # 캐시 적재
+            cases = {
+                "매번 파싱 (이전)": _legacy_load_manual,
+                "캐시 + 사본 (수정용)": lambda: manual_mod.load_manual_data(),
+                "캐시 공유 (조회용)": lambda: manual_mod.load_manual_data(writable=False),
+            }
+            print(f"manual_data.json {size_kb:.0f} KB, 항목 300개")
+            print(f"{'load':<24} {'ms/call':>9}")
+            for name, fn in cases.items():
+                print(f"{name:<24} {_time_calls(fn, repeat):>9.3f}")
+
+            # 폴더 mtime 이 2초 이상 지나야 색인을 믿음 (mtime 해상도 대비)
+            time.sleep(manual_images.LISTING_RACY_NS / 1e9)
+            index_dir = manual_mod._image_index_dir()
+            shared = lambda: manual_mod.load_manual_data(writable=False)
+            cases = {
+                "항목마다 listdir (이전)": lambda: _legacy_collect_images(_legacy_load_manual()),
+                "색인: 새 프로세스 (manifest)": lambda: (manual_images._listings.clear(),
+                                                    manual_mod.collect_manual_images(shared())),
+                "색인: mtime 재검증": lambda: ([e.update(checked=0) for e in manual_images._listings.values()],
+                                           manual_mod.collect_manual_images(shared())),
+                "색인: TTL 안 (메모리)": lambda: manual_mod.collect_manual_images(shared()),
+            }
+            shutil.rmtree(index_dir, ignore_errors=True)
+            manual_images._listings.clear()
+            with _FsCalls() as calls:
+                manual_mod.collect_manual_images(shared())
+            # 네트워크 볼륨 가정: 디렉터리 읽기 1회 ≈ 2 RTT, stat 1회 ≈ 1 RTT (RTT 0.5 ms)
+            nfs_ms = lambda c: (c.reads * 2 + c.stats) * 0.5
+            print(f"\n{'admin_manual 데이터':<28} {'ms/call':>9} {'dir reads':>10} {'stats':>6} {'+NFS ms':>8}")
+            print(f"{'색인 첫 생성':<28} {'':>9} {calls.reads:>10} {calls.stats:>6} {nfs_ms(calls):>8.0f}")
+            for name, fn in cases.items():
+                ms = _time_calls(fn, repeat)
+                with _FsCalls() as calls:
+                    fn()
+                print(f"{name:<28} {ms:>9.3f} {calls.reads:>10} {calls.stats:>6} {nfs_ms(calls):>8.0f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def _legacy_add_manual_item(path: str, worker: int, i: int):
+    """기존 방식: 읽기 → 추가 → 같은 파일에 그대로 덮어쓰기"""
+    manual = _legacy_load_manual()
+    manual["sections"][0]["items"].append({"id": f"w{worker}_{i}", "name": "동시 추가"})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manual, f, ensure_ascii=False, indent=2)
+
+
+def _update_add_manual_item(path: str, worker: int, i: int):
+    def mutate(manual, touch):
+        item = {"id": f"w{worker}_{i}", "name": "동시 추가"}
+        manual["sections"][0]["items"].append(item)
+        touch(item)
+    manual_mod.update_manual(mutate)
+
+
+def _manual_writer(app, path, add, worker, count, errors):
+    with app.test_request_context():
+        for i in range(count):
+            try:
+                add(path, worker, i)
+            except ValueError:  # 쓰는 도중의 잘린 JSON 을 읽음
+                errors.value += 1
+
+
+def bench_manual_writes(repeat: int):
+    workers, per_worker = 4, 25
+    ctx = multiprocessing.get_context("fork")
+    print(f"{workers} 프로세스 x 항목 {per_worker}개 추가 (문서 300 항목)")
+    print(f"{'mode':<24} {'sec':>7} {'kept':>6} {'lost':>6} {'read err':>9}")
+    for name, add in [("덮어쓰기 (이전)", _legacy_add_manual_item), ("잠금+CAS+원자적 교체", _update_add_manual_item)]:
+        root = tempfile.mkdtemp(prefix="bench_manual_")
+        try:
+            app = _manual_app(root, images=0)
+            path = os.path.join(root, "manual_data.json")
+            before = len(json.load(open(path, encoding="utf-8"))["sections"][0]["items"])
+            errors = ctx.Value("i", 0)
+            procs = [ctx.Process(target=_manual_writer, args=(app, path, add, w, per_worker, errors))
+                     for w in range(workers)]
+            t0 = time.perf_counter()
+            for proc in procs:
+                proc.start()
+            for proc in procs:
+                proc.join()
+            elapsed = time.perf_counter() - t0
+            try:
+                kept = len(json.load(open(path, encoding="utf-8"))["sections"][0]["items"]) - before
+            except ValueError:
+                print(f"{name:<24} {elapsed:>7.2f} {'파일 손상 (JSON 파싱 불가)':>24}")
+                continue
+            lost = workers * per_worker - errors.value - kept
+            print(f"{name:<24} {elapsed:>7.2f} {kept:>6} {lost:>6} {errors.value:>9}")
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def _phone_photo(path: str, rnd, size=(4032, 3024)):
+    """휴대폰 사진 비슷한 JPEG (그라데이션 + 센서 노이즈 + 물체, 품질 92 → 장당 약 4 MB)"""
+    from PIL import Image, ImageDraw, ImageFilter
+
+    w, h = size
+    base = Image.linear_gradient("L").resize((w, h)).rotate(rnd.randrange(360))
+    noise = Image.effect_noise((w, h), 60).filter(ImageFilter.GaussianBlur(0.8))
+    img = Image.merge("RGB", (base, noise, Image.blend(base, noise, 0.5)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(60):
+        x, y = rnd.randrange(w), rnd.randrange(h)
+        draw.rectangle((x, y, x + rnd.randrange(50, 600), y + rnd.randrange(50, 400)),
+                       fill=tuple(rnd.randrange(256) for _ in range(3)))
+    img.save(path, "JPEG", quality=92)
+
+
+def bench_manual_images(repeat: int):
+    count = max(4, repeat // 2)
+    formats = manual_images.enabled_formats()
+    root = tempfile.mkdtemp(prefix="bench_manual_img_")
+    try:
+        rnd = random.Random(7)
+        paths = []
+        for k in range(count):
+            paths.append(os.path.join(root, f"{k:02d}.jpg"))
+            _phone_photo(paths[-1], rnd)
+        original = sum(os.path.getsize(p) for p in paths)
+        print(f"휴대폰 사진 {count}장 (4032x3024 JPEG), 파생 형식: {', '.join(formats)}")
+
+        print(f"\n{'derive':<24} {'sec':>7} {'img/s':>7}")
+        for name, workers in [("직렬", 1), (f"워커 풀 ({manual_images.IMAGE_WORKERS})", manual_images.IMAGE_WORKERS)]:
+            shutil.rmtree(os.path.join(root, manual_images.DERIVED_DIR), ignore_errors=True)
+            t0 = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(manual_images.make_derivatives, paths))
+            elapsed = time.perf_counter() - t0
+            print(f"{name:<24} {elapsed:>7.2f} {count / elapsed:>7.2f}")
+
+        # 브라우저가 받는 용량: 카드 폭(lg 33vw ≈ 640px, 모바일 100vw ≈ 320~640px)에 맞는 파생본 하나
+        variants = manual_images.derived_variants(root)
+        print(f"\n{'page weight':<24} {'MB':>8} {'vs 원본':>8}")
+        print(f"{'원본 (이전)':<24} {original / 1e6:>8.2f} {1:>7.0f}x")
+        for fmt in formats:
+            for width in manual_images.DERIVED_WIDTHS:
+                size = sum(
+                    os.path.getsize(os.path.join(root, manual_images.DERIVED_DIR, fn))
+                    for v in variants.values() for w, fn in v.get(fmt, []) if w == width
+                )
+                print(f"{f'{fmt} {width}w':<24} {size / 1e6:>8.2f} {original / max(size, 1):>7.0f}x")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def _dir_bytes(path: str) -> int:
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(path) for f in files)
+
+
+def bench_manual_dedup(repeat: int):
+    folders, per_folder, distinct = 40, 8, 60
+    os.environ["MANUAL_IMAGE_FORMATS"] = "none"  # 파생본 생성은 빼고 원본 저장만 비교
+    grace, manual_images.IMAGE_GC_GRACE_SECONDS = manual_images.IMAGE_GC_GRACE_SECONDS, 0
+    root = tempfile.mkdtemp(prefix="bench_manual_dedup_")
+    try:
+        rnd = random.Random(3)
+        shots = []
+        for k in range(distinct):
+            buf = io.BytesIO()
+            _phone_photo(buf, rnd, size=(1170, 2532))  # 휴대폰 화면 캡처 크기
+            shots.append(buf.getvalue())
+        app = _manual_app(root, sections=1, items=0, images=0)
+        client = app.test_client()
+        plan = [(f"guide_{i}", rnd.sample(range(distinct), per_folder)) for i in range(folders)]
+        uploaded = sum(len(shots[k]) for _, ks in plan for k in ks)
+
+        t0 = time.perf_counter()
+        for folder, ks in plan:
+            files = [(io.BytesIO(shots[k]), f"캡처_{k}.jpg") for k in ks]
+            client.post("/admin/manuals/upload_images", data={"target_dir": folder, "files[]": files},
+                        content_type="multipart/form-data")
+            client.post("/admin/manual/item/add", data={
+                "sec_id": "sec_0", "name": folder, "images_dir": f"manual/{folder}"})
+        elapsed = time.perf_counter() - t0
+        static_manual = os.path.join(root, "static", "manual")
+        after_upload = _dir_bytes(static_manual)
+
+        # 항목 절반 삭제 → 참조 0 이 된 blob 만 정리됨 (이전에는 파일이 그대로 남음)
+        manual = manual_mod._read_manual_file(os.path.join(root, "manual_data.json"))
+        deleted = manual["sections"][0]["items"][: folders // 2]
+        for item in deleted:
+            client.post(f"/admin/manual/item/sec_0/{item['id']}/delete")
+        after_delete = _dir_bytes(static_manual)
+        remaining = {k for _, ks in plan[folders // 2:] for k in ks}
+        unique_left = sum(len(shots[k]) for k in remaining)
+
+        print(f"{folders} 폴더 x 캡처 {per_folder}장 (서로 다른 캡처 {distinct}장), 업로드 {elapsed:.2f}s")
+        print(f"{'storage MB':<28} {'업로드 후':>10} {'항목 절반 삭제 후':>16}")
+        print(f"{'uuid 파일 (이전)':<28} {uploaded / 1e6:>10.2f} {uploaded / 1e6:>16.2f}")
+        print(f"{'내용 주소 + 참조 수 GC':<28} {after_upload / 1e6:>10.2f} {after_delete / 1e6:>16.2f}")
+        print(f"{'고유 내용 합계':<28} {sum(map(len, shots)) / 1e6:>10.2f} {unique_left / 1e6:>16.2f}")
+    finally:
+        os.environ.pop("MANUAL_IMAGE_FORMATS", None)
+        manual_images.IMAGE_GC_GRACE_SECONDS = grace
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def _multipart_body(path: str, photos: list, count: int) -> str:
+    """휴대폰 사진 count 장짜리 multipart 본문을 파일로 → boundary"""
+    boundary = "----bench" + os.urandom(8).hex()
+    with open(path, "wb") as f:
+        for k in range(count):
+            f.write(f'--{boundary}\r\nContent-Disposition: form-data; name="files[]"; '
+                    f'filename="IMG_{k:04d}.jpg"\r\nContent-Type: image/jpeg\r\n\r\n'.encode())
+            f.write(photos[k % len(photos)])
+            f.write(b"\r\n")
+        f.write(f'--{boundary}\r\nContent-Disposition: form-data; name="target_dir"\r\n\r\n'
+                f'guide\r\n--{boundary}--\r\n'.encode())
+    return boundary
+
+
+def _legacy_upload(body_path: str, boundary: str, out_dir: str, verify: bool = True):
+    """023 까지의 방식: request.files(werkzeug 파싱, 500KB 넘으면 임시 파일로) → f.save → 해시 → 검증 (직렬)"""
+    from werkzeug.formparser import parse_form_data
+
+    with open(body_path, "rb") as body:
+        environ = {
+            "REQUEST_METHOD": "POST", "wsgi.input": body,
+            "CONTENT_TYPE": f"multipart/form-data; boundary={boundary}",
+            "CONTENT_LENGTH": str(os.path.getsize(body_path)),
+        }
+        _, _, files = parse_form_data(environ, max_form_memory_size=500 * 1024)
+        for k, f in enumerate(files.getlist("files[]")):
+            path = os.path.join(out_dir, f"{k}.tmp")
+            f.save(path)
+            manual_images.hash_file(path)
+            if verify:
+                manual_images.verify_image(path)
+
+
+def _streamed_upload(body_path: str, boundary: str, out_dir: str, verify: bool = True):
+    with open(body_path, "rb") as body:
+        uploaded, _, _ = manual_images.stream_image_upload(
+            body, boundary.encode(), out_dir, max_file_bytes=64 * 1024 * 1024)
+    if verify:
+        manual_images.verify_images([u[0] for u in uploaded])
+
+
+def bench_manual_upload(repeat: int):
+    import tracemalloc
+
+    root = tempfile.mkdtemp(prefix="bench_manual_upload_")
+    try:
+        rnd = random.Random(5)
+        photos = []
+        for _ in range(5):
+            buf = io.BytesIO()
+            _phone_photo(buf, rnd)
+            photos.append(buf.getvalue())
+        count = (200 * 1024 * 1024) // statistics.mean(map(len, photos))
+        body_path = os.path.join(root, "body.bin")
+        boundary = _multipart_body(body_path, photos, int(count))
+        body_mb = os.path.getsize(body_path) / 1e6
+        print(f"본문 {body_mb:.0f} MB (휴대폰 사진 {int(count)}장), 검증 풀 {manual_images.IMAGE_WORKERS}")
+
+        t0 = time.perf_counter()
+        shutil.copyfile(body_path, os.path.join(root, "copy.bin"))
+        copy_s = time.perf_counter() - t0
+        os.remove(os.path.join(root, "copy.bin"))
+        print(f"\n{'upload':<28} {'sec':>7} {'MB/s':>7} {'peak MB':>8}")
+        print(f"{'디스크 복사 (기준)':<28} {copy_s:>7.2f} {body_mb / copy_s:>7.0f} {'-':>8}")
+
+        cases = [
+            ("request.files + 저장 (이전)", _legacy_upload, False),
+            ("스트리밍 저장 (해시 포함)", _streamed_upload, False),
+            ("이전 + 직렬 검증", _legacy_upload, True),
+            ("스트리밍 + 병렬 검증", _streamed_upload, True),
+        ]
+        for name, fn, verify in cases:
+            out_dir = os.path.join(root, "out")
+            os.makedirs(out_dir)
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            fn(body_path, boundary, out_dir, verify)
+            elapsed = time.perf_counter() - t0
+            peak = tracemalloc.get_traced_memory()[1] / 1e6
+            tracemalloc.stop()
+            shutil.rmtree(out_dir)
+            print(f"{name:<28} {elapsed:>7.2f} {body_mb / elapsed:>7.0f} {peak:>8.1f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+_STATIC_URL_RE = re.compile(r'(?:src|href)="(/static/[^"]+)"|(/static/[^\s",]+)\s+\d+w')
+
+
+def _browser_visit(client, cache: dict, now: float) -> tuple:
+    """
+    /admin/manual 한 번 방문: 페이지 + 정적 파일 (<source srcset> 은 첫 후보만 — 브라우저도 하나만 받음)
+    - cache: URL → (ETag, 만료 시각) — max-age 안이면 요청 안 함, 아니면 If-None-Match 재검증
+    - 반환: (정적 파일 요청 수, 304 수, 정적 파일 바이트, 페이지 바이트)
+    """
+    page = client.get("/admin/manual")
+    html = page.get_data(as_text=True)
+    urls = []
+    for picture in re.split(r"</picture>", html):
+        found = [a or b for a, b in _STATIC_URL_RE.findall(picture)]
+        if "<picture>" in picture and found:
+            found = found[:1]  # 지원하는 첫 <source> 의 한 후보만
+        urls += found
+    requests_, not_modified, received = 0, 0, 0
+    for url in dict.fromkeys(urls):
+        etag, expires = cache.get(url, (None, 0))
+        if expires > now:
+            continue
+        rv = client.get(url, headers={"If-None-Match": etag} if etag else {})
+        requests_ += 1
+        received += len(rv.data)
+        if rv.status_code == 304:
+            not_modified += 1
+        max_age = rv.cache_control.max_age if not rv.cache_control.no_cache else None
+        cache[url] = (rv.headers.get("ETag"), now + (max_age or 0))
+    return requests_, not_modified, received, len(page.data)
+
+
+def bench_manual_revisit(repeat: int):
+    print(f"{'mode':<28} {'visit':>6} {'static req':>11} {'304':>6} {'static KB':>10} {'page KB':>8}")
+    for name, enabled in [("ETag 재검증만 (이전)", "0"), ("지문 URL + immutable", "1")]:
+        os.environ["STATIC_FINGERPRINT"] = enabled
+        root = tempfile.mkdtemp(prefix="bench_manual_revisit_")
+        try:
+            app = _manual_app(root, sections=5, items=10, images=6)
+            shutil.copytree(os.path.join(os.path.dirname(app.template_folder), "static", "js"),
+                            os.path.join(root, "static", "js"))
+            client = app.test_client()
+            cache = {}
+            for visit, now in [("첫 방문", 0), ("재방문", 3600)]:
+                requests_, not_modified, received, page = _browser_visit(client, cache, now)
+                print(f"{name:<28} {visit:>6} {requests_:>11} {not_modified:>6} {received / 1024:>10.1f} "
+                      f"{page / 1024:>8.1f}")
+        finally:
+            os.environ.pop("STATIC_FINGERPRINT", None)
+            shutil.rmtree(root, ignore_errors=True)
+
+
+_IMPORT_PROBE = """
+import sys, time
+t0 = time.perf_counter()
+{preload}
+import app
+ms = (time.perf_counter() - t0) * 1000
+heavy = ",".join(m for m in ("pandas", "openpyxl", "pyarrow", "numpy") if m in sys.modules) or "-"
+rss = next(int(l.split()[1]) for l in open("/proc/self/status") if l.startswith("VmRSS:"))
+print(f"{{ms:.1f}} {{rss / 1024:.1f}} {{len(sys.modules)}} {{heavy}}")
+"""
+
+
+def _probe_import(preload: str, env: dict, importtime: bool = False):
+    """새 인터프리터에서 import app → (ms, RSS MB, 모듈 수, 로드된 무거운 패키지, stderr)"""
+    cmd = [sys.executable] + (["-X", "importtime"] if importtime else []) + ["-c", _IMPORT_PROBE.format(preload=preload)]
+    proc = subprocess.run(cmd, env=env, cwd=os.path.dirname(os.path.abspath(__file__)),
+                          capture_output=True, text=True, check=True)
+    ms, rss, modules, heavy = proc.stdout.strip().splitlines()[-1].split()
+    return float(ms), float(rss), int(modules), heavy, proc.stderr
+
+
+def _top_imports(stderr: str, n: int = 10):
+    """-X importtime 출력 → app 아래 두 단계(rentalapp 모듈, 그 의존성)까지 누적 시간 상위"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if cumulative.strip().isdigit() and depth in (1, 2):
+            rows.append((int(cumulative), name.rstrip()[3:]))
+    return sorted(rows, reverse=True)[:n]
+
+
+def bench_importtime(repeat: int):
+    fd, path = tempfile.mkstemp(suffix=".db", prefix="bench_import_")
+    os.close(fd)
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{path}"}
+    profiles = {
+        "전체 기능 (지연 로딩)": ("", {}),
+        "pandas/openpyxl 선로딩 (이전)": ("import pandas, openpyxl", {}),
+        "키오스크 (APP_FEATURES=rental)": ("", {"APP_FEATURES": "rental"}),
+    }
+    try:
+        _probe_import("", env)  # 마이그레이션은 첫 기동에서만
+        print(f"{'profile':<32} {'import ms':>10} {'RSS MB':>8} {'modules':>8}  heavy")
+        for name, (preload, extra_env) in profiles.items():
+            runs = [_probe_import(preload, {**env, **extra_env}) for _ in range(max(3, repeat // 4))]
+            ms = statistics.median(r[0] for r in runs)
+            rss = statistics.median(r[1] for r in runs)
+            print(f"{name:<32} {ms:>10.1f} {rss:>8.1f} {runs[0][2]:>8}  {runs[0][3]}")
+
+        *_, stderr = _probe_import("", env, importtime=True)
+        print("\n-X importtime 상위 (누적 us)")
+        for cumulative, module in _top_imports(stderr):
+            print(f"  {cumulative:>9}  {module}")
+    finally:
+        _remove_db(path)
+
+
+BENCHES = {
+    "checkout": bench_checkout,
+    "return": bench_return,
+    "concurrency": bench_concurrency,
+    "search": bench_search,
+    "export": bench_export,
+    "import": bench_import,
+    "manual": bench_manual,
+    "manual-writes": bench_manual_writes,
+    "manual-images": bench_manual_images,
+    "manual-dedup": bench_manual_dedup,
+    "manual-upload": bench_manual_upload,
+    "manual-revisit": bench_manual_revisit,
+    "importtime": bench_importtime,
+}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HJNC rental 성능 측정")
+    parser.add_argument("bench", choices=sorted(BENCHES))
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    BENCHES[args.bench](args.repeat)
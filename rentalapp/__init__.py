@@ -0,0 +1,124 @@
+# rentalapp/__init__.py
+"""
+앱 팩토리 — 배포마다 필요한 기능(blueprint)만 골라서 등록
+
+    APP_FEATURES=all (기본)             전체 기능
+    APP_FEATURES=rental                 키오스크 전용 워커 (대여/반납/장애조치 화면만 로드)
+    APP_FEATURES=rental,admin,board     필요한 것만 콤마로 나열
+
+선택하지 않은 기능의 모듈은 import 하지 않으므로 워커 기동이 빠르고 메모리도 적게 쓴다.
+템플릿에서 선택 기능으로 가는 링크는 has_endpoint('board.admin_board_type') 로 감싼다.
+"""
+import os
+import importlib
+from datetime import datetime
+
+import click
+from flask import Flask, current_app
+
+from .db import BASE_DIR
+from .migrations import run_migrations
+
+# 기능 이름 → blueprint 모듈 (등록 순서대로)
+FEATURES = {
+    "rental":    ".rental",      # 키오스크: 사용자 메뉴 / 대여 / 반납 / 장애조치 안내
+    "admin":     ".admin",       # 관리자 로그인 / 메뉴 / 대여·반납 현황
+    "equipment": ".equipment",   # 장비 재고
+    "contacts":  ".contacts",    # 주소록
+    "board":     ".board",       # 게시판
+    "manual":    ".manual",      # 업무 메뉴얼 / 이미지
+    "calendar":  ".calendar",    # 캘린더 / 근무표
+    "users":     ".users",       # 사원 관리
+    "todos":     ".todos",       # 오늘의 할 일
+    "jobs":      ".jobs",        # 백그라운드 내보내기/가져오기
+}
+
+# 관리자 화면(base_admin.html)은 admin 의 메뉴/로그인 엔드포인트가 있어야 렌더링된다
+ADMIN_FEATURES = set(FEATURES) - {"rental", "admin"}
+
+
+def enabled_features(value=None) -> list:
+    """'all' / 'rental,board' / ['rental'] → 등록할 기능 목록 (FEATURES 순서)"""
+    if value is None:
+        value = os.getenv("APP_FEATURES", "all")
+    if isinstance(value, str):
+        value = [v.strip().lower() for v in value.split(",") if v.strip()]
+    names = set(value)
+    if "all" in names:
+        return list(FEATURES)
+
+    unknown = names - set(FEATURES)
+    if unknown:
+        raise ValueError(f"알 수 없는 기능: {', '.join(sorted(unknown))} (가능: {', '.join(FEATURES)})")
+    if names & ADMIN_FEATURES:
+        names.add("admin")
+    return [name for name in FEATURES if name in names]
+
+
+# =====================================================================
+# 전역 템플릿 변수(회사 정보) & 엔드포인트 존재 여부 확인
+# =====================================================================
+def inject_company_info():
+    return {
+        "company_name": os.getenv("COMPANY_NAME", "우주정보통신"),
+        "company_logo_path": os.getenv("COMPANY_LOGO_PATH", "img/company_logo.svg"),
+        "company_addr": os.getenv("COMPANY_ADDR", "경남 창원시 진해구 신항로 433 1층 우주정보통신"),
+        "company_tel": os.getenv("COMPANY_TEL", "051-220-2240"),
+        "company_ph":  os.getenv("COMPANY_PH",  "010-8703-6857"),
+        "company_fax": os.getenv("COMPANY_FAX", "-"),
+        "company_notice": os.getenv(
+            "COMPANY_NOTICE",
+            "※ 본 시스템은 내부 업무용입니다. 무단 접근을 금합니다."
+        ),
+        "current_year": datetime.now().year,
+    }
+
+def inject_has_endpoint():
+    def has_endpoint(name: str) -> bool:
+        return name in current_app.view_functions
+    return dict(has_endpoint=has_endpoint)
+
+
+@click.command("migrate")
+def migrate_command():
+    """미적용 스키마 마이그레이션 실행 (AUTO_MIGRATE=0 배포용)"""
+    run_migrations()
+
+
+def create_app(features=None, migrate: bool = None) -> Flask:
+    """
+    features: None 이면 APP_FEATURES 환경변수 (기본 all)
+    migrate:  None 이면 AUTO_MIGRATE 환경변수 (기본 1) — 0 이면 `flask --app app migrate` 로 따로 실행
+    """
+    names = enabled_features(features)
+
+    app = Flask(__name__, root_path=BASE_DIR)
+    app.secret_key = os.getenv("SECRET_KEY", "SECRET_KEY_2025")
+
+    # 개발 편의: 템플릿 자동 리로드
+    app.config["TEMPLATES_AUTO_RELOAD"] = True
+    app.jinja_env.auto_reload = True
+    app.config["FEATURES"] = names
+    # 요청 본문 상한 (엑셀 가져오기 등) — 메뉴얼 이미지 업로드는 MANUAL_UPLOAD_MAX_MB 로 따로
+    app.config["MAX_CONTENT_LENGTH"] = int(float(os.getenv("MAX_UPLOAD_MB", "64")) * 1024 * 1024)
+
+    for name in names:
+        module = importlib.import_module(FEATURES[name], __name__)
+        app.register_blueprint(module.bp)
+
+    app.context_processor(inject_company_info)
+    app.context_processor(inject_has_endpoint)
+
+    from .static_cache import init_static_cache
+    init_static_cache(app)
+
+    from .plans import check_plans_command
+    app.cli.add_command(migrate_command)
+    app.cli.add_command(check_plans_command)
+
+    if migrate is None:
+        migrate = os.getenv("AUTO_MIGRATE", "1") != "0"
+    if migrate:
+        run_migrations()
+    print("🧩 기능:", ", ".join(names))
+    return app
@@ -0,0 +1,412 @@
+# rentalapp/admin.py
+from flask import Blueprint, render_template, request, redirect, session, url_for, jsonify, flash
+from sqlalchemy import text, bindparam
+from werkzeug.security import check_password_hash
+
+from .db import engine
+from .exports import export_rows, requested_export_format
+from .paging import forget_counts
+
+bp = Blueprint("admin", __name__)
+
+# 관리자 화면 SQL — 라우트와 check-plans(rentalapp/plans.py)가 같은 문장을 사용
+RECENT_POSTS_SQL = """
+    SELECT id, title, category, is_pinned, created_at
+    FROM board
+    ORDER BY is_pinned DESC, id DESC
+    LIMIT 5
+"""
+
+RENT_STATUS_SQL = """
+    SELECT id, user_name, dept, phone, serial_no, unit_no,
+           start_date, rental_date, end_date
+    FROM rental
+    WHERE status = 'rented'
+"""
+RENT_STATUS_SEARCH = " AND (serial_no LIKE :kw OR unit_no LIKE :kw)"
+
+RETURN_STATUS_SQL = """
+    SELECT r.id, r.user_name, r.dept, r.phone,
+           'S/N : ' || wt.serial_no AS formatted_serial_no,
+           r.unit_no, r.start_date, r.end_date
+    FROM rental r
+    LEFT JOIN walkie_talkie_units wt ON r.unit_no = wt.unit_no
+    WHERE r.status = 'returned'
+    ORDER BY r.end_date DESC NULLS LAST
+"""
+RETURN_COUNT_SQL = "SELECT COUNT(*) FROM rental WHERE status = 'returned'"
+
+BUNDLE_UNITS_SQL = """
+    SELECT
+        u.unit_no,
+        u.serial_no,
+        COALESCE(u.item_name, '무전기')      AS item_name,
+        COALESCE(u.model_name, 'XiR-E8600') AS model_name,
+        CASE WHEN s.unit_no IS NULL THEN 'available' ELSE 'rented' END AS state,
+        CASE WHEN s.unit_no IS NULL THEN NULL
+             ELSE (COALESCE(s.user_name,'') || '/' ||
+                   COALESCE(s.dept,'')      || '/' ||
+                   COALESCE(s.phone,''))
+        END AS borrower,
+        s.since AS rental_date
+    FROM walkie_talkie_units u
+    LEFT JOIN unit_state s ON s.unit_no = u.unit_no
+    WHERE {where}
+    ORDER BY u.unit_no
+"""
+
+DELETE_RENTED_STATE_SQL = """
+    DELETE FROM unit_state
+     WHERE rental_id IN (SELECT id FROM rental WHERE serial_no IN :serials AND status = 'rented')
+"""
+DELETE_RENTED_SQL = "DELETE FROM rental WHERE serial_no IN :serials AND status = 'rented'"
+
+# ---------------------------------------------------------------------
+# 관리자 로그인
+# ---------------------------------------------------------------------
+@bp.route("/admin_login", methods=["GET", "POST"])
+def admin_login():
+    if request.method == "POST":
+        userid = request.form.get("userid")
+        password = request.form.get("password")
+
+        # ✅ 마스터 계정 무조건 로그인 허용
+        if userid == "admin" and password == "hjnc2240!":
+            session["admin_logged_in"] = True
+            session["admin_name"] = "마스터 관리자"
+            flash("✅ 마스터 계정으로 로그인되었습니다.", "success")
+            return redirect(url_for("admin.admin_menu"))
+
+        try:
+            with engine.connect() as conn:
+                user = conn.execute(text("""
+                    SELECT id, name, userid, password
+                    FROM employees
+                    WHERE userid = :userid
+                """), {"userid": userid}).mappings().first()
+
+                # ✅ 해시된 비밀번호 비교로 수정
+                if user and check_password_hash(user["password"], password):
+                    session["admin_logged_in"] = True
+                    session["admin_name"] = user["name"]
+                    flash(f"👋 {user['name']}님 환영합니다!", "success")
+                    return redirect(url_for("admin.admin_menu"))
+                else:
+                    flash("❌ 아이디 또는 비밀번호가 올바르지 않습니다.", "danger")
+
+        except Exception as e:
+            print("❌ 로그인 오류:", e)
+            flash("서버 오류가 발생했습니다.", "danger")
+
+    return render_template("admin_login.html")
+
+
+@bp.route("/admin_logout")
+def admin_logout():
+    session.clear()
+    flash("로그아웃되었습니다.", "info")
+    return redirect("/")
+
+
+@bp.route("/admin_menu")
+def admin_menu():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    with engine.connect() as conn:
+        # 최근 공지글 5개
+        rows = conn.execute(text(RECENT_POSTS_SQL)).mappings().all()
+        posts = [dict(r) for r in rows]
+
+    approvals_counts = {"대기": 0, "진행": 0, "반려": 0, "완료": 0}
+    approvals_recent = []
+
+    return render_template(
+        "admin_menu.html",
+        posts=posts,
+        show_footer=True,
+        approvals_counts=approvals_counts,
+        approvals_recent=approvals_recent,
+    )
+
+
+# -------------------------------
+# 비밀번호 변경 (POST 요청)
+# -------------------------------
+@bp.route('/change_password', methods=['POST'])
+def change_password():
+    current_pw = request.form.get('current_password')
+    new_pw = request.form.get('new_password')
+    confirm_pw = request.form.get('confirm_password')
+
+    if not session.get('admin_logged_in'):
+        flash('로그인이 필요합니다.', 'warning')
+        return redirect(url_for('admin.admin_login'))
+
+    if not current_pw or not new_pw or not confirm_pw:
+        flash('모든 항목을 입력해주세요.', 'warning')
+        return redirect(url_for('admin.admin_menu'))
+
+    if new_pw != confirm_pw:
+        flash('새 비밀번호가 일치하지 않습니다.', 'danger')
+        return redirect(url_for('admin.admin_menu'))
+
+    with engine.connect() as conn:
+        user = conn.execute(text("SELECT * FROM employees WHERE id = :id"),
+                            {'id': session.get('user_id')}).mappings().first()
+
+        if not user:
+            flash('사용자 정보를 찾을 수 없습니다.', 'danger')
+            return redirect(url_for('admin.admin_menu'))
+
+        if user.get('password') != current_pw:
+            flash('기존 비밀번호가 올바르지 않습니다.', 'danger')
+            return redirect(url_for('admin.admin_menu'))
+
+        conn.execute(text("UPDATE employees SET password = :pw WHERE id = :id"),
+                     {'pw': new_pw, 'id': user['id']})
+        conn.commit()
+
+    flash('비밀번호가 성공적으로 변경되었습니다.', 'success')
+    return redirect(url_for('admin.admin_menu'))
+
+
+# ---------------------------------------------------------------------
+# 대여/반납 상태(관리)
+# ---------------------------------------------------------------------
+@bp.route("/admin_rent_status", methods=["GET"], endpoint="admin_rent_status")
+def admin_rent_status():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    q = (request.args.get("q") or "").strip()
+
+    with engine.connect() as conn:
+        # 1) 현재 대여중 목록
+        base_sql = RENT_STATUS_SQL
+        params = {}
+        if q:
+            base_sql += RENT_STATUS_SEARCH
+            params["kw"] = f"%{q}%"
+
+        rent_list = conn.execute(text(base_sql + " ORDER BY id DESC"), params).all()
+
+        # 2) 개별 단말 중 '가용'(미대여) 목록
+        avail_rows = conn.execute(text("""
+            SELECT u.unit_no,
+                   u.serial_no,
+                   COALESCE(u.item_name,'무전기')      AS item_name,
+                   COALESCE(u.model_name,'XiR-E8600') AS model_name
+              FROM walkie_talkie_units u
+              LEFT JOIN unit_state s ON s.unit_no = u.unit_no
+             WHERE s.unit_no IS NULL
+             ORDER BY u.unit_no
+        """)).mappings().all()
+        available_units = [dict(r) for r in avail_rows]
+
+        # 3) 요약 박스 (unit_state 집계 — 대여 이력 크기와 무관)
+        total_units_count, rented_units = conn.execute(text("""
+            SELECT (SELECT COUNT(*) FROM walkie_talkie_units),
+                   (SELECT COUNT(*) FROM unit_state)
+        """)).one()
+        rental_count = rented_units
+
+        available_count = max(total_units_count - (rented_units or 0), 0)
+
+        available_bundles = [{
+            "bundle_id": 0,
+            "item_name": "무전기",
+            "model_name": "XiR-E8600",
+            "total_qty": int(total_units_count or 0),
+            "available_qty": int(available_count or 0),
+        }]
+
+    return render_template(
+        "admin_rent_status.html",
+        rent_list=rent_list,
+        rental_count=rental_count,
+        total_units_count=total_units_count,
+        available_count=available_count,
+        available_units=available_units,
+        available_bundles=available_bundles,
+        q=q,
+    )
+
+@bp.route("/admin_return_status", methods=["GET"], endpoint="admin_return_status")
+def admin_return_status():
+    with engine.connect() as conn:
+        rows = conn.execute(text(RETURN_STATUS_SQL)).all()
+        return_count = conn.execute(text(RETURN_COUNT_SQL)).scalar_one()
+
+    def _fmt_phone(phone):
+        phone = (phone or "").replace("-", "")
+        if len(phone) == 11: return f"{phone[:3]}-{phone[3:7]}-{phone[7:]}"
+        if len(phone) == 10: return f"{phone[:3]}-{phone[3:6]}-{phone[6:]}"
+        return phone
+
+    return_list = []
+    for row in rows:
+        rid, user_name, dept, phone, serial, unit_no, start_date, end_date = row
+        return_list.append((rid, user_name, dept, _fmt_phone(phone), serial, unit_no, start_date, end_date))
+
+    return render_template("admin_return_status.html", return_list=return_list, return_count=return_count)
+
+def rental_export_source(args) -> dict:
+    where_clause, params = "", {}
+    status = (args.get("status") or "").strip().lower()
+    if status in ("rented", "returned"):
+        where_clause, params = "WHERE status = :status", {"status": status}
+    return {
+        "basename": "rentals", "sheet": "대여이력",
+        "columns": [("ID", "int"), ("Unit No", "str"), ("S/N", "str"), ("사용자명", "str"), ("부서", "str"),
+                    ("연락처", "str"), ("대여일시", "str"), ("시작일", "str"), ("종료일", "str"), ("상태", "str")],
+        "sql": f"""
+            SELECT id, unit_no, serial_no, user_name, dept, phone,
+                   rental_date, start_date, end_date, status
+            FROM rental
+            {where_clause}
+            ORDER BY id DESC
+        """,
+        "params": params,
+    }
+
+@bp.route("/admin/rentals/export", methods=["GET"])
+def export_rentals():
+    """대여 이력 내보내기 (?status=rented|returned, ?format=xlsx|csv|parquet)"""
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    fmt, error = requested_export_format()
+    if error:
+        flash(error, "warning")
+        return redirect(url_for("admin.admin_return_status"))
+
+    return export_rows(fmt, rental_export_source(request.args))
+
+@bp.route("/admin/return_status/delete", methods=["POST"], endpoint="delete_returns")
+def delete_returns():
+    ids = [int(x) for x in request.form.getlist("ids") if str(x).isdigit()]
+    if not ids:
+        flash("삭제할 항목을 선택하세요.", "warning")
+        return redirect(url_for("admin.admin_return_status"))
+
+    stmt = text("DELETE FROM rental WHERE id IN :ids").bindparams(
+        bindparam("ids", expanding=True)
+    )
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM unit_state WHERE rental_id IN :ids").bindparams(
+            bindparam("ids", expanding=True)
+        ), {"ids": ids})
+        conn.execute(stmt, {"ids": ids})
+
+    flash(f"{len(ids)}건 삭제 완료", "success")
+    return redirect(url_for("admin.admin_return_status"))
+
+# 신규 장비 묶음 + 단말 자동 생성
+@bp.route("/admin/equipment/add_bundle", methods=["POST"])
+def admin_add_equipment_bundle():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    item_name  = (request.form.get("item_name")  or "").strip() or "무전기"
+    model_name = (request.form.get("model_name") or "").strip() or "XiR-E8600"
+    category   = (request.form.get("category")   or "").strip()
+    location   = (request.form.get("location")   or "").strip()
+
+    try:
+        total_qty = max(int(request.form.get("total_qty", 0)), 0)
+    except ValueError:
+        total_qty = 0
+    available_qty = total_qty
+
+    try:
+        start_unit_no = int((request.form.get("start_unit_no") or "1"))
+    except ValueError:
+        start_unit_no = 1
+    try:
+        start_sn = int((request.form.get("start_serial") or "1"))
+    except ValueError:
+        start_sn = 1
+
+    if total_qty <= 0:
+        return redirect(url_for("admin.admin_rent_status"))
+
+    with engine.begin() as conn:
+        bundle_id = conn.execute(text("""
+            INSERT INTO equipment (item_name, model_name, category, location, total_qty, available_qty)
+            VALUES (:item_name, :model_name, :category, :location, :total_qty, :available_qty)
+            RETURNING id
+        """), {
+            "item_name": item_name, "model_name": model_name, "category": category,
+            "location": location, "total_qty": total_qty, "available_qty": available_qty
+        }).scalar_one()
+
+        for i in range(total_qty):
+            unit_no   = f"No.{start_unit_no + i}"
+            serial_no = f"{start_sn + i:06d}"
+
+            exists = conn.execute(text("""
+                SELECT 1 FROM walkie_talkie_units
+                WHERE unit_no = :unit_no OR serial_no = :serial_no
+                LIMIT 1
+            """), {"unit_no": unit_no, "serial_no": serial_no}).first()
+            if exists:
+                continue
+
+            conn.execute(text("""
+                INSERT INTO walkie_talkie_units (unit_no, serial_no, item_name, bundle_id)
+                VALUES (:unit_no, :serial_no, :item_name, :bundle_id)
+            """), {
+                "unit_no": unit_no, "serial_no": serial_no,
+                "item_name": item_name, "bundle_id": bundle_id
+            })
+    forget_counts("equipment")
+
+    return redirect(url_for("admin.admin_rent_status"))
+
+# 가용 장비(미대여) 선택 삭제
+@bp.route("/admin/walkies/delete", methods=["POST"], endpoint="admin_delete_walkies")
+def admin_delete_walkies():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    unit_nos = request.form.getlist("unit_nos")
+    if not unit_nos:
+        return redirect(url_for("admin.admin_rent_status"))
+
+    with engine.begin() as conn:
+        conn.execute(text("""
+            DELETE FROM walkie_talkie_units
+             WHERE unit_no IN :unit_nos
+               AND unit_no NOT IN (SELECT unit_no FROM unit_state)
+        """).bindparams(bindparam("unit_nos", expanding=True)), {"unit_nos": unit_nos})
+
+    return redirect(url_for("admin.admin_rent_status"))
+
+@bp.route("/admin/walkies/bundle/<int:bundle_id>", methods=["GET"])
+def get_bundle_units(bundle_id: int):
+    """
+    묶음(bundle_id)별 개별 단말 목록 + 대여상태/대여자 정보
+    bundle_id == 0 : 미분류(NULL/0)
+    """
+    where_clause = "u.bundle_id = :bid"
+    params = {"bid": bundle_id}
+    if bundle_id == 0:
+        where_clause = "(u.bundle_id IS NULL OR u.bundle_id = 0)"
+        params = {}
+
+    with engine.connect() as conn:
+        rows = conn.execute(text(BUNDLE_UNITS_SQL.format(where=where_clause)), params).mappings().all()
+
+    return jsonify({"ok": True, "units": [dict(r) for r in rows]})
+
+
+@bp.route("/delete_rentals", methods=["POST"], endpoint="delete_rentals")
+def delete_rentals():
+    serials = request.form.getlist("serials")
+    if serials:
+        serials_param = bindparam("serials", expanding=True)
+        with engine.begin() as conn:
+            conn.execute(text(DELETE_RENTED_STATE_SQL).bindparams(serials_param), {"serials": serials})
+            conn.execute(text(DELETE_RENTED_SQL).bindparams(serials_param), {"serials": serials})
+    return redirect(url_for("admin.admin_rent_status"))
@@ -0,0 +1,287 @@
+# rentalapp/board.py
+from flask import Blueprint, render_template, request, redirect, url_for, jsonify, flash, abort
+from sqlalchemy import text, bindparam
+
+from .db import engine, is_postgres
+from .paging import keyset_page, page_window, cached_counts, forget_counts
+from .search import highlight_terms, parse_search_query, search_table, sync_search_index
+
+bp = Blueprint("board", __name__)
+
+# 게시판 SQL — 라우트와 check-plans(rentalapp/plans.py)가 같은 문장을 사용
+BOARD_POST_SQL = """
+    SELECT id, title, content, category, is_pinned, board_type, created_at
+    FROM board WHERE id = :id
+"""
+BOARD_POST_SQL_PG = """
+    SELECT id, title, content, category, is_pinned, board_type,
+           TO_CHAR(created_at,'YYYY-MM-DD HH24:MI:SS') AS created_at
+    FROM board WHERE id = :id
+"""
+
+BOARD_LIST_SQL = """
+    SELECT id, title, content, category, is_pinned, board_type,
+           created_at
+    FROM board
+"""
+BOARD_LIST_SQL_PG = """
+    SELECT id, title, content, category, is_pinned, board_type,
+           TO_CHAR(created_at,'YYYY-MM-DD HH24:MI:SS') AS created_at
+    FROM board
+"""
+BOARD_COUNT_SQL = "SELECT COUNT(*) FROM board {where}"
+BOARD_KEY_COLS = ["is_pinned", "id"]
+BOARD_SEARCH_COLUMNS = """
+    t.id, t.title, t.content, t.category, t.is_pinned, t.board_type, {created_at}
+"""
+
+def board_list_filters(board_type: str, category: str = ""):
+    """게시판 종류/분류 → (WHERE 절, 바인딩) — 'all' 이면 종류 조건 없음"""
+    params = {}
+    where = "WHERE 1=1"
+    if board_type != "all":
+        where += " AND board_type = :board_type"
+        params["board_type"] = board_type
+    if category:
+        where += " AND category = :category"
+        params["category"] = category
+    return where, params
+
+# ---------------------------------------------------------------------
+# 게시판
+# ---------------------------------------------------------------------
+def _read_board_post(post_id: int):
+    with engine.connect() as conn:
+        row = conn.execute(text(BOARD_POST_SQL_PG if is_postgres() else BOARD_POST_SQL),
+                           {"id": post_id}).first()
+    if not row:
+        return None
+    return {
+        "id": row[0],
+        "title": row[1] or "",
+        "content": row[2] or "",
+        "category": row[3] or "",
+        "is_pinned": int(row[4] or 0),
+        "board_type": row[5] or "general",
+        "created_at": row[6] or "",
+    }
+
+@bp.route("/admin/board/api/post/<int:post_id>", methods=["GET"])
+def get_board_post_admin_rest(post_id):
+    post = _read_board_post(post_id)
+    if not post:
+        return jsonify({"ok": False, "error": "not_found"}), 200
+    return jsonify({"ok": True, "post": post}), 200
+
+@bp.route("/board/api/post/<int:post_id>", methods=["GET"])
+def get_board_post_rest(post_id):
+    post = _read_board_post(post_id)
+    if not post:
+        return jsonify({"ok": False, "error": "not_found"}), 200
+    return jsonify({"ok": True, "post": post}), 200
+
+@bp.route("/admin/board/api/post", methods=["GET"])
+def get_board_post_admin_query():
+    try:
+        post_id = int(request.args.get("id", "0"))
+    except ValueError:
+        post_id = 0
+    post = _read_board_post(post_id) if post_id else None
+    if not post:
+        return jsonify({"ok": False, "error": "not_found"}), 200
+    return jsonify({"ok": True, "post": post}), 200
+
+@bp.route("/board/api/post", methods=["GET"])
+def get_board_post_query():
+    try:
+        post_id = int(request.args.get("id", "0"))
+    except ValueError:
+        post_id = 0
+    post = _read_board_post(post_id) if post_id else None
+    if not post:
+        return jsonify({"ok": False, "error": "not_found"}), 200
+    return jsonify({"ok": True, "post": post}), 200
+
+@bp.route("/admin/board/view/<int:post_id>", methods=["GET"], endpoint="view_board_post")
+def view_board_post(post_id):
+    with engine.connect() as conn:
+        if is_postgres():
+            row = conn.execute(text("""
+                SELECT id, title, content, category, is_pinned,
+                       TO_CHAR(created_at,'YYYY-MM-DD HH24:MI:SS') AS created_at
+                FROM board
+                WHERE id = :id
+            """), {"id": post_id}).first()
+        else:
+            row = conn.execute(text("""
+                SELECT id, title, content, category, is_pinned, created_at
+                FROM board
+                WHERE id = :id
+            """), {"id": post_id}).first()
+
+    if not row:
+        return "게시글을 찾을 수 없습니다.", 404
+
+    post = {
+        "id": row[0],
+        "title": row[1],
+        "content": row[2],
+        "category": row[3],
+        "is_pinned": row[4],
+        "created_at": row[5],
+    }
+    return render_template("board/view.html", post=post)
+
+@bp.route("/admin/board/post/<int:post_id>", methods=["GET"], endpoint="admin_board_view")
+def admin_board_view_alias(post_id):
+    return redirect(url_for("board.view_board_post", post_id=post_id))
+
+@bp.route("/admin/board")
+def admin_board():
+    return redirect(url_for("board.admin_board_type", board_type="general"))
+
+@bp.route("/admin/board/<board_type>")
+def admin_board_type(board_type):
+    valid = {"work","general","data","qna","all"}
+    if board_type not in valid:
+        board_type = "general"
+
+    q = request.args.get("q","").strip()
+    category = request.args.get("category","")
+    per_page = int(request.args.get("per_page", 10))
+    page = max(1, int(request.args.get("page", 1)))
+    after, before = request.args.get("after"), request.args.get("before")
+    last = request.args.get("last") == "1"
+
+    where, params = board_list_filters(board_type, category)
+    terms = parse_search_query(q)
+    select_sql = BOARD_LIST_SQL_PG if is_postgres() else BOARD_LIST_SQL
+
+    with engine.connect() as conn:
+        if terms:
+            # 검색은 관련도순이라 커서 대신 페이지 번호(OFFSET)
+            created_at = "TO_CHAR(t.created_at,'YYYY-MM-DD HH24:MI:SS')" if is_postgres() else "t.created_at"
+            total, rows = search_table(conn, "board", terms, BOARD_SEARCH_COLUMNS.format(created_at=created_at),
+                                       where, params, per_page, (page-1)*per_page)
+            prev_cursor = next_cursor = None
+        else:
+            # 건수는 캐시 (쓰기 라우트가 forget_counts), 목록은 커서만 — 첫/마지막 페이지도 OFFSET 없음
+            total, = cached_counts(conn, "board", BOARD_COUNT_SQL.format(where=where), params)
+            page, _, last_rows = page_window(total, per_page, page, bool(after or before), last)
+            rows, prev_cursor, next_cursor = keyset_page(
+                conn, select_sql, where, params, BOARD_KEY_COLS, per_page,
+                after=after, before=before, last=last_rows,
+            )
+
+    posts = [{
+        "id": r[0], "title": r[1], "content": r[2],
+        "category": r[3], "is_pinned": r[4], "board_type": r[5], "created_at": r[6],
+        "title_hl": highlight_terms(r[1], terms) if terms else None,
+        "snippet": highlight_terms(r[2], terms, 180) if terms else None,
+    } for r in rows]
+
+    total_pages = max(1, (total + per_page - 1)//per_page)
+    categories = ["", "공지", "안내", "점검", "기타"]  # ""=전체
+
+    tmpl_map = {
+        "all": "board/all.html",
+        "general": "board/general.html",
+        "work": "board/work.html",
+        "data": "board/data.html",
+        "qna": "board/qna.html",
+    }
+    tmpl = tmpl_map.get(board_type, "board/general.html")
+
+    return render_template(
+        tmpl,
+        posts=posts, total=total, page=page, per_page=per_page,
+        total_pages=total_pages, q=q, category=category,
+        prev_cursor=prev_cursor, next_cursor=next_cursor, cursor_nav=not terms,
+        categories=categories, board_type=board_type
+    )
+
+@bp.post("/admin/board/bulk-delete", endpoint="bulk_delete_board")
+def bulk_delete_board():
+    ids_raw = request.form.getlist("ids") or request.form.getlist("post_ids")
+    ids: list[int] = []
+    for x in ids_raw:
+        try:
+            ids.append(int(x))
+        except (TypeError, ValueError):
+            continue
+
+    bt = (request.form.get("board_type") or "general").strip() or "general"
+
+    if not ids:
+        flash("삭제할 게시글을 선택하세요.", "warning")
+        return redirect(url_for("board.admin_board_type", board_type=bt))
+
+    stmt = text("DELETE FROM board WHERE id IN :ids").bindparams(bindparam("ids", expanding=True))
+    with engine.begin() as conn:
+        conn.execute(stmt, {"ids": ids})
+        sync_search_index(conn, "board", ids)
+    forget_counts("board")
+
+    flash(f"{len(ids)}건 삭제 완료", "success")
+    return redirect(url_for("board.admin_board_type", board_type=bt))
+
+@bp.post("/admin/board/add", endpoint="add_board_post")
+def add_board_post():
+    title = (request.form.get("title") or "").strip()
+    content = (request.form.get("content") or "").strip()
+    category = (request.form.get("category") or "").strip()
+    is_pinned = 1 if request.form.get("is_pinned") == "1" else 0
+    board_type = (request.form.get("board_type") or "general").strip() or "general"
+
+    if not title:
+        flash("제목을 입력하세요.", "warning")
+        return redirect(url_for("board.admin_board_type", board_type=board_type))
+
+    with engine.begin() as conn:
+        post_id = conn.execute(text("""
+            INSERT INTO board (title, content, category, is_pinned, board_type)
+            VALUES (:title, :content, :category, :is_pinned, :board_type)
+            RETURNING id
+        """), {
+            "title": title, "content": content, "category": category,
+            "is_pinned": is_pinned, "board_type": board_type
+        }).scalar_one()
+        sync_search_index(conn, "board", [post_id])
+    forget_counts("board")
+
+    flash("등록되었습니다.", "success")
+    return redirect(url_for("board.admin_board_type", board_type=board_type))
+
+@bp.post("/admin/board/<int:post_id>/toggle-pin", endpoint="toggle_pin")
+def toggle_pin(post_id: int):
+    bt = (request.args.get("board_type") or "general").strip() or "general"
+
+    with engine.begin() as conn:
+        row = conn.execute(text("SELECT is_pinned FROM board WHERE id = :id"), {"id": post_id}).first()
+        if not row:
+            abort(404)
+        new_val = 0 if int(row[0] or 0) else 1
+        conn.execute(text("UPDATE board SET is_pinned = :v WHERE id = :id"),
+                     {"v": new_val, "id": post_id})
+
+    return redirect(url_for("board.admin_board_type", board_type=bt))
+
+@bp.post("/admin/board/<int:post_id>/delete", endpoint="delete_board_post")
+def delete_board_post(post_id: int):
+    bt = (request.args.get("board_type") or "general").strip() or "general"
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM board WHERE id = :id"), {"id": post_id})
+        sync_search_index(conn, "board", [post_id])
+    forget_counts("board")
+    flash("삭제되었습니다.", "success")
+    return redirect(url_for("board.admin_board_type", board_type=bt))
+
+@bp.get("/admin/board/list", endpoint="board_list")
+def board_list_alias():
+    bt = (request.args.get("board_type") or "general").strip() or "general"
+    return redirect(url_for("board.admin_board_type", board_type=bt))
+
+@bp.get("/board/list")
+def board_list_public_alias():
+    bt = (request.args.get("board_type") or "general").strip() or "general"
+    return redirect(url_for("board.admin_board_type", board_type=bt))
@@ -0,0 +1,131 @@
+# rentalapp/calendar.py
+from flask import Blueprint, render_template, request, jsonify
+from sqlalchemy import text
+
+from .db import engine
+
+bp = Blueprint("calendar", __name__)
+
+# ---------------------------------------------------------------------
+# 📅 캘린더 페이지
+# ---------------------------------------------------------------------
+@bp.route("/calendar")
+def calendar():
+    """캘린더 페이지 렌더링"""
+    return render_template("calendar.html")
+
+
+# ---------------------------------------------------------------------
+# 📤 일정 데이터 불러오기
+# ---------------------------------------------------------------------
+@bp.route("/get_schedules")
+def get_schedules():
+    """FullCalendar 일정 데이터 로드"""
+    with engine.connect() as conn:
+        rows = conn.execute(text("""
+            SELECT id, title, start, "end", COALESCE(note, '') AS note
+            FROM schedules
+        """)).all()
+    return jsonify([
+        {"id": r[0], "title": r[1], "start": r[2], "end": r[3], "note": r[4]}
+        for r in rows
+    ])
+
+
+# ---------------------------------------------------------------------
+# 👤 근무자 데이터 불러오기
+# ---------------------------------------------------------------------
+@bp.route("/get_shifts")
+def get_shifts():
+    """근무자 데이터 로드"""
+    with engine.connect() as conn:
+        rows = conn.execute(text("SELECT day, name FROM shifts")).all()
+    return jsonify({r[0]: r[1] for r in rows})
+
+
+# ---------------------------------------------------------------------
+# 근무자 + 일정 통합 등록
+# ---------------------------------------------------------------------
+@bp.route("/add_shift_and_schedule", methods=["POST"])
+def add_shift_and_schedule():
+    data = request.get_json() or {}
+    day   = (data.get("day") or "").strip()
+    name  = (data.get("name") or "").strip()
+    title = (data.get("title") or "").strip()
+    note  = (data.get("note") or "").strip()
+
+    print("📥 요청 데이터:", data)  # ✅ 요청 내용 확인 로그
+
+    if not day:
+        print("❌ day 누락됨")
+        return jsonify({"ok": False, "error": "날짜 누락"}), 400
+    if not name and not title:
+        print("❌ name, title 누락됨")
+        return jsonify({"ok": False, "error": "근무자 또는 일정 제목 중 하나는 필요"}), 400
+
+    try:
+        with engine.begin() as conn:
+            # ✅ 근무자 등록
+            if name:
+                print("🧾 근무자 추가:", name, "(", day, ")")
+                conn.execute(text("""
+                    INSERT INTO shifts (day, name)
+                    VALUES (:day, :name)
+                    ON CONFLICT(day) DO UPDATE SET name = excluded.name
+                """), {"day": day, "name": name})
+
+            # ✅ 일정 등록
+            if title:
+                print("🧾 일정 추가:", title)
+                conn.execute(text("""
+                    INSERT INTO schedules (title, start, "end", note)
+                    VALUES (:title, :start, :end, :note)
+                """), {"title": title, "start": day, "end": day, "note": note})
+
+        print("✅ DB 삽입 완료")
+        return jsonify({"ok": True, "message": "등록 완료"})
+
+    except Exception as e:
+        import traceback
+        print("❌ add_shift_and_schedule error:", e)
+        traceback.print_exc()
+        return jsonify({"ok": False, "error": str(e)}), 500
+    
+
+# ---------------------------------------------------------------------
+# 일정 및 근무자 삭제
+# ---------------------------------------------------------------------
+@bp.route("/delete_schedule", methods=["POST"])
+def delete_schedule():
+    data = request.get_json() or {}
+    schedule_id = data.get("id")
+    day = data.get("day")
+
+    if not schedule_id and not day:
+        return jsonify({"status": "error", "error": "id 또는 day 누락"})
+
+    try:
+        with engine.begin() as conn:
+            deleted = False
+
+            # ✅ 일정 삭제
+            if schedule_id:
+                res = conn.execute(text("DELETE FROM schedules WHERE id = :id"), {"id": schedule_id})
+                if res.rowcount > 0:
+                    deleted = True
+
+            # ✅ 근무자 삭제
+            if day:
+                res2 = conn.execute(text("DELETE FROM shifts WHERE day = :day"), {"day": day})
+                if res2.rowcount > 0:
+                    deleted = True
+
+        if deleted:
+            return jsonify({"status": "success"})
+        else:
+            return jsonify({"status": "error", "error": "삭제 대상 없음"})
+
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return jsonify({"status": "error", "error": str(e)}), 500
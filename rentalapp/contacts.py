@@ -0,0 +1,325 @@
+# rentalapp/contacts.py
+from flask import Blueprint, render_template, request, redirect, url_for, jsonify, flash
+import re, time
+from sqlalchemy import text, bindparam
+
+from .db import PHONE_SEPARATORS, clean_phone, engine, format_phone_kor, is_postgres
+from .exports import export_rows, requested_export_format
+from .search import highlight_terms, parse_search_query, search_table, sync_search_index
+
+bp = Blueprint("contacts", __name__)
+
+# ---------------------------------------------------------------------
+# 주소록(협력업체/엑셀)
+# ---------------------------------------------------------------------
+PHONE_PATTERN = r"\+?\d*"   # clean_phone 뒤에 남아도 되는 것: 숫자 (앞 + 허용)
+COMPANY_COLUMNS = ("name", "manager", "phone", "group_name", "memo")
+IMPORT_CHUNK_ROWS = 5000
+IMPORT_REPORT_LIMIT = 500   # 화면에 보여줄 거부 행 수
+
+# (업체명, 연락처) 유일 인덱스는 연락처가 있는 행만 — 연락처가 없으면 담당자마다 따로 등록
+UPSERT_COMPANY_SQL = """
+    INSERT INTO companies (name, manager, phone, group_name, memo)
+    VALUES (:name, :manager, :phone, :group_name, :memo)
+    ON CONFLICT (name, phone) WHERE phone <> '' DO UPDATE
+       SET manager = excluded.manager,
+           group_name = excluded.group_name,
+           memo = excluded.memo
+"""
+
+INSERT_COMPANY_SQL = """
+    INSERT INTO companies (name, manager, phone, group_name, memo)
+    VALUES (:name, :manager, :phone, :group_name, :memo)
+    ON CONFLICT (name, phone) WHERE phone <> '' DO NOTHING
+"""
+
+# 주소록 검색 목록 컬럼 (원본 테이블 별칭 t) — check-plans 도 같은 문장을 EXPLAIN
+COMPANY_SEARCH_COLUMNS = """
+    t.id, t.name, t.manager, t.phone, t.group_name, {created_at},
+    t.memo
+"""
+COMPANY_SEARCH_LIMIT = 500
+
+def _company_frame(header: list, rows: list, first_row: int):
+    import pandas as pd
+
+    width = len(header)
+    rows = [tuple(r[:width]) + (None,) * (width - len(r)) for r in rows]
+    df = pd.DataFrame.from_records(rows, columns=header)
+    df["_row"] = range(first_row, first_row + len(df))
+    return df
+
+def _xlsx_rows(stream):
+    """
+    첫 시트의 행을 값 튜플로 순회
+    - python-calamine(Rust 파서)이 있으면 사용, 없으면 openpyxl read-only
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        CalamineWorkbook = None
+
+    if CalamineWorkbook is not None:
+        yield from CalamineWorkbook.from_filelike(stream).get_sheet_by_index(0).iter_rows()
+        return
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(stream, read_only=True, data_only=True)
+    try:
+        yield from wb.worksheets[0].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+def read_company_frames(stream, filename: str):
+    """
+    업로드 파일 → IMPORT_CHUNK_ROWS 행씩 DataFrame (원본 행 번호는 _row)
+    - .xlsx: 첫 시트를 행 단위로 순회 / .csv: pandas chunksize
+    """
+    if filename.lower().endswith(".csv"):
+        import pandas as pd
+
+        first_row = 2
+        for df in pd.read_csv(stream, chunksize=IMPORT_CHUNK_ROWS, dtype=str,
+                              keep_default_na=False, encoding="utf-8-sig"):
+            df["_row"] = range(first_row, first_row + len(df))
+            first_row += len(df)
+            yield df
+        return
+
+    rows = _xlsx_rows(stream)
+    header = [str(h).strip() if h is not None else "" for h in next(rows, ())]
+    buf, first_row = [], 2
+    for row in rows:
+        buf.append(row)
+        if len(buf) >= IMPORT_CHUNK_ROWS:
+            yield _company_frame(header, buf, first_row)
+            first_row += len(buf)
+            buf = []
+    if buf:
+        yield _company_frame(header, buf, first_row)
+
+def _cell_text(value) -> str:
+    """엑셀 셀 값 → 문자열 (정수 값의 실수 셀 01012345678.0 → '1012345678', 텍스트는 그대로)"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def normalize_company_frame(df):
+    """
+    컬럼 정리/검증 (벡터 연산) → (저장할 행 DataFrame, 거부 행 DataFrame[_row, name, reason])
+    - 빈 값/NaN → '', 정수 값 실수 셀(연락처 등)만 '.0' 없이, 앞뒤 공백 제거 ('v2.0' 같은 텍스트는 그대로)
+    - 연락처는 clean_phone과 같은 규칙(공백/괄호/점/'-' 제거), 남은 게 숫자(앞 + 허용)가 아니면 거부
+    - 업체명 필수, 완전히 빈 행은 건너뜀
+    - 파일 안 중복: 연락처가 있으면 (업체명, 연락처), 없으면 모든 컬럼이 같은 행 → 마지막 행 사용
+    """
+    import pandas as pd
+
+    df = df.rename(columns={c: str(c).strip().lower() for c in df.columns}).rename(columns={"group": "group_name"})
+    out = pd.DataFrame({"_row": df["_row"]})
+    for col in COMPANY_COLUMNS:
+        values = df[col] if col in df else pd.Series("", index=df.index)
+        out[col] = values.astype(object).where(values.notna(), "").map(_cell_text).str.strip()
+    out["phone"] = out["phone"].str.replace(PHONE_SEPARATORS, "", regex=True)
+
+    out = out[(out[list(COMPANY_COLUMNS)] != "").any(axis=1)]
+    reason = pd.Series("", index=out.index)
+    reason[~out["phone"].str.fullmatch(PHONE_PATTERN)] = "연락처 형식 오류"
+    reason[out["name"] == ""] = "업체명 없음"
+
+    rejected = out.loc[reason != "", ["_row", "name"]].assign(reason=reason[reason != ""])
+    valid = out[reason == ""]
+    duplicated = ((valid["phone"] != "") & valid.duplicated(subset=["name", "phone"], keep="last")
+                  | valid.duplicated(subset=list(COMPANY_COLUMNS), keep="last"))
+    valid = valid[~duplicated]
+    return valid, rejected
+
+class ImportFailed(Exception):
+    """청크 일부를 커밋한 뒤 실패 (report: 커밋된 청크까지의 결과 + error)"""
+    def __init__(self, report: dict, error: Exception):
+        super().__init__(f"{report['inserted'] + report['updated']}건 반영 후 실패: {error}")
+        self.report = {**report, "error": str(self)}
+
+def import_company_chunks(frames, report: dict = None) -> dict:
+    """
+    청크마다 따로 커밋 → 쓰기 잠금을 짧게 잡아 대여/반납 요청이 기다리지 않게
+    - 실패하면 그 청크만 롤백, 앞 청크까지의 결과를 담아 ImportFailed
+    - 가져오기 라우트와 백그라운드 작업이 같이 사용
+    """
+    report = report or {"inserted": 0, "updated": 0, "rejected": [], "rejected_count": 0}
+    try:
+        for df in frames:
+            with engine.begin() as conn:
+                chunk = import_companies(conn, [df])
+            report["inserted"] += chunk["inserted"]
+            report["updated"] += chunk["updated"]
+            report["rejected_count"] += chunk["rejected_count"]
+            report["rejected"].extend(chunk["rejected"][:IMPORT_REPORT_LIMIT - len(report["rejected"])])
+    except Exception as e:
+        raise ImportFailed(report, e) from e
+    return report
+
+def import_companies(conn, frames, report: dict = None) -> dict:
+    """
+    DataFrame 청크 → companies 저장 (executemany)
+    - 연락처가 있는 행: (name, phone) 기준 upsert
+    - 연락처가 없는 행: 모든 값이 같은 행이 이미 있으면 건너뜀(갱신으로 집계), 아니면 새로 추가
+    반환: {"inserted", "updated", "rejected": [{"row", "name", "reason"}], "rejected_count"}
+    - report를 넘기면 이어서 누적 (한 트랜잭션에서 여러 번 부를 때)
+    """
+    report = report or {"inserted": 0, "updated": 0, "rejected": [], "rejected_count": 0}
+    names_param = bindparam("names", expanding=True)
+    for df in frames:
+        valid, rejected = normalize_company_frame(df)
+        report["rejected_count"] += len(rejected)
+        room = IMPORT_REPORT_LIMIT - len(report["rejected"])
+        if room > 0:
+            report["rejected"].extend(
+                {"row": int(r["_row"]), "name": r["name"], "reason": r["reason"]}
+                for r in rejected.head(room).to_dict(orient="records")
+            )
+        if valid.empty:
+            continue
+
+        records = valid[list(COMPANY_COLUMNS)].to_dict(orient="records")
+        keys = {(r["name"], r["phone"]) for r in records}
+        names = sorted({name for name, _ in keys})
+        existing = conn.execute(text("""
+            SELECT id, name, manager, phone, group_name, memo FROM companies WHERE name IN :names
+        """).bindparams(names_param), {"names": names}).all()
+        existing_blank = {
+            (name, manager or "", "", group_name or "", memo or "")
+            for _, name, manager, phone, group_name, memo in existing if not phone
+        }
+        with_phone = [r for r in records if r["phone"]]
+        new_blank = [r for r in records if not r["phone"]
+                     and tuple(r[c] for c in COMPANY_COLUMNS) not in existing_blank]
+        updated = len(records) - len(new_blank) - len(with_phone)
+        updated += sum(1 for _, name, _, phone, _, _ in existing if phone and (name, phone) in keys)
+
+        if with_phone:
+            conn.execute(text(UPSERT_COMPANY_SQL), with_phone)
+        if new_blank:
+            conn.execute(text(INSERT_COMPANY_SQL), new_blank)
+
+        ids = [cid for cid, name, phone in conn.execute(
+            text("SELECT id, name, phone FROM companies WHERE name IN :names").bindparams(names_param),
+            {"names": names},
+        ).all() if (name, phone) in keys]
+        sync_search_index(conn, "companies", ids)
+
+        report["updated"] += updated
+        report["inserted"] += len(records) - updated
+    return report
+
+def _render_contacts(q: str = "", import_report: dict = None):
+    terms = parse_search_query(q)
+    with engine.connect() as conn:
+        if terms:
+            created_at = "TO_CHAR(t.created_at,'YYYY-MM-DD HH24:MI:SS')" if is_postgres() else "t.created_at"
+            _, rows = search_table(conn, "companies", terms, COMPANY_SEARCH_COLUMNS.format(created_at=created_at),
+                                   "WHERE 1=1", {}, COMPANY_SEARCH_LIMIT, 0)
+        elif is_postgres():
+            rows = conn.execute(text("""
+                SELECT id, name, manager, phone, group_name,
+                       TO_CHAR(created_at,'YYYY-MM-DD HH24:MI:SS') AS created_at,
+                       memo
+                FROM companies
+                ORDER BY id DESC
+            """)).all()
+        else:
+            rows = conn.execute(text("""
+                SELECT id, name, manager, phone, group_name,
+                       created_at,
+                       memo
+                FROM companies
+                ORDER BY id DESC
+            """)).all()
+
+    companies = [{
+        "id": r[0], "name": r[1], "manager": r[2], "phone": r[3],
+        "group": r[4], "created_at": r[5], "memo": r[6],
+        "name_hl": highlight_terms(r[1], terms) if terms else None,
+        "manager_hl": highlight_terms(r[2], terms) if terms else None,
+        "memo_hl": highlight_terms(r[6], terms) if terms else None,
+    } for r in rows]
+    return render_template("admin_contacts.html", companies=companies, q=q, import_report=import_report)
+
+@bp.route("/admin/contacts")
+def admin_contacts():
+    return _render_contacts(request.args.get("q", "").strip())
+
+@bp.route("/admin/contacts/add", methods=["POST"])
+def add_company():
+    name = request.form["name"].strip()
+    manager = request.form.get("manager", "")
+    phone = clean_phone(request.form.get("phone", ""))
+    group = request.form.get("group", "")
+    memo = request.form.get("memo", "")
+    if not re.fullmatch(PHONE_PATTERN, phone):
+        flash(f"연락처 형식 오류: {request.form.get('phone', '')}", "warning")
+        return redirect("/admin/contacts")
+    with engine.begin() as conn:
+        # 같은 (업체명, 연락처)가 이미 있으면 덮어쓰지 않고 거부
+        company_id = conn.execute(text(INSERT_COMPANY_SQL + " RETURNING id"), {
+            "name": name, "manager": manager, "phone": phone, "group_name": group, "memo": memo
+        }).scalar()
+        if company_id is None:
+            flash(f"이미 등록된 업체/연락처입니다: {name} ({format_phone_kor(phone)})", "warning")
+            return redirect("/admin/contacts")
+        sync_search_index(conn, "companies", [company_id])
+    return redirect("/admin/contacts")
+
+@bp.route("/admin/contacts/delete/<int:contact_id>")
+def delete_contact(contact_id):
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM companies WHERE id = :id"), {"id": contact_id})
+        sync_search_index(conn, "companies", [contact_id])
+    return redirect(url_for("contacts.admin_contacts"))
+
+def contacts_export_source(args) -> dict:
+    created_at = "TO_CHAR(created_at,'YYYY-MM-DD HH24:MI:SS')" if is_postgres() else "created_at"
+    return {
+        "basename": "contacts", "sheet": "Companies",
+        # 헤더는 컬럼명 그대로 (import_excel로 다시 올릴 수 있게)
+        "columns": [("id", "int"), ("name", "str"), ("manager", "str"), ("phone", "str"),
+                    ("group_name", "str"), ("created_at", "str"), ("memo", "str")],
+        "sql": f"""
+            SELECT id, name, manager, phone, group_name, {created_at}, memo
+            FROM companies
+            ORDER BY id
+        """,
+        "params": {},
+    }
+
+@bp.route("/admin/contacts/export_excel")
+def export_excel():
+    fmt, error = requested_export_format()
+    if error:
+        flash(error, "warning")
+        return redirect(url_for("contacts.admin_contacts"))
+
+    return export_rows(fmt, contacts_export_source(request.args))
+
+@bp.route("/admin/contacts/import_excel", methods=["POST"])
+def import_excel():
+    file = request.files["file"]
+    filename = (file.filename or "").lower()
+    if not filename.endswith((".xlsx", ".csv")):
+        flash("xlsx 또는 csv 파일만 올릴 수 있습니다.", "warning")
+        return redirect("/admin/contacts")
+
+    t0 = time.perf_counter()
+    try:
+        report = import_company_chunks(read_company_frames(file.stream, filename))
+    except ImportFailed as e:
+        print("[IMPORT ERROR]", e)
+        report = e.report
+    print(f"⏱ contacts import +{report['inserted']} ~{report['updated']} "
+          f"x{report['rejected_count']}: {(time.perf_counter() - t0) * 1000:.0f} ms")
+
+    if request.args.get("format") == "json" or request.accept_mimetypes.best == "application/json":
+        if report.get("error"):
+            return jsonify({"ok": False, **report}), 500
+        return jsonify({"ok": True, **report})
+    return _render_contacts(import_report=report)
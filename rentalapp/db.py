@@ -0,0 +1,117 @@
+# rentalapp/db.py
+import os, re, pytz
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from dotenv import load_dotenv
+import warnings
+warnings.filterwarnings("ignore", category=UserWarning)
+warnings.filterwarnings("ignore", category=DeprecationWarning)
+
+# ---------------------------------------------------------------------
+# DB 기본 설정
+# ---------------------------------------------------------------------
+load_dotenv()  # .env / .env.prod
+
+# 프로젝트 루트 (app.py, templates/, static/, rental.db 위치)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# ✅ 기본값: app.py와 같은 폴더의 SQLite DB (절대경로)
+#    DATABASE_URL=postgresql://user:pw@host/db 로 PostgreSQL 사용 (psycopg 3 드라이버)
+DB_PATH = os.path.join(BASE_DIR, "rental.db")
+
+def _database_url() -> str:
+    url = os.getenv("DATABASE_URL") or f"sqlite:///{DB_PATH}"
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    if url.startswith("postgresql://"):
+        url = "postgresql+psycopg://" + url[len("postgresql://"):]
+    return url
+
+def _create_engine(url: str) -> Engine:
+    if url.startswith("sqlite"):
+        return create_engine(url, future=True, pool_pre_ping=True)
+
+    # 서버형 DB: 워커 프로세스마다 커넥션 풀
+    connect_args = {}
+    statement_timeout_ms = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+    if url.startswith("postgresql") and statement_timeout_ms > 0:
+        connect_args["options"] = f"-c statement_timeout={statement_timeout_ms}"
+    return create_engine(
+        url,
+        future=True,
+        pool_pre_ping=True,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        connect_args=connect_args,
+    )
+
+DATABASE_URL = _database_url()
+engine: Engine = _create_engine(DATABASE_URL)
+DATABASE_URL = engine.url.render_as_string(hide_password=True)  # 로그 출력용
+
+if engine.dialect.name == "sqlite":
+    print("📂 DB Path:", engine.url.database)
+print("DB URL:", DATABASE_URL)
+
+def is_sqlite() -> bool:
+    return engine.dialect.name == "sqlite"
+
+# SQLite 운영 프로파일 (연결마다 적용, .env로 조정)
+# - WAL: 관리자 화면 조회가 키오스크 대여/반납 쓰기를 막지 않음
+# - busy_timeout: 동시 쓰기 시 즉시 "database is locked" 대신 대기
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "synchronous":  os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "cache_size":   int(os.getenv("SQLITE_CACHE_SIZE", "-20000")),        # 음수 = KiB
+    "mmap_size":    int(os.getenv("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024))),
+    "temp_store":   os.getenv("SQLITE_TEMP_STORE", "MEMORY"),
+}
+
+def apply_sqlite_pragmas(dbapi_conn, pragmas: dict):
+    cur = dbapi_conn.cursor()
+    try:
+        for name, value in pragmas.items():
+            cur.execute(f"PRAGMA {name}={value}")
+    finally:
+        cur.close()
+
+@event.listens_for(engine, "connect")
+def _on_connect(dbapi_conn, _record):
+    if is_sqlite():
+        apply_sqlite_pragmas(dbapi_conn, SQLITE_PRAGMAS)
+
+def is_postgres() -> bool:
+    return engine.dialect.name == "postgresql"
+
+# ---------------------------------------------------------------------
+# 공통 유틸
+# ---------------------------------------------------------------------
+# 연락처 구분 문자 — 공백, 괄호, 점, '-' ("02 123 4567", "(02)1234-5678")
+PHONE_SEPARATORS = r"[\s().-]"
+
+def clean_phone(phone: str) -> str:
+    return re.sub(PHONE_SEPARATORS, "", phone or "")
+
+def format_phone_kor(phone: str) -> str:
+    p = clean_phone(phone)
+    if len(p) == 11:
+        return f"{p[:3]}-{p[3:7]}-{p[7:]}"
+    if len(p) == 10:
+        if p.startswith("02"):
+            return f"{p[:2]}-{p[2:6]}-{p[6:]}"
+        return f"{p[:3]}-{p[3:6]}-{p[6:]}"
+    if len(p) == 9 and p.startswith("02"):
+        return f"{p[:2]}-{p[2:5]}-{p[5:]}"
+    return phone or ""
+
+def normalize_unit_no(unit_no: str) -> str:
+    """단말번호 저장 형식 (앞뒤 공백 제거) — 조회 시 TRIM/UPPER 없이 인덱스 사용"""
+    return (unit_no or "").strip()
+
+def now_kst_str() -> str:
+    kst = pytz.timezone("Asia/Seoul")
+    return datetime.now(kst).strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,210 @@
+# rentalapp/equipment.py
+from flask import Blueprint, render_template, request, redirect, session, url_for, flash
+from sqlalchemy import text
+
+from .db import engine
+from .exports import export_rows, requested_export_format
+from .paging import keyset_page, page_window, cached_counts, forget_counts
+
+bp = Blueprint("equipment", __name__)
+
+# 장비 목록 SQL — 라우트와 check-plans(rentalapp/plans.py)가 같은 문장을 사용
+EQUIPMENT_LIST_SQL = "SELECT id, item_name, model_name, category, location, total_qty, available_qty FROM equipment"
+EQUIPMENT_KEY_COLS = ["id"]
+
+# ---------------------------------------------------------------------
+# 장비 목록/엑셀에서 같이 쓰는 필터
+# ---------------------------------------------------------------------
+def _build_equipment_filters(args):
+    """검색 조건(request.args 또는 같은 키의 dict) → (WHERE 절, 바인딩)"""
+    filters = []
+    params = {}
+    if args.get("name"):
+        filters.append("item_name LIKE :name")
+        params["name"] = f"%{args.get('name').strip()}%"
+    if args.get("model"):
+        filters.append("model_name LIKE :model")
+        params["model"] = f"%{args.get('model').strip()}%"
+    if args.get("category"):
+        filters.append("category = :category")
+        params["category"] = args.get("category").strip()
+    if args.get("location"):
+        filters.append("location LIKE :location")
+        params["location"] = f"%{args.get('location').strip()}%"
+    if args.get("total_qty"):
+        filters.append("total_qty = :total_qty")
+        params["total_qty"] = args.get("total_qty")
+    if args.get("available_qty"):
+        filters.append("available_qty = :available_qty")
+        params["available_qty"] = args.get("available_qty")
+    where_clause = "WHERE " + " AND ".join(filters) if filters else ""
+    return where_clause, params
+
+
+# ---------------------------------------------------------------------
+# 장비 재고(관리)
+# ---------------------------------------------------------------------
+@bp.route("/admin_equipment", methods=["GET"])
+def admin_equipment():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    where_clause, params = _build_equipment_filters(request.args)
+
+    try:
+        page = max(int(request.args.get("page", 1)), 1)
+    except ValueError:
+        page = 1
+    try:
+        per_page = int(request.args.get("per_page", 10))
+        if per_page not in (10, 20, 50):
+            per_page = 10
+    except ValueError:
+        per_page = 10
+    after, before = request.args.get("after"), request.args.get("before")
+
+    with engine.connect() as conn:
+        # 건수/합계는 캐시 (쓰기 라우트가 forget_counts), 목록은 커서만 — OFFSET 없음
+        total_count, sum_total, sum_available = cached_counts(conn, "equipment", f"""
+            SELECT COUNT(*), COALESCE(SUM(total_qty),0), COALESCE(SUM(available_qty),0)
+            FROM equipment {where_clause}
+        """, params)
+        page, total_pages, last_rows = page_window(
+            total_count, per_page, page, bool(after or before), request.args.get("last") == "1",
+        )
+
+        rows, prev_cursor, next_cursor = keyset_page(
+            conn,
+            EQUIPMENT_LIST_SQL, where_clause, params, EQUIPMENT_KEY_COLS, per_page,
+            after=after, before=before, last=last_rows,
+        )
+
+    start_no = (page - 1) * per_page
+    equipment_list = [{
+        "display_no": start_no + i + 1,
+        "id": r[0], "item_name": r[1], "model_name": r[2],
+        "category": r[3], "location": r[4],
+        "total_qty": r[5], "available_qty": r[6],
+    } for i, r in enumerate(rows)]
+
+    categories = ["전자 제품", "소모품", "유지보수 제품", "공구", "기타", "잡자재"]
+
+    return render_template(
+        "admin_equipment.html",
+        equipment_list=equipment_list,
+        categories=categories,
+        page=page, total_pages=total_pages, per_page=per_page,
+        prev_cursor=prev_cursor, next_cursor=next_cursor,
+        total_count=total_count,
+        total_qty_sum=sum_total, available_qty_sum=sum_available, inuse_qty_sum=max(sum_total - sum_available, 0)
+    )
+
+@bp.route("/admin/equipment/register", methods=["POST"])
+def register_equipment():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    name = (request.form.get("name") or "").strip()
+    model = (request.form.get("model") or "").strip()
+    category = (request.form.get("category") or "").strip()
+    location = (request.form.get("location") or "").strip()
+
+    def _to_int(val, default=0):
+        try:
+            return int(val)
+        except (TypeError, ValueError):
+            return default
+
+    total_qty = max(_to_int(request.form.get("total_qty"), 0), 0)
+    available_qty = max(_to_int(request.form.get("available_qty"), 0), 0)
+    if available_qty > total_qty:
+        available_qty = total_qty
+
+    if not name:
+        return redirect(url_for("equipment.admin_equipment"))
+
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO equipment (item_name, model_name, category, location, total_qty, available_qty)
+            VALUES (:name, :model, :category, :location, :total, :available)
+        """), {"name": name, "model": model, "category": category, "location": location,
+               "total": total_qty, "available": available_qty})
+    forget_counts("equipment")
+    return redirect(url_for("equipment.admin_equipment"))
+
+@bp.route("/admin/equipment/update_qty", methods=["POST"])
+def update_equipment_quantity():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    equip_id = request.form.get("equipment_id")
+
+    def _to_int(val, default=0):
+        try:
+            return int(val)
+        except (TypeError, ValueError):
+            return default
+
+    total = max(_to_int(request.form.get("total_qty"), 0), 0)
+    available = max(_to_int(request.form.get("available_qty"), 0), 0)
+    if available > total:
+        available = total
+
+    if not equip_id:
+        return redirect(url_for("equipment.admin_equipment"))
+
+    with engine.begin() as conn:
+        conn.execute(text(
+            "UPDATE equipment SET total_qty = :total, available_qty = :available WHERE id = :id"
+        ), {"total": total, "available": available, "id": equip_id})
+    forget_counts("equipment")
+    return redirect(url_for("equipment.admin_equipment"))
+
+@bp.route("/admin/equipment/delete", methods=["POST"])
+def delete_equipments():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    ids = request.form.getlist("equipment_ids")
+    id_list = []
+    for x in ids or []:
+        try:
+            id_list.append(int(x))
+        except (TypeError, ValueError):
+            continue
+
+    if id_list:
+        params = {f"id{i}": v for i, v in enumerate(id_list)}
+        in_clause = ", ".join(f":id{i}" for i in range(len(id_list)))
+        with engine.begin() as conn:
+            conn.execute(text(f"DELETE FROM equipment WHERE id IN ({in_clause})"), params)
+        forget_counts("equipment")
+
+    return redirect(url_for("equipment.admin_equipment"))
+
+def equipment_export_source(args) -> dict:
+    where_clause, params = _build_equipment_filters(args)
+    return {
+        "basename": "equipment", "sheet": "장비목록",
+        "columns": [("ID", "int"), ("장비 이름", "str"), ("모델명", "str"), ("카테고리", "str"),
+                    ("위치", "str"), ("총 수량", "int"), ("사용 가능", "int")],
+        "sql": f"""
+            SELECT id, item_name, model_name, category, location, total_qty, available_qty
+            FROM equipment
+            {where_clause}
+            ORDER BY id DESC
+        """,
+        "params": params,
+    }
+
+@bp.route("/admin/equipment/export", methods=["GET"])
+def export_equipment():
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+
+    fmt, error = requested_export_format()
+    if error:
+        flash(error, "warning")
+        return redirect(url_for("equipment.admin_equipment"))
+
+    return export_rows(fmt, equipment_export_source(request.args))
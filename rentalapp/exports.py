@@ -0,0 +1,139 @@
+# rentalapp/exports.py
+from flask import request, Response, stream_with_context
+import os, io, csv, tempfile
+from datetime import datetime
+from sqlalchemy import text
+
+from .db import engine
+
+# ---------------------------------------------------------------------
+# 내보내기 — 서버 측 커서로 읽어 응답을 나눠 보냄 (행 수와 무관하게 메모리 일정)
+# ---------------------------------------------------------------------
+EXPORT_FETCH_ROWS = int(os.getenv("EXPORT_FETCH_ROWS", "2000"))
+EXPORT_CHUNK_BYTES = 64 * 1024
+XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+def stream_query_rows(sql: str, params: dict = None):
+    """
+    SELECT 결과를 EXPORT_FETCH_ROWS 단위로 가져오며 행을 하나씩 yield
+    - PostgreSQL: 이름 있는 서버 측 커서 / SQLite: 커서 순회
+    """
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=EXPORT_FETCH_ROWS) \
+                     .execute(text(sql), params or {})
+        for rows in result.partitions():
+            yield from rows
+
+def xlsx_chunks(sheet_name: str, header: list, rows):
+    """
+    openpyxl write-only 통합문서 → 바이트 청크
+    - 행은 시트 임시 파일로 바로 기록, 압축 결과도 임시 파일에서 청크로 읽어 보냄
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+    ws.append(header)
+    for row in rows:
+        ws.append(list(row))
+    with tempfile.TemporaryFile() as tmp:
+        wb.save(tmp)
+        tmp.seek(0)
+        while chunk := tmp.read(EXPORT_CHUNK_BYTES):
+            yield chunk
+
+def csv_chunks(header: list, rows):
+    """
+    CSV 바이트 청크 (첫 행부터 바로 전송)
+    - 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    buf.write("\ufeff")
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow(row)
+        if buf.tell() >= EXPORT_CHUNK_BYTES:
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue().encode("utf-8")
+
+def parquet_chunks(columns: list, rows):
+    """
+    Parquet 바이트 청크 (EXPORT_FETCH_ROWS 행마다 row group, zstd 압축)
+    - columns: [(이름, "int" | "str")]
+    - 파일 끝 메타데이터가 있어야 완성되므로 임시 파일에 쓴 뒤 청크로 읽어 보냄
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = {"int": pa.int64(), "str": pa.string()}
+    schema = pa.schema([(name, types[kind]) for name, kind in columns])
+
+    def _batch(buffer):
+        return pa.RecordBatch.from_arrays(
+            [pa.array([r[i] for r in buffer], type=schema.field(i).type) for i in range(len(columns))],
+            schema=schema,
+        )
+
+    with tempfile.TemporaryFile() as tmp:
+        with pq.ParquetWriter(tmp, schema, compression="zstd") as writer:
+            buffer = []
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) >= EXPORT_FETCH_ROWS:
+                    writer.write_batch(_batch(buffer))
+                    buffer = []
+            if buffer:
+                writer.write_batch(_batch(buffer))
+        tmp.seek(0)
+        while chunk := tmp.read(EXPORT_CHUNK_BYTES):
+            yield chunk
+
+def export_response(chunks, filename: str, mimetype: str) -> Response:
+    """청크 생성기 → 첨부파일 스트리밍 응답 (요청 컨텍스트 유지)"""
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+EXPORT_FORMATS = ("xlsx", "csv", "parquet")
+EXPORT_MIMETYPES = {
+    "xlsx": XLSX_MIMETYPE,
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+def export_chunks(fmt: str, source: dict, rows):
+    """
+    내보내기 형식별 바이트 청크
+    - source: {"basename", "sheet", "columns": [(헤더, "int" | "str")], "sql", "params"}
+    """
+    header = [name for name, _ in source["columns"]]
+    if fmt == "csv":
+        return csv_chunks(header, rows)
+    if fmt == "parquet":
+        return parquet_chunks(source["columns"], rows)
+    return xlsx_chunks(source["sheet"], header, rows)
+
+def export_filename(source: dict, fmt: str) -> str:
+    return f"{source['basename']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+
+def export_rows(fmt: str, source: dict) -> Response:
+    """?format= 에 맞춰 내보내기 응답 생성 (xlsx 기본)"""
+    rows = stream_query_rows(source["sql"], source["params"])
+    return export_response(export_chunks(fmt, source, rows), export_filename(source, fmt), EXPORT_MIMETYPES[fmt])
+
+def requested_export_format():
+    """?format= 검사 → (형식, 오류 메시지)"""
+    fmt = (request.args.get("format") or "xlsx").lower()
+    if fmt not in EXPORT_FORMATS:
+        return None, f"지원하지 않는 형식입니다: {fmt}"
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return None, "Parquet 내보내기에는 pyarrow 패키지가 필요합니다."
+    return fmt, None
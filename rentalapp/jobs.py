@@ -0,0 +1,262 @@
+# rentalapp/jobs.py
+from flask import Blueprint, request, redirect, session, url_for, jsonify, send_file, abort
+import os, pytz, json, time, threading, uuid
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import text, bindparam
+
+from .admin import rental_export_source
+from .contacts import ImportFailed, contacts_export_source, import_company_chunks, read_company_frames
+from .db import BASE_DIR, engine, now_kst_str
+from .equipment import equipment_export_source
+from .exports import (
+    export_chunks, export_filename, EXPORT_MIMETYPES, requested_export_format, stream_query_rows,
+)
+
+bp = Blueprint("jobs", __name__)
+
+# ---------------------------------------------------------------------
+# 백그라운드 작업 — 대용량 내보내기/가져오기를 요청 스레드 밖에서 처리
+#  - 요청은 jobs 행만 만들고 작업 id를 바로 반환 (202)
+#  - 진행률은 GET /admin/jobs/<id>, 결과 파일은 /admin/jobs/<id>/download
+#  - 결과 파일은 JOB_DIR 에 JOB_TTL_HOURS 동안 보관
+#  - 작업을 맡은 프로세스가 살아 있는 동안 대기/실행 중 작업의 updated_at 을
+#    JOB_HEARTBEAT_SECONDS 마다 갱신 → 갱신이 끊긴 작업 = 프로세스 재시작으로 중단
+# ---------------------------------------------------------------------
+JOB_DIR = os.getenv("JOB_DIR", os.path.join(BASE_DIR, "job_files"))
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_TTL_HOURS = int(os.getenv("JOB_TTL_HOURS", "24"))
+JOB_STALE_MINUTES = int(os.getenv("JOB_STALE_MINUTES", "10"))   # 하트비트가 이만큼 끊기면 중단으로 처리
+JOB_HEARTBEAT_SECONDS = min(60, JOB_STALE_MINUTES * 60 / 3)
+JOB_PROGRESS_SECONDS = 0.5
+
+EXPORT_SOURCES = {
+    "equipment": equipment_export_source,
+    "rentals": rental_export_source,
+    "contacts": contacts_export_source,
+}
+
+_job_pool = None
+_job_pool_lock = threading.Lock()
+_live_jobs = set()   # 이 프로세스가 맡은 대기/실행 중 작업 id
+
+def _job_executor() -> ThreadPoolExecutor:
+    """첫 작업 때 생성 (gunicorn --preload fork 전에 스레드를 만들지 않도록)"""
+    global _job_pool
+    with _job_pool_lock:
+        if _job_pool is None:
+            _job_pool = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="job")
+            threading.Thread(target=_heartbeat, name="job-heartbeat", daemon=True).start()
+        return _job_pool
+
+def _heartbeat():
+    """맡은 작업의 updated_at 갱신 — 앞 작업을 기다리는 대기 작업도 중단으로 처리되지 않게"""
+    while True:
+        time.sleep(JOB_HEARTBEAT_SECONDS)
+        with _job_pool_lock:
+            ids = list(_live_jobs)
+        if not ids:
+            continue
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("""
+                    UPDATE jobs SET updated_at = :now
+                    WHERE id IN :ids AND status IN ('queued', 'running')
+                """).bindparams(bindparam("ids", expanding=True)), {"now": now_kst_str(), "ids": ids})
+        except Exception as e:
+            print("[JOB HEARTBEAT ERROR]", e)
+
+def _kst_str_before(**delta) -> str:
+    return (datetime.now(pytz.timezone("Asia/Seoul")) - timedelta(**delta)).strftime("%Y-%m-%d %H:%M:%S")
+
+def _update_job(job_id: str, **fields):
+    fields["updated_at"] = now_kst_str()
+    sets = ", ".join(f"{k} = :{k}" for k in fields)
+    with engine.begin() as conn:
+        conn.execute(text(f"UPDATE jobs SET {sets} WHERE id = :id"), {**fields, "id": job_id})
+
+def _purge_jobs():
+    """
+    보관 기간이 지난 작업/파일 삭제
+    - 하트비트가 끊긴 대기/실행 중 작업 = 맡은 프로세스가 재시작됨 → 실패 처리
+      (살아 있는 프로세스의 작업은 오래 기다려도 하트비트로 계속 갱신됨)
+    """
+    with engine.begin() as conn:
+        old = conn.execute(text("""
+            DELETE FROM jobs WHERE status IN ('done', 'failed') AND created_at < :cutoff
+            RETURNING file_path
+        """), {"cutoff": _kst_str_before(hours=JOB_TTL_HOURS)}).scalars().all()
+        conn.execute(text("""
+            UPDATE jobs SET status = 'failed', message = '작업이 중단되었습니다 (서버 재시작)'
+            WHERE status IN ('queued', 'running') AND updated_at < :cutoff
+        """), {"cutoff": _kst_str_before(minutes=JOB_STALE_MINUTES)})
+    for path in old:
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    # 프로세스가 중간에 죽어 남은 임시 파일(.part, 업로드)
+    cutoff = time.time() - JOB_TTL_HOURS * 3600
+    for name in os.listdir(JOB_DIR) if os.path.isdir(JOB_DIR) else []:
+        path = os.path.join(JOB_DIR, name)
+        if not (name.endswith(".part") or name.startswith("upload_")):
+            continue
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass   # 다른 워커가 먼저 지움
+
+def submit_job(kind: str, params: dict, fn, *args) -> str:
+    """jobs 행 생성 후 풀에 등록 → 작업 id"""
+    _purge_jobs()
+    os.makedirs(JOB_DIR, exist_ok=True)
+    job_id = uuid.uuid4().hex
+    now = now_kst_str()
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO jobs (id, kind, status, params, done, created_by, created_at, updated_at)
+            VALUES (:id, :kind, 'queued', :params, 0, :created_by, :now, :now)
+        """), {"id": job_id, "kind": kind, "params": json.dumps(params, ensure_ascii=False),
+               "created_by": session.get("admin_name"), "now": now})
+    pool = _job_executor()
+    with _job_pool_lock:
+        _live_jobs.add(job_id)
+    pool.submit(_run_job, job_id, fn, *args)
+    return job_id
+
+def _run_job(job_id: str, fn, *args):
+    try:
+        # 대기 중에 실패 처리된 작업은 실행하지 않음
+        with engine.begin() as conn:
+            started = conn.execute(text("""
+                UPDATE jobs SET status = 'running', updated_at = :now
+                WHERE id = :id AND status = 'queued'
+            """), {"id": job_id, "now": now_kst_str()}).rowcount
+        if not started:
+            return
+        t0 = time.perf_counter()
+        try:
+            fn(job_id, *args)
+        except Exception as e:
+            print(f"[JOB ERROR] {job_id}", e)
+            _update_job(job_id, status="failed", message=str(e)[:500])
+            return
+        print(f"⏱ job {job_id[:8]}: {(time.perf_counter() - t0) * 1000:.0f} ms")
+    finally:
+        with _job_pool_lock:
+            _live_jobs.discard(job_id)
+
+def _track_progress(job_id: str, items, total=None, size=lambda item: 1):
+    """items를 그대로 넘기면서 처리 건수를 JOB_PROGRESS_SECONDS 간격으로 기록"""
+    done, last = 0, time.monotonic()
+    for item in items:
+        yield item
+        done += size(item)
+        if time.monotonic() - last >= JOB_PROGRESS_SECONDS:
+            _update_job(job_id, done=done, total=total)
+            last = time.monotonic()
+    _update_job(job_id, done=done, total=total)
+
+def _export_job(job_id: str, source_name: str, fmt: str, args: dict):
+    source = EXPORT_SOURCES[source_name](args)
+    with engine.connect() as conn:
+        total = conn.execute(text(f"SELECT COUNT(*) FROM ({source['sql']}) t"), source["params"]).scalar_one()
+
+    rows = _track_progress(job_id, stream_query_rows(source["sql"], source["params"]), total)
+    path = os.path.join(JOB_DIR, f"{job_id}.{fmt}")
+    tmp_path = path + ".part"   # 완성된 파일만 결과 이름으로 — 실패하면 지움
+    try:
+        with open(tmp_path, "wb") as f:
+            for chunk in export_chunks(fmt, source, rows):
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    _update_job(job_id, status="done", file_path=path, file_name=export_filename(source, fmt))
+
+def _contacts_import_job(job_id: str, upload_path: str, filename: str):
+    try:
+        with open(upload_path, "rb") as f:
+            report = import_company_chunks(_track_progress(job_id, read_company_frames(f, filename), size=len))
+    except ImportFailed as e:
+        # 앞 청크는 이미 커밋됨 → 부분 결과를 남기고 실패 처리 (메시지: "N건 반영 후 실패: …")
+        _update_job(job_id, result=json.dumps(e.report, ensure_ascii=False))
+        raise
+    finally:
+        os.remove(upload_path)
+    _update_job(job_id, status="done", result=json.dumps(report, ensure_ascii=False),
+                message=f"신규 {report['inserted']}건, 갱신 {report['updated']}건, 제외 {report['rejected_count']}건")
+
+def _job_json(row) -> dict:
+    job = dict(row._mapping)
+    total = job.get("total")
+    return {
+        "ok": True,
+        "id": job["id"], "kind": job["kind"], "status": job["status"],
+        "done": job["done"], "total": total,
+        "progress": 100 if job["status"] == "done" else (int(job["done"] * 100 / total) if total else None),
+        "message": job["message"],
+        "result": json.loads(job["result"]) if job["result"] else None,
+        "download_url": url_for("jobs.download_job", job_id=job["id"]) if job["file_path"] else None,
+        "created_at": job["created_at"], "updated_at": job["updated_at"],
+    }
+
+def _job_accepted(job_id: str):
+    return jsonify({"ok": True, "job_id": job_id, "status_url": url_for("jobs.job_status", job_id=job_id)}), 202
+
+@bp.post("/admin/jobs/export/<source>")
+def submit_export_job(source):
+    """내보내기 작업 등록 (?format=, 목록 화면과 같은 검색 조건)"""
+    if not session.get("admin_logged_in"):
+        return jsonify({"ok": False, "error": "로그인이 필요합니다."}), 401
+    if source not in EXPORT_SOURCES:
+        return jsonify({"ok": False, "error": f"알 수 없는 내보내기: {source}"}), 404
+    fmt, error = requested_export_format()
+    if error:
+        return jsonify({"ok": False, "error": error}), 400
+
+    args = request.args.to_dict()
+    job_id = submit_job(f"export:{source}", {"format": fmt, **args}, _export_job, source, fmt, args)
+    return _job_accepted(job_id)
+
+@bp.post("/admin/jobs/import/contacts")
+def submit_contacts_import_job():
+    """주소록 가져오기 작업 등록 (업로드 파일은 JOB_DIR에 저장 후 작업에서 삭제)"""
+    if not session.get("admin_logged_in"):
+        return jsonify({"ok": False, "error": "로그인이 필요합니다."}), 401
+    file = request.files.get("file")
+    filename = ((file and file.filename) or "").lower()
+    if not filename.endswith((".xlsx", ".csv")):
+        return jsonify({"ok": False, "error": "xlsx 또는 csv 파일만 올릴 수 있습니다."}), 400
+
+    os.makedirs(JOB_DIR, exist_ok=True)
+    upload_path = os.path.join(JOB_DIR, f"upload_{uuid.uuid4().hex}{os.path.splitext(filename)[1]}")
+    file.save(upload_path)
+    job_id = submit_job("import:contacts", {"filename": file.filename}, _contacts_import_job, upload_path, filename)
+    return _job_accepted(job_id)
+
+@bp.get("/admin/jobs/<job_id>", endpoint="job_status")
+def job_status(job_id):
+    if not session.get("admin_logged_in"):
+        return jsonify({"ok": False, "error": "로그인이 필요합니다."}), 401
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT * FROM jobs WHERE id = :id"), {"id": job_id}).first()
+    if not row:
+        return jsonify({"ok": False, "error": "작업을 찾을 수 없습니다."}), 404
+    return jsonify(_job_json(row))
+
+@bp.get("/admin/jobs/<job_id>/download", endpoint="download_job")
+def download_job(job_id):
+    if not session.get("admin_logged_in"):
+        return redirect("/admin_login")
+    with engine.connect() as conn:
+        row = conn.execute(text("""
+            SELECT file_path, file_name FROM jobs WHERE id = :id AND status = 'done'
+        """), {"id": job_id}).first()
+    if not row or not row[0] or not os.path.exists(row[0]):
+        abort(404)
+    fmt = os.path.splitext(row[0])[1].lstrip(".")
+    return send_file(row[0], as_attachment=True, download_name=row[1],
+                     mimetype=EXPORT_MIMETYPES.get(fmt, "application/octet-stream"))
@@ -0,0 +1,621 @@
+# rentalapp/manual.py
+from flask import Blueprint, render_template, request, redirect, url_for, jsonify, current_app, flash
+import os, json, time, posixpath, tempfile, threading, uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+import click
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.security import safe_join
+
+from .manual_images import (
+    BLOB_DIR, IMAGE_SIZES, IMAGE_WORKERS, UPLOAD_MAX_BYTES, add_image_refs, adopt_folder,
+    attached_image_dirs, drop_dead_image_dirs, image_entry, image_listing, image_refcounts,
+    make_derivatives, normalize_image_dir, orphan_blobs, pending_images, place_blob, refresh_listing,
+    remove_blob, remove_derivatives, remove_image_ref, stream_image_upload, submit_derivatives,
+    verify_images,
+)
+
+bp = Blueprint("manual", __name__)
+
+# ---------------------------------------------------------------------
+# 업무 메뉴얼
+# ---------------------------------------------------------------------
+def _manual_json_path_candidates():
+    return [
+        os.path.join(current_app.root_path, "manual_data.json"),
+        os.path.join(current_app.instance_path, "manual_data.json"),
+        os.path.join(current_app.static_folder, "manual", "manual_data.json"),
+    ]
+
+def _manual_json_path_for_save():
+    for p in _manual_json_path_candidates():
+        d = os.path.dirname(p)
+        if os.path.isdir(d):
+            return p
+    fallback_dir = os.path.join(current_app.static_folder, "manual")
+    os.makedirs(fallback_dir, exist_ok=True)
+    return os.path.join(fallback_dir, "manual_data.json")
+
+# 메뉴얼 문서 캐시 (프로세스 단위)
+#  - (경로, mtime, 크기)가 같으면 파일을 다시 읽거나 파싱하지 않음
+#  - 마지막 확인 후 MANUAL_CACHE_CHECK_SECONDS 동안은 stat 도 생략 (외부 편집 반영 지연 상한)
+#  - 캐시 트리는 공유 객체 → 수정하려면 load_manual_data() 의 사본을 사용
+MANUAL_CACHE_CHECK_SECONDS = float(os.getenv("MANUAL_CACHE_CHECK_SECONDS", "1.0"))
+_manual_cache = {"path": None, "key": None, "data": None, "checked": 0.0}
+_manual_cache_lock = threading.Lock()
+
+def _manual_stat(path):
+    try:
+        return os.stat(path) if path else None
+    except FileNotFoundError:
+        return None
+
+def _cached_manual_data():
+    """캐시된 메뉴얼 문서 (읽기 전용), 파일이 없으면 None"""
+    cache = _manual_cache
+    if cache["data"] is not None and time.monotonic() - cache["checked"] < MANUAL_CACHE_CHECK_SECONDS:
+        return cache["data"]
+
+    with _manual_cache_lock:
+        path = cache["path"]
+        st = _manual_stat(path)
+        if st is None:
+            path = next((p for p in _manual_json_path_candidates() if os.path.isfile(p)), None)
+            st = _manual_stat(path)
+        if st is None:
+            cache.update(path=None, key=None, data=None)
+            return None
+
+        key = (path, st.st_ino, st.st_mtime_ns, st.st_size)
+        if key != cache["key"]:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            cache.update(path=path, key=key, data=data)
+        cache["checked"] = time.monotonic()
+        return cache["data"]
+
+def _copy_tree(value):
+    """JSON 트리 복사 (dict/list 만 새로 만듦, copy.deepcopy 보다 수 배 빠름)"""
+    if isinstance(value, dict):
+        return {k: _copy_tree(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_tree(v) for v in value]
+    return value
+
+def _remember_manual_data(path: str, manual: dict):
+    """방금 저장한 문서를 캐시에 반영 (다음 조회에서 다시 읽지 않도록)"""
+    st = _manual_stat(path)
+    if st is None:
+        return
+    with _manual_cache_lock:
+        _manual_cache.update(path=path, key=(path, st.st_ino, st.st_mtime_ns, st.st_size),
+                             data=_copy_tree(manual), checked=time.monotonic())
+
+def load_manual_data(writable: bool = True):
+    """
+    manual_data.json → dict
+    - writable=True (기본): 수정해도 되는 사본
+    - writable=False: 캐시 공유 객체 (조회 전용, 절대 수정하지 말 것)
+    """
+    data = _cached_manual_data()
+    if data is not None:
+        return _copy_tree(data) if writable else data
+    return _sample_manual()
+
+def _sample_manual():
+    return {
+        "last_updated": "미설정",
+        "sections": [{
+            "id": "sample",
+            "title": "예시",
+            "items": [{
+                "id": "sample_item",
+                "name": "샘플 항목",
+                "images_dir": None,
+                "description": "manual_data.json 파일을 준비하면 실제 메뉴얼이 표시됩니다.",
+                "actions": [
+                    "static/manual/ 아래에 이미지 폴더 생성",
+                    "manual_data.json 작성 후 위치 중 한 곳에 배치"
+                ],
+                "notes": "",
+                "contacts": []
+            }]
+        }]
+    }
+
+# ---------------------------------------------------------------------
+# 메뉴얼 저장 — 잠금 + 버전 비교(CAS) + 원자적 교체
+#  - 문서의 version 은 저장할 때마다 1 증가, 섹션/항목의 rev 는 마지막으로 바뀐 version
+#  - 쓰기는 같은 폴더 임시 파일에 쓰고 fsync 후 os.replace → 도중에 죽어도 기존 파일 유지
+#  - 잠금: 프로세스 내 threading.Lock + 워커 간 manual_data.json.lock 파일 잠금
+# ---------------------------------------------------------------------
+class ManualConflict(Exception):
+    """편집 화면을 연 뒤 다른 사람이 같은 문서/섹션/항목을 먼저 바꾼 경우"""
+
+_manual_write_lock = threading.Lock()
+
+def _lock_file(fh):
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+        return
+    fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+
+def _unlock_file(fh):
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        return
+    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+@contextmanager
+def _manual_file_lock(path: str):
+    with _manual_write_lock, open(path + ".lock", "a+") as fh:
+        _lock_file(fh)
+        try:
+            yield
+        finally:
+            _unlock_file(fh)
+
+def _read_manual_file(path: str):
+    """잠금 안에서 디스크의 최신 문서 (캐시 사용 안 함), 없으면 None"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def _write_manual_atomic(path: str, manual: dict):
+    fd, tmp_path = tempfile.mkstemp(prefix=".manual_data.", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manual, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _remember_manual_data(path, manual)
+
+def _current_manual(path: str) -> dict:
+    """
+    저장할 문서의 시작점 — 잠금 안에서 디스크에서 직접 읽음 (캐시/예시 문서는 쓰지 않음)
+    - 저장 경로에 파일이 없으면 조회가 읽는 다른 위치의 파일을 복사해 시작, 그것도 없으면 빈 문서
+    """
+    for p in [path] + [p for p in _manual_json_path_candidates() if p != path]:
+        manual = _read_manual_file(p)
+        if manual is not None:
+            return manual
+    return {"version": 0, "sections": []}
+
+def _manual_version(manual: dict) -> int:
+    return int(manual.get("version") or 0)
+
+def update_manual(mutate, base_version: int = None, target=None, after=None) -> dict:
+    """
+    잠금 안에서 최신 문서에 mutate(manual, touch) 적용 후 저장 (load-modify-save 경합 없음)
+    - 다른 섹션/항목을 동시에 바꾼 편집은 자연히 합쳐짐
+    - base_version(편집 화면을 열 때의 version)과 target(manual → 섹션/항목 dict)을 주면
+      그 대상이 base_version 이후에 바뀌었거나 사라졌을 때 ManualConflict (덮어쓰지 않음)
+    - mutate 는 바꾼 섹션/항목마다 touch(obj) 호출, False 를 반환하면 저장 안 함
+    - after(manual): 저장 뒤(저장 안 했어도) 잠금을 쥔 채로 실행 — 문서 기준 파일 정리용
+    """
+    path = _manual_json_path_for_save()
+    with _manual_file_lock(path):
+        manual = _current_manual(path)
+        version = _manual_version(manual)
+        if base_version is not None and target is not None and base_version < version:
+            obj = target(manual)
+            if obj is None or int(obj.get("rev") or 0) > base_version:
+                raise ManualConflict("편집하는 동안 다른 사용자가 같은 내용을 수정하거나 삭제했습니다.")
+
+        def touch(obj):
+            obj["rev"] = version + 1
+
+        if mutate(manual, touch) is not False:
+            manual["version"] = version + 1
+            manual["last_updated"] = datetime.now().strftime("%Y-%m-%d")
+            _write_manual_atomic(path, manual)
+        if after is not None:
+            after(manual)
+    return manual
+
+def _form_version():
+    raw = request.form.get("version")
+    return int(raw) if raw and raw.isdigit() else None
+
+def collect_manual_images(manual: dict):
+    """
+    항목마다 images 를 붙인 새 문서 반환
+    - images: [{src, thumb, sources: [(MIME, srcset)]}] — 템플릿에서 <picture> 로 렌더링
+    - 섹션/항목 dict 만 얕게 복사 → 캐시 공유 문서(load_manual_data(writable=False))를 넘겨도 안전
+    """
+    manual = {**manual, "sections": [
+        {**sec, "items": [dict(item) for item in sec.get("items", [])]}
+        for sec in manual.get("sections", [])
+    ]}
+    for sec in manual["sections"]:
+        for item in sec["items"]:
+            images_dir = normalize_image_dir(item.get("images_dir"))
+            files = []
+            if images_dir:
+                try:
+                    files = [entry for _, entry in _dir_images(manual, images_dir)]
+                except Exception:
+                    pass
+            item["images"] = files
+    return manual
+
+def _dir_images(manual: dict, rel_dir: str) -> list:
+    """
+    폴더의 이미지 [(이름, image_entry)]
+    - 예전 방식으로 폴더에 직접 저장된 파일 + image_dirs 의 blob 참조 (blob 은 내용 주소 저장소에서)
+    """
+    static_url = lambda fn: url_for("static", filename=fn)
+    abs_dir = os.path.join(current_app.static_folder, rel_dir.replace("/", os.sep))
+    names, variants = image_listing(abs_dir, _image_index_dir())
+    images = [(fn, image_entry(static_url, rel_dir, fn, variants)) for fn in names]
+
+    refs = (manual.get("image_dirs") or {}).get(rel_dir)
+    if refs and refs["files"]:
+        _, blob_variants = image_listing(_blob_dir(), _image_index_dir())
+        blob_rel = f"manual/{BLOB_DIR}"
+        images += [(fn, image_entry(static_url, blob_rel, fn, blob_variants)) for fn in refs["files"]]
+    return images
+
+def _image_index_dir():
+    """폴더별 이미지 목록 manifest 위치 (static 밖)"""
+    return os.path.join(current_app.instance_path, "manual_index")
+
+def _blob_dir():
+    return os.path.join(current_app.static_folder, "manual", BLOB_DIR)
+
+def _image_folder(rel_dir: str):
+    """항목 이미지 폴더 (manual/...) 정규화 — manual 밖이거나 blob 저장소(manual/blobs/...)면 None"""
+    rel_dir = normalize_image_dir(posixpath.normpath(normalize_image_dir(rel_dir) or "."))
+    blob_rel = f"manual/{BLOB_DIR}"
+    if rel_dir.split("/")[0] != "manual" or rel_dir == blob_rel or rel_dir.startswith(blob_rel + "/"):
+        return None
+    return rel_dir
+
+def _remove_orphan_blobs(manual: dict, dry_run: bool = False) -> tuple:
+    """update_manual(after=...) 로 잠금 안에서 호출: 참조 0 인 blob 과 파생본 삭제 → (개수, 바이트)"""
+    blob_dir = _blob_dir()
+    orphans = orphan_blobs(blob_dir, image_refcounts(manual))
+    if dry_run:
+        return len(orphans), sum(os.path.getsize(os.path.join(blob_dir, n)) for n in orphans)
+    freed = sum(remove_blob(blob_dir, n) for n in orphans)
+    if orphans:
+        print(f"🧹 이미지 {len(orphans)}개 정리 ({freed / 1e6:.1f} MB)")
+        refresh_listing(blob_dir, _image_index_dir())
+    return len(orphans), freed
+
+def _find_section(manual, sec_id):
+    for sec in manual.get("sections", []):
+        if sec.get("id") == sec_id:
+            return sec
+    return None
+
+def _find_item(manual, sec_id, item_id):
+    sec = _find_section(manual, sec_id)
+    if not sec: return None, None
+    for it in sec.get("items", []):
+        if it.get("id") == item_id:
+            return sec, it
+    return sec, None
+
+def _gen_id(prefix):
+    # 동시에 추가돼도 겹치지 않도록 임의 접미사
+    return f"{prefix}_{int(datetime.now().timestamp()*1000)}_{uuid.uuid4().hex[:6]}"
+
+@bp.route("/admin/manual")
+def admin_manual():
+    manual = collect_manual_images(load_manual_data(writable=False))
+    return render_template("admin_manual.html", manual=manual, image_sizes=IMAGE_SIZES)
+
+def _manual_redirect(mutate, target=None, after=None):
+    """편집 라우트 공통: 최신 문서에 반영, 충돌이면 안내 후 목록으로"""
+    try:
+        update_manual(mutate, base_version=_form_version(), target=target, after=after)
+    except ManualConflict as e:
+        flash(f"{e} 새로고침 후 다시 수정하세요.", "warning")
+    return redirect(url_for("manual.admin_manual"))
+
+@bp.route("/admin/manual/section/add", methods=["POST"])
+def manual_section_add():
+    title = (request.form.get("title") or "").strip()
+    if not title:
+        return redirect(url_for("manual.admin_manual"))
+
+    def mutate(manual, touch):
+        sec = {"id": _gen_id("sec"), "title": title, "items": []}
+        manual.setdefault("sections", []).append(sec)
+        touch(sec)
+    return _manual_redirect(mutate)
+
+@bp.route("/admin/manual/section/<sec_id>/update", methods=["POST"])
+def manual_section_update(sec_id):
+    title = (request.form.get("title") or "").strip()
+    if not title:
+        return redirect(url_for("manual.admin_manual"))
+
+    def mutate(manual, touch):
+        sec = _find_section(manual, sec_id)
+        if not sec:
+            return False
+        sec["title"] = title
+        touch(sec)
+    return _manual_redirect(mutate, target=lambda manual: _find_section(manual, sec_id))
+
+@bp.route("/admin/manual/section/<sec_id>/delete", methods=["POST"])
+def manual_section_delete(sec_id):
+    def mutate(manual, touch):
+        sections = manual.get("sections", [])
+        manual["sections"] = [s for s in sections if s.get("id") != sec_id]
+        if len(manual["sections"]) == len(sections):
+            return False
+        drop_dead_image_dirs(manual)
+    return _manual_redirect(mutate, after=_remove_orphan_blobs)
+
+@bp.route("/admin/manual/item/add", methods=["POST"])
+def manual_item_add():
+    sec_id     = request.form.get("sec_id")
+    name       = (request.form.get("name") or "").strip()
+    images_dir = (request.form.get("images_dir") or "").strip().lstrip("/\\")
+    description= (request.form.get("description") or "").strip()
+    actions    = [a.strip() for a in (request.form.get("actions") or "").splitlines() if a.strip()]
+    contacts   = [c.strip() for c in (request.form.get("contacts") or "").splitlines() if c.strip()]
+    notes      = (request.form.get("notes") or "").strip()
+
+    if not name:
+        return redirect(url_for("manual.admin_manual"))
+
+    def mutate(manual, touch):
+        sec = _find_section(manual, sec_id)
+        if not sec:
+            return False
+        new = {
+            "id": _gen_id("item"),
+            "name": name,
+            "images_dir": images_dir or None,
+            "description": description,
+            "actions": actions,
+            "contacts": contacts,
+            "notes": notes
+        }
+        sec.setdefault("items", []).append(new)
+        touch(new)
+    return _manual_redirect(mutate)
+
+@bp.route("/admin/manual/item/<sec_id>/<item_id>/update", methods=["POST"])
+def manual_item_update(sec_id, item_id):
+    name       = (request.form.get("name") or "").strip()
+    images_dir = (request.form.get("images_dir") or "").strip().lstrip("/\\")
+    description= (request.form.get("description") or "").strip()
+    actions    = [a.strip() for a in (request.form.get("actions") or "").splitlines() if a.strip()]
+    contacts   = [c.strip() for a in (request.form.get("contacts") or "").splitlines() for c in ([a] if a.strip() else [])]
+    notes      = (request.form.get("notes") or "").strip()
+
+    def mutate(manual, touch):
+        sec, it = _find_item(manual, sec_id, item_id)
+        if not it:
+            return False
+        if name: it["name"] = name
+        it["images_dir"] = images_dir or None
+        it["description"] = description
+        it["actions"] = actions
+        it["contacts"] = contacts
+        it["notes"] = notes
+        touch(it)
+    return _manual_redirect(mutate, target=lambda manual: _find_item(manual, sec_id, item_id)[1])
+
+@bp.route("/admin/manual/item/<sec_id>/<item_id>/delete", methods=["POST"])
+def manual_item_delete(sec_id, item_id):
+    def mutate(manual, touch):
+        sec = _find_section(manual, sec_id)
+        if not sec:
+            return False
+        items = sec.get("items", [])
+        sec["items"] = [x for x in items if x.get("id") != item_id]
+        if len(sec["items"]) == len(items):
+            return False
+        drop_dead_image_dirs(manual)
+    return _manual_redirect(mutate, after=_remove_orphan_blobs)
+
+# ---------------------------------------------------------------------
+# 메뉴얼 이미지 업로드 / 목록 / 삭제
+# ---------------------------------------------------------------------
+@bp.route("/admin/manuals/upload_images", methods=["POST"])
+def upload_manual_images():
+    # 본문은 request.files 대신 직접 스트리밍 (요청 한도는 이 엔드포인트만 따로)
+    request.max_content_length = UPLOAD_MAX_BYTES
+    boundary = request.mimetype_params.get("boundary")
+    if request.mimetype != "multipart/form-data" or not boundary:
+        return jsonify({"ok": False, "error": "multipart/form-data 가 아닙니다"}), 400
+
+    uploaded = []  # (임시 파일, blob 이름, 원래 이름)
+    try:
+        blob_dir = _blob_dir()
+        os.makedirs(blob_dir, exist_ok=True)
+        uploaded, fields, rejected = stream_image_upload(request.stream, boundary.encode("latin-1"), blob_dir)
+        if not uploaded and not rejected:
+            return jsonify({"ok": False, "error": "no files"})
+
+        # 폴더는 manual_data.json(image_dirs)에만 두고 파일은 blobs/<sha256>.<ext> 하나로
+        rel_dir = _image_folder(f"manual/{normalize_image_dir(fields.get('target_dir', ''))}")
+        if not rel_dir:
+            _discard_uploads(uploaded)
+            return jsonify({"ok": False, "error": "invalid target_dir"})
+
+        # 구조 검증(Pillow)은 파일마다 동시에
+        valid = []
+        for (tmp_path, name, orig_name), error in zip(uploaded, verify_images([u[0] for u in uploaded])):
+            if error:
+                print(f"[SKIP] {orig_name}: {error}")
+                rejected.append((orig_name, error))
+                _discard_uploads([(tmp_path, name, orig_name)])
+            else:
+                valid.append((tmp_path, name))
+
+        # 같은 요청 안에서 내용이 같은 파일은 blob 하나 → 응답 목록도 한 번만
+        unique = {}
+        for tmp_path, name in valid:
+            if name in unique:
+                _discard_uploads([(tmp_path, name)])
+            else:
+                unique[name] = tmp_path
+        uploaded = [(tmp_path, name) for name, tmp_path in unique.items()]
+
+        created = []
+        if uploaded:
+            # blob 배치와 참조 추가를 같은 잠금 안에서 → 그 사이에 GC 가 지우지 못함
+            def mutate(manual, touch):
+                for tmp_path, name in uploaded:
+                    if place_blob(blob_dir, tmp_path, name):
+                        created.append(os.path.join(blob_dir, name))
+                add_image_refs(manual, rel_dir, [name for _, name in uploaded])
+            update_manual(mutate)
+
+        # 처음 보는 내용만 썸네일/WebP/AVIF 생성 (워커 풀, 응답은 원본 URL 로 바로)
+        if created:
+            refresh_listing(blob_dir, _image_index_dir())
+            submit_derivatives(created, _image_index_dir())
+
+        saved_urls = [url_for("static", filename=f"manual/{BLOB_DIR}/{name}") for _, name in uploaded]
+        return jsonify({
+            "ok": True, "dir": rel_dir, "files": saved_urls,
+            "rejected": [{"name": n, "error": e} for n, e in rejected],
+        })
+
+    except RequestEntityTooLarge:
+        return jsonify({"ok": False, "error": f"한 번에 {UPLOAD_MAX_BYTES // (1024 * 1024)} MB 까지 올릴 수 있습니다"}), 413
+    except Exception as e:
+        _discard_uploads(uploaded)
+        print("[UPLOAD ERROR]", e)
+        return jsonify({"ok": False, "error": str(e)}), 500
+
+def _discard_uploads(uploaded):
+    for tmp_path, *_ in uploaded:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+@bp.route("/admin/manuals/list_images")
+def list_manual_images():
+    try:
+        rel_dir = normalize_image_dir(request.args.get("dir", ""))
+        files = []
+        for fn, entry in _dir_images(load_manual_data(writable=False), rel_dir):
+            files.append({"name": fn, "url": entry["src"], "thumb": entry["thumb"]})
+        return jsonify({"ok": True, "files": files})
+
+    except Exception as e:
+        print("[LIST ERROR]", e)
+        return jsonify({"ok": False, "error": str(e)}), 500
+
+
+@bp.route("/admin/manuals/delete_image", methods=["POST"])
+def delete_manual_image():
+    try:
+        data = request.get_json(force=True)
+        rel_dir = _image_folder(data.get("dir", ""))
+        name = data.get("name")
+        if not name:
+            return jsonify({"ok": False, "error": "no filename"})
+        # blob 저장소를 직접 가리키면 거부 — 공유 blob 은 참조 계수로만 지움
+        if not rel_dir:
+            return jsonify({"ok": False, "error": "invalid dir"}), 400
+        base_dir = os.path.join(current_app.static_folder, rel_dir.replace("/", os.sep))
+        file_path = safe_join(base_dir, name)
+        if file_path is None or os.path.dirname(file_path) != base_dir:
+            return jsonify({"ok": False, "error": "invalid filename"}), 400
+
+        # blob 참조면 참조만 빼고, 다른 폴더도 안 쓰게 된 blob 은 같은 잠금 안에서 정리
+        update_manual(lambda manual, touch: remove_image_ref(manual, rel_dir, name),
+                      after=_remove_orphan_blobs)
+
+        # 예전 방식으로 폴더에 직접 저장된 파일
+        if os.path.isfile(file_path):
+            os.remove(file_path)
+            remove_derivatives(file_path)
+            refresh_listing(base_dir, _image_index_dir())
+        return jsonify({"ok": True})
+    except Exception as e:
+        print("[DELETE ERROR]", e)
+        return jsonify({"ok": False, "error": str(e)}), 500
+
+
+@bp.cli.command("images")
+@click.option("--workers", type=int, default=None, help="동시 처리 수 (기본 MANUAL_IMAGE_WORKERS)")
+def derive_images_command(workers):
+    """static/manual 의 기존 이미지 파생본(썸네일/WebP/AVIF) 일괄 생성"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = pending_images(current_app.static_folder)
+    print(f"🖼 파생본 생성 대상: {len(paths)}장")
+    t0 = time.perf_counter()
+    made = 0
+    with ThreadPoolExecutor(max_workers=workers or IMAGE_WORKERS) as pool:
+        for path, result in zip(paths, pool.map(_derive_or_error, paths)):
+            if isinstance(result, Exception):
+                print(f"[DERIVE ERROR] {path} -> {result}")
+            else:
+                made += len(result)
+    for abs_dir in sorted({os.path.dirname(p) for p in paths}):
+        refresh_listing(abs_dir, _image_index_dir())
+    print(f"✅ 파생본 {made}개 생성 ({time.perf_counter() - t0:.1f}s)")
+
+def _derive_or_error(path):
+    try:
+        return make_derivatives(path)
+    except Exception as e:
+        return e
+
+
+@bp.cli.command("gc")
+@click.option("--adopt", is_flag=True, help="항목이 가리키는 예전 폴더의 이미지를 내용 주소 저장소(blobs)로 옮김")
+@click.option("--dry-run", is_flag=True, help="지우거나 옮기지 않고 대상만 출력")
+def image_gc_command(adopt, dry_run):
+    """참조 없는 메뉴얼 이미지 정리 (항목이 없는 폴더는 MANUAL_IMAGE_GC_GRACE_SECONDS 뒤 제거)"""
+    blob_dir = _blob_dir()
+    report = {"adopted": 0, "dropped": [], "orphans": (0, 0)}
+
+    def mutate(manual, touch):
+        if adopt and not dry_run:
+            for rel_dir in sorted(attached_image_dirs(manual)):
+                abs_dir = os.path.join(current_app.static_folder, rel_dir.replace("/", os.sep))
+                if rel_dir == f"manual/{BLOB_DIR}" or not os.path.isdir(abs_dir):
+                    continue
+                names = adopt_folder(abs_dir, blob_dir)
+                if names:
+                    add_image_refs(manual, rel_dir, names, prepend=True)  # 원래 파일이 앞
+                    report["adopted"] += len(names)
+                    refresh_listing(abs_dir, _image_index_dir())
+        report["dropped"] = drop_dead_image_dirs(manual)
+        if dry_run or not (report["adopted"] or report["dropped"]):
+            return False
+
+    def after(manual):
+        report["orphans"] = _remove_orphan_blobs(manual, dry_run=dry_run)
+
+    update_manual(mutate, after=after)
+    if report["adopted"]:
+        refresh_listing(blob_dir, _image_index_dir())
+        print(f"📦 예전 폴더 이미지 {report['adopted']}개 → {BLOB_DIR}/ (파생본: flask --app app manual images)")
+    prefix = "[dry-run] " if dry_run else ""
+    print(f"{prefix}항목 없는 폴더 {len(report['dropped'])}개: {', '.join(report['dropped']) or '-'}")
+    count, size = report["orphans"]
+    print(f"{prefix}참조 없는 이미지 {count}개 ({size / 1e6:.1f} MB)")
@@ -0,0 +1,580 @@
+# rentalapp/manual_images.py
+import os, json, time, hashlib, tempfile, threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+# ---------------------------------------------------------------------
+# 메뉴얼 이미지 파생본 (썸네일 / WebP / AVIF)
+#  - 원본: static/manual/<폴더>/<이름>.<ext> (그대로 보관, <img src> 대체용)
+#  - 파생본: 같은 폴더의 .derived/<이름>.<폭>w.<webp|avif>
+#  - 업로드 직후 워커 풀에서 생성 → 끝나기 전까지는 원본으로 표시
+#  - 기존 이미지는 flask --app app manual images 로 일괄 생성
+#  - 폴더 목록은 색인(manifest)으로 — 렌더링 때는 디렉터리를 읽지 않음 (아래 "이미지 목록 색인")
+# ---------------------------------------------------------------------
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+DERIVED_DIR = ".derived"
+DERIVED_WIDTHS = tuple(int(w) for w in os.getenv("MANUAL_IMAGE_WIDTHS", "320,640,1280").split(","))
+DERIVED_FORMATS = {
+    # 형식: (MIME, 저장 옵션) — <source> 순서대로 (브라우저는 먼저 맞는 것을 사용)
+    "avif": ("image/avif", {"quality": 55, "speed": 6}),
+    "webp": ("image/webp", {"quality": 80, "method": 4}),
+}
+IMAGE_WORKERS = int(os.getenv("MANUAL_IMAGE_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 카드 폭: col-12 / col-md-6 / col-lg-4
+IMAGE_SIZES = "(min-width: 992px) 33vw, (min-width: 768px) 50vw, 100vw"
+
+# 용도별 풀: 업로드 검증(요청이 기다림)이 오래 걸리는 파생본 생성 뒤에 줄 서지 않도록 분리
+_image_pools = {}
+_image_pools_lock = threading.Lock()
+
+def _image_executor(kind: str = "derive") -> ThreadPoolExecutor:
+    with _image_pools_lock:
+        if kind not in _image_pools:
+            _image_pools[kind] = ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix=f"manual-{kind}")
+        return _image_pools[kind]
+
+def enabled_formats() -> list:
+    """이 Pillow 빌드가 인코딩할 수 있는 파생 형식 (MANUAL_IMAGE_FORMATS 로 제한 가능)"""
+    from PIL import features
+
+    wanted = os.getenv("MANUAL_IMAGE_FORMATS", ",".join(DERIVED_FORMATS)).split(",")
+    return [fmt for fmt in DERIVED_FORMATS if fmt in wanted and features.check(fmt)]
+
+def is_image_name(name: str) -> bool:
+    return not name.startswith(".") and os.path.splitext(name)[1].lower() in IMAGE_EXTS
+
+def derived_name(name: str, width: int, fmt: str) -> str:
+    return f"{os.path.splitext(name)[0]}.{width}w.{fmt}"
+
+def target_widths(width: int) -> list:
+    """원본보다 작은 폭만 (원본이 가장 작은 폭보다 좁으면 원본 폭 하나)"""
+    return [w for w in DERIVED_WIDTHS if w < width] or [width]
+
+def _prepare(img):
+    from PIL import ImageOps
+
+    img = ImageOps.exif_transpose(img)  # 휴대폰 사진 회전 정보 반영
+    if img.mode in ("P", "LA", "PA"):
+        img = img.convert("RGBA")
+    elif img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+    return img
+
+def make_derivatives(src_path: str, formats: list = None) -> list:
+    """원본 1장 → 폭/형식별 파생본 생성 (이미 최신이면 건너뜀), 생성한 파일 경로 목록"""
+    from PIL import Image
+
+    formats = enabled_formats() if formats is None else formats
+    out_dir = os.path.join(os.path.dirname(src_path), DERIVED_DIR)
+    name = os.path.basename(src_path)
+    src_mtime = os.stat(src_path).st_mtime_ns
+
+    with Image.open(src_path) as opened:
+        if getattr(opened, "is_animated", False):
+            return []  # 움직이는 GIF/WebP 는 원본 그대로 사용
+        widths = target_widths(opened.width)
+        todo = [(w, fmt) for w in widths for fmt in formats
+                if not _is_fresh(os.path.join(out_dir, derived_name(name, w, fmt)), src_mtime)]
+        if not todo:
+            return []
+        img = _prepare(opened)
+
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for w in sorted({w for w, _ in todo}, reverse=True):
+        resized = img if w >= img.width else img.resize((w, round(img.height * w / img.width)), Image.LANCZOS)
+        for fmt in (f for tw, f in todo if tw == w):
+            path = os.path.join(out_dir, derived_name(name, w, fmt))
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            resized.save(tmp_path, format=fmt.upper(), **DERIVED_FORMATS[fmt][1])
+            os.replace(tmp_path, path)
+            written.append(path)
+        img = resized  # 다음(더 작은) 폭은 이미 줄인 이미지에서
+    return written
+
+def _is_fresh(path: str, src_mtime: int) -> bool:
+    try:
+        return os.stat(path).st_mtime_ns >= src_mtime
+    except FileNotFoundError:
+        return False
+
+def _derive_safely(src_path: str, index_dir: str = None):
+    try:
+        made = make_derivatives(src_path)
+        if made:
+            print(f"🖼 파생본 {len(made)}개: {os.path.basename(src_path)}")
+            if index_dir:
+                refresh_listing(os.path.dirname(src_path), index_dir)
+    except Exception as e:
+        print(f"[DERIVE ERROR] {src_path} -> {e}")
+
+def submit_derivatives(paths, index_dir: str = None) -> list:
+    """업로드한 원본들의 파생본 생성을 워커 풀에 맡김 (응답은 기다리지 않음, 끝나면 색인 갱신)"""
+    pool = _image_executor()
+    return [pool.submit(_derive_safely, p, index_dir) for p in paths]
+
+def remove_derivatives(src_path: str):
+    out_dir = os.path.join(os.path.dirname(src_path), DERIVED_DIR)
+    prefix = os.path.splitext(os.path.basename(src_path))[0] + "."
+    try:
+        names = os.listdir(out_dir)
+    except FileNotFoundError:
+        return
+    for fn in names:
+        if fn.startswith(prefix):
+            try:
+                os.remove(os.path.join(out_dir, fn))
+            except OSError:
+                pass
+
+def derived_variants(abs_dir: str) -> dict:
+    """폴더의 파생본 목록 → {원본 이름(확장자 제외): {형식: [(폭, 파일명), ...]}}"""
+    try:
+        with os.scandir(os.path.join(abs_dir, DERIVED_DIR)) as it:
+            return _parse_variants(e.name for e in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+def _parse_variants(names) -> dict:
+    variants = {}
+    for fn in names:
+        parts = fn.rsplit(".", 2)  # <stem>.<폭>w.<형식>
+        if len(parts) != 3 or parts[2] not in DERIVED_FORMATS or not parts[1].endswith("w"):
+            continue
+        try:
+            width = int(parts[1][:-1])
+        except ValueError:
+            continue
+        variants.setdefault(parts[0], {}).setdefault(parts[2], []).append((width, fn))
+    return variants
+
+def image_entry(url_for_static, rel_dir: str, name: str, variants: dict) -> dict:
+    """
+    템플릿용 이미지 정보
+    - src: 원본 URL / thumb: 가장 작은 파생본 (없으면 원본)
+    - sources: [(MIME, srcset)] — <picture><source> 용
+    """
+    src = url_for_static(f"{rel_dir}/{name}")
+    sources, thumb = [], None
+    for fmt, by_width in (variants.get(os.path.splitext(name)[0]) or {}).items():
+        by_width = sorted(by_width)
+        sources.append((DERIVED_FORMATS[fmt][0], ", ".join(
+            f"{url_for_static(f'{rel_dir}/{DERIVED_DIR}/{fn}')} {w}w" for w, fn in by_width
+        )))
+        if fmt == "webp" or thumb is None:
+            thumb = url_for_static(f"{rel_dir}/{DERIVED_DIR}/{by_width[0][1]}")
+    sources.sort(key=lambda s: list(DERIVED_FORMATS).index(s[0].split("/")[1]))
+    return {"src": src, "thumb": thumb or src, "sources": sources}
+
+def pending_images(static_root: str) -> list:
+    """static/manual 아래 파생본이 없거나 오래된 원본 경로 (일괄 생성용)"""
+    formats = enabled_formats()
+    found = []
+    for dirpath, dirnames, filenames in os.walk(os.path.join(static_root, "manual")):
+        dirnames[:] = [d for d in dirnames if d != DERIVED_DIR]
+        variants = derived_variants(dirpath)
+        for fn in filenames:
+            if not is_image_name(fn):
+                continue
+            have = variants.get(os.path.splitext(fn)[0]) or {}
+            if any(fmt not in have for fmt in formats) or any(
+                not _is_fresh(os.path.join(dirpath, DERIVED_DIR, vfn), os.stat(os.path.join(dirpath, fn)).st_mtime_ns)
+                for entries in have.values() for _, vfn in entries
+            ):
+                found.append(os.path.join(dirpath, fn))
+    return found
+
+
+# ---------------------------------------------------------------------
+# 이미지 목록 색인 (폴더별 manifest)
+#  - <index_dir>/<폴더 경로 해시>.json = {key, images, derived}
+#  - key = (폴더 mtime_ns, .derived mtime_ns): 파일 추가/삭제/이름변경 시 바뀜
+#  - 조회: 메모리 → (TTL 지나면) stat 2번으로 key 비교 → 다를 때만 scandir 후 manifest 재작성
+#  - 업로드/삭제/파생본 생성 직후 refresh_listing → 다음 렌더링은 디렉터리 읽기 0회
+#  - manifest 는 static 밖(instance)에 둔다: 폴더 안에 쓰면 그 쓰기가 다시 mtime 을 바꿈
+#  - 스캔 직전 2초 안에 바뀐 폴더는 mtime 해상도(네트워크 볼륨은 1~2초) 때문에 믿지 않고 다음에 다시 스캔
+# ---------------------------------------------------------------------
+LISTING_CHECK_SECONDS = float(os.getenv("MANUAL_CACHE_CHECK_SECONDS", "1.0"))
+LISTING_RACY_NS = 2_000_000_000
+
+_listings = {}  # abs_dir → {"key", "images", "variants", "checked"}
+_listings_lock = threading.Lock()
+
+def _listing_key(abs_dir: str):
+    """폴더가 없으면 None"""
+    try:
+        dir_mtime = os.stat(abs_dir).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    try:
+        derived_mtime = os.stat(os.path.join(abs_dir, DERIVED_DIR)).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        derived_mtime = 0
+    return [dir_mtime, derived_mtime]
+
+def _manifest_path(abs_dir: str, index_dir: str) -> str:
+    digest = hashlib.sha1(os.path.abspath(abs_dir).encode("utf-8")).hexdigest()[:20]
+    return os.path.join(index_dir, f"{digest}.json")
+
+def _scan_listing(abs_dir: str, key) -> dict:
+    """key 는 scandir 전에 잰 값 — 스캔 중에 바뀌면 다음 조회에서 다시 스캔"""
+    with os.scandir(abs_dir) as it:
+        images = sorted(e.name for e in it if is_image_name(e.name) and e.is_file())
+    try:
+        with os.scandir(os.path.join(abs_dir, DERIVED_DIR)) as it:
+            derived = sorted(e.name for e in it)
+    except (FileNotFoundError, NotADirectoryError):
+        derived = []
+    return {"dir": abs_dir, "key": key, "scanned": time.time_ns(), "images": images, "derived": derived}
+
+def _trusted(manifest: dict) -> bool:
+    return manifest.get("scanned", 0) - max(manifest["key"]) >= LISTING_RACY_NS
+
+def _write_manifest(path: str, manifest: dict):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".index.", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _read_manifest(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+def _remember_listing(abs_dir: str, manifest: dict) -> tuple:
+    entry = {
+        "key": manifest["key"], "trusted": _trusted(manifest), "images": manifest["images"],
+        "variants": _parse_variants(manifest["derived"]), "checked": time.monotonic(),
+    }
+    with _listings_lock:
+        _listings[abs_dir] = entry
+    return entry["images"], entry["variants"]
+
+def _remember_missing(abs_dir: str) -> tuple:
+    """없는 폴더도 기억 (blob 만 쓰는 폴더는 실제 디렉터리가 없음) → TTL 안에서는 stat 도 안 함"""
+    with _listings_lock:
+        _listings[abs_dir] = {"key": None, "trusted": True, "images": [], "variants": {},
+                              "checked": time.monotonic()}
+    return [], {}
+
+def refresh_listing(abs_dir: str, index_dir: str) -> tuple:
+    """폴더를 다시 읽어 manifest 갱신 (업로드/삭제/파생본 생성 후 호출)"""
+    abs_dir = os.path.normpath(abs_dir)
+    key = _listing_key(abs_dir)
+    if key is None:
+        return _remember_missing(abs_dir)
+    manifest = _scan_listing(abs_dir, key)
+    try:
+        _write_manifest(_manifest_path(abs_dir, index_dir), manifest)
+    except OSError as e:
+        print(f"[INDEX ERROR] {abs_dir} -> {e}")  # 색인 실패해도 목록은 돌려줌
+    return _remember_listing(abs_dir, manifest)
+
+def image_listing(abs_dir: str, index_dir: str) -> tuple:
+    """폴더의 (원본 이미지 이름 목록, 파생본 variants) — 바뀐 게 없으면 디렉터리를 읽지 않음"""
+    abs_dir = os.path.normpath(abs_dir)
+    now = time.monotonic()
+    with _listings_lock:
+        entry = _listings.get(abs_dir)
+        if entry and now - entry["checked"] < LISTING_CHECK_SECONDS:
+            return entry["images"], entry["variants"]
+
+    key = _listing_key(abs_dir)
+    if key is None:
+        return _remember_missing(abs_dir)
+    if entry and entry["key"] == key and entry["trusted"]:
+        entry["checked"] = now
+        return entry["images"], entry["variants"]
+
+    manifest = _read_manifest(_manifest_path(abs_dir, index_dir))
+    if manifest and manifest.get("key") == key and manifest.get("dir") == abs_dir and _trusted(manifest):
+        return _remember_listing(abs_dir, manifest)
+    return refresh_listing(abs_dir, index_dir)
+
+
+# ---------------------------------------------------------------------
+# 내용 주소(SHA-256) 저장소
+#  - 원본은 static/manual/blobs/<sha256>.<ext> 하나만 (같은 사진을 여러 폴더에 올려도 1개)
+#  - 폴더는 manual_data.json 의 image_dirs 에만 존재:
+#        "image_dirs": {"manual/ladder": {"files": ["<sha256>.jpg", ...], "updated": <epoch>}}
+#  - 참조 수 = 살아 있는 폴더(항목의 images_dir 이 가리키거나, 항목 저장 전 업로드 유예 중)의 files 등장 횟수
+#  - 참조 0 인 blob 은 GC 가 파생본과 함께 삭제 — blob 배치/참조 추가/GC 는 모두 메뉴얼 잠금 안에서
+# ---------------------------------------------------------------------
+BLOB_DIR = "blobs"
+# 업로드만 하고 항목을 아직 저장하지 않은 폴더 / 중단된 업로드 임시 파일을 지우기 전 유예
+IMAGE_GC_GRACE_SECONDS = int(os.getenv("MANUAL_IMAGE_GC_GRACE_SECONDS", str(24 * 3600)))
+_EXT_ALIASES = {".jpeg": ".jpg"}
+
+def normalize_image_dir(rel_dir: str) -> str:
+    return (rel_dir or "").strip().replace("\\", "/").strip("/")
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def blob_name(digest: str, ext: str) -> str:
+    ext = ext.lower()
+    return digest + _EXT_ALIASES.get(ext, ext)
+
+def place_blob(blob_dir: str, tmp_path: str, name: str) -> bool:
+    """임시 파일 → blobs/<name> (같은 내용이 이미 있으면 임시 파일만 삭제), 새로 만들었으면 True"""
+    final = os.path.join(blob_dir, name)
+    if os.path.exists(final):
+        os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, final)
+    return True
+
+def add_image_refs(manual: dict, rel_dir: str, names: list, prepend: bool = False):
+    """폴더에 blob 추가 (같은 폴더에 같은 내용은 한 번만)"""
+    entry = manual.setdefault("image_dirs", {}).setdefault(normalize_image_dir(rel_dir), {"files": []})
+    new = [n for n in dict.fromkeys(names) if n not in entry["files"]]
+    entry["files"] = new + entry["files"] if prepend else entry["files"] + new
+    entry["updated"] = int(time.time())
+
+def remove_image_ref(manual: dict, rel_dir: str, name: str) -> bool:
+    entry = (manual.get("image_dirs") or {}).get(normalize_image_dir(rel_dir))
+    if not entry or name not in entry["files"]:
+        return False
+    entry["files"].remove(name)
+    entry["updated"] = int(time.time())
+    return True
+
+def attached_image_dirs(manual: dict) -> set:
+    return {
+        normalize_image_dir(item.get("images_dir"))
+        for sec in manual.get("sections", []) for item in sec.get("items", [])
+        if item.get("images_dir")
+    }
+
+def drop_dead_image_dirs(manual: dict, now: float = None) -> list:
+    """어느 항목도 가리키지 않고 유예도 지난 폴더를 image_dirs 에서 제거, 제거한 폴더 목록"""
+    now = now or time.time()
+    image_dirs = manual.get("image_dirs") or {}
+    attached = attached_image_dirs(manual)
+    dead = [d for d, entry in image_dirs.items()
+            if d not in attached and now - entry.get("updated", 0) >= IMAGE_GC_GRACE_SECONDS]
+    for d in dead:
+        del image_dirs[d]
+    return dead
+
+def image_refcounts(manual: dict) -> Counter:
+    """blob 이름 → 참조 수 (drop_dead_image_dirs 뒤에 남은 폴더 기준)"""
+    return Counter(name for entry in (manual.get("image_dirs") or {}).values() for name in entry["files"])
+
+def orphan_blobs(blob_dir: str, refs: Counter, now: float = None) -> list:
+    """참조 0 인 blob + 유예가 지난 업로드 임시 파일"""
+    now = now or time.time()
+    orphans = []
+    try:
+        with os.scandir(blob_dir) as it:
+            for e in it:
+                if not e.is_file():
+                    continue
+                if is_image_name(e.name):
+                    if not refs[e.name]:
+                        orphans.append(e.name)
+                elif e.name.startswith(".upload.") and now - e.stat().st_mtime >= IMAGE_GC_GRACE_SECONDS:
+                    orphans.append(e.name)
+    except FileNotFoundError:
+        pass
+    return sorted(orphans)
+
+def remove_blob(blob_dir: str, name: str) -> int:
+    """blob 과 파생본 삭제, 지운 원본 바이트 수"""
+    path = os.path.join(blob_dir, name)
+    try:
+        size = os.path.getsize(path)
+        os.remove(path)
+    except FileNotFoundError:
+        size = 0
+    remove_derivatives(path)
+    return size
+
+def adopt_folder(abs_dir: str, blob_dir: str) -> list:
+    """
+    기존 폴더(uuid 파일명)의 이미지를 blob 으로 옮기고 blob 이름 목록 반환 (폴더 순서 유지)
+    - 중복 내용은 원본만 삭제, 폴더의 파생본도 삭제 (blob 쪽 파생본을 다시 생성)
+    """
+    os.makedirs(blob_dir, exist_ok=True)
+    names = []
+    for fn in sorted(os.listdir(abs_dir)):
+        src = os.path.join(abs_dir, fn)
+        if not is_image_name(fn) or not os.path.isfile(src):
+            continue
+        name = blob_name(hash_file(src), os.path.splitext(fn)[1])
+        place_blob(blob_dir, src, name)
+        remove_derivatives(src)
+        names.append(name)
+    for d in (os.path.join(abs_dir, DERIVED_DIR), abs_dir):
+        try:
+            os.rmdir(d)  # 비었을 때만
+        except OSError:
+            pass
+    return names
+
+
+# ---------------------------------------------------------------------
+# 업로드 스트리밍 저장
+#  - request.files 를 쓰면 werkzeug 가 본문 전체를 먼저 파싱(500KB 넘는 파일은 임시 파일로 복사)한 뒤에야
+#    저장이 시작됨 → 대신 multipart 본문을 청크 단위로 읽으면서 blobs/ 임시 파일에 바로 기록
+#  - 쓰는 동안 SHA-256 계산 + 앞 12바이트 시그니처로 형식 판별 (파일 이름의 확장자는 믿지 않음)
+#  - 파일당 / 요청당 크기 제한, 메모리는 청크 크기 정도만 사용
+# ---------------------------------------------------------------------
+IMAGE_MAX_BYTES = int(float(os.getenv("MANUAL_IMAGE_MAX_MB", "25")) * 1024 * 1024)
+UPLOAD_MAX_BYTES = int(float(os.getenv("MANUAL_UPLOAD_MAX_MB", "256")) * 1024 * 1024)
+UPLOAD_CHUNK = 256 * 1024
+UPLOAD_FIELD_MAX = 64 * 1024  # 파일이 아닌 폼 필드(target_dir 등)
+UPLOAD_MAX_PARTS = 1000
+
+_MAGIC = [
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+]
+
+def sniff_image(head: bytes):
+    """파일 앞부분 → 확장자 (.jpg/.png/.gif/.webp), 이미지가 아니면 None"""
+    for magic, ext in _MAGIC:
+        if head.startswith(magic):
+            return ext
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    return None
+
+class UploadError(ValueError):
+    """multipart 본문이 잘렸거나 형식이 잘못됨"""
+
+def _open_upload_part(filename: str, blob_dir: str) -> dict:
+    fd, path = tempfile.mkstemp(prefix=".upload.", suffix=".tmp", dir=blob_dir)
+    return {"filename": filename, "fh": os.fdopen(fd, "wb"), "path": path,
+            "sha": hashlib.sha256(), "head": b"", "size": 0, "error": None}
+
+def _discard_upload_part(part: dict):
+    if part.get("fh"):
+        part["fh"].close()
+        part["fh"] = None
+    try:
+        os.remove(part["path"])
+    except OSError:
+        pass
+
+def _feed_upload_part(part: dict, data: bytes, max_file_bytes: int):
+    if "field" in part:
+        part["buf"] += data
+        if len(part["buf"]) > UPLOAD_FIELD_MAX:
+            raise UploadError(f"폼 필드가 너무 큽니다: {part['field']}")
+        return
+    if part.get("fh") is None:  # 건너뛰는 파트 / 이미 거절
+        return
+    part["size"] += len(data)
+    if part["size"] > max_file_bytes:
+        part["error"] = f"파일이 너무 큽니다 (최대 {max_file_bytes // (1024 * 1024)} MB)"
+        _discard_upload_part(part)
+        return
+    if len(part["head"]) < 12:
+        part["head"] += data[:12 - len(part["head"])]
+    part["sha"].update(data)
+    part["fh"].write(data)
+
+def _close_upload_part(part: dict, files: list, fields: dict, rejected: list):
+    if "field" in part:
+        fields[part["field"]] = part["buf"].decode("utf-8", "replace")
+        return
+    if part["error"]:
+        rejected.append((part["filename"], part["error"]))
+        return
+    if part.get("fh") is None:
+        return
+    part["fh"].close()
+    part["fh"] = None
+    ext = sniff_image(part["head"])
+    if ext is None:
+        _discard_upload_part(part)
+        rejected.append((part["filename"], "이미지 파일이 아닙니다 (jpg/png/gif/webp)"))
+        return
+    files.append((part["path"], blob_name(part["sha"].hexdigest(), ext), part["filename"]))
+
+def stream_image_upload(stream, boundary: bytes, blob_dir: str, field: str = "files[]",
+                        max_file_bytes: int = IMAGE_MAX_BYTES) -> tuple:
+    """
+    multipart 본문 → blobs/ 임시 파일 (한 번 읽고 한 번 씀)
+    - 반환: (files [(임시 경로, blob 이름, 원래 이름)], fields {이름: 값}, rejected [(원래 이름, 사유)])
+    - 예외(요청 크기 초과, 잘린 본문 등)가 나면 만든 임시 파일을 모두 지우고 다시 던짐
+    """
+    from werkzeug.sansio.multipart import Data, Epilogue, Field, File, MultipartDecoder, NeedData
+
+    # max_form_memory_size 는 디코더 내부 버퍼 한도 (읽은 청크가 그대로 들어감)
+    decoder = MultipartDecoder(boundary, max_form_memory_size=2 * UPLOAD_CHUNK, max_parts=UPLOAD_MAX_PARTS)
+    files, fields, rejected = [], {}, []
+    part = None
+    try:
+        done = False
+        while not done:
+            chunk = stream.read(UPLOAD_CHUNK)
+            decoder.receive_data(chunk or None)
+            event = decoder.next_event()
+            while not isinstance(event, NeedData):
+                if isinstance(event, Field):
+                    part = {"field": event.name, "buf": bytearray()}
+                elif isinstance(event, File):
+                    if event.name == field and event.filename:
+                        part = _open_upload_part(event.filename, blob_dir)
+                    else:
+                        part = {"fh": None, "error": None}
+                elif isinstance(event, Data):
+                    _feed_upload_part(part, event.data, max_file_bytes)
+                    if not event.more_data:
+                        _close_upload_part(part, files, fields, rejected)
+                        part = None
+                elif isinstance(event, Epilogue):
+                    done = True
+                    break
+                event = decoder.next_event()
+            if not chunk and not done:
+                raise UploadError("업로드가 중간에 끊겼습니다")
+    except BaseException:
+        if part and "path" in part:
+            _discard_upload_part(part)
+        for path, _, _ in files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        raise
+    return files, fields, rejected
+
+def verify_image(path: str):
+    """끝까지 디코딩해서 확인 (잘린 파일, 해상도 폭탄 포함) → 오류 메시지, 정상이면 None"""
+    from PIL import Image
+
+    try:
+        with Image.open(path) as img:
+            # JPEG 은 1/8 크기로 디코딩 (verify() 는 JPEG 데이터를 읽지 않아 잘린 파일을 못 잡음)
+            img.draft("RGB", (max(1, img.width // 8), max(1, img.height // 8)))
+            img.load()
+    except Image.DecompressionBombError:
+        return "해상도가 너무 큽니다"
+    except Exception as e:
+        return f"손상된 이미지입니다 ({e.__class__.__name__})"
+    return None
+
+def verify_images(paths: list) -> list:
+    """업로드한 파일들을 검증 풀에서 동시에 확인, paths 순서대로 결과"""
+    if len(paths) < 2:
+        return [verify_image(p) for p in paths]
+    return list(_image_executor("verify").map(verify_image, paths))
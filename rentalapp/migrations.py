@@ -0,0 +1,556 @@
+# rentalapp/migrations.py
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from .db import engine, is_postgres, now_kst_str
+from .search import create_search_index, rebuild_search_index, SEARCH_INDEXES
+
+# ---------------------------------------------------------------------
+# 스키마 마이그레이션 (기동 시 1회, schema_version 기준)
+# ---------------------------------------------------------------------
+def _m001_base_schema(conn):
+    """필요한 테이블 및 부족한 컬럼 보장 (SQLite / PostgreSQL 모두 지원)"""
+    # 게시판
+    if is_postgres():
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS board (
+                id          INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                title       TEXT NOT NULL,
+                content     TEXT,
+                created_at  TIMESTAMP DEFAULT NOW(),
+                category    TEXT DEFAULT '공지',
+                is_pinned   INTEGER DEFAULT 0,
+                board_type  TEXT DEFAULT 'general'
+            )
+        """))
+        conn.execute(text("ALTER TABLE board ADD COLUMN IF NOT EXISTS category TEXT DEFAULT '공지'"))
+        conn.execute(text("ALTER TABLE board ADD COLUMN IF NOT EXISTS is_pinned INTEGER DEFAULT 0"))
+        conn.execute(text("ALTER TABLE board ADD COLUMN IF NOT EXISTS board_type TEXT DEFAULT 'general'"))
+    else:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS board (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                content TEXT,
+                created_at TEXT DEFAULT (datetime('now','localtime'))
+            )
+        """))
+        for col_sql in [
+            "ALTER TABLE board ADD COLUMN category TEXT DEFAULT '공지'",
+            "ALTER TABLE board ADD COLUMN is_pinned INTEGER DEFAULT 0",
+            "ALTER TABLE board ADD COLUMN board_type TEXT DEFAULT 'general'",
+        ]:
+            try:
+                conn.execute(text(col_sql))
+            except Exception:
+                pass
+
+    # 일정
+    if is_postgres():
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schedules (
+                id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                title TEXT NOT NULL,
+                start TEXT,
+                "end" TEXT,
+                note  TEXT
+            )
+        """))
+    else:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schedules (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                start TEXT,
+                end   TEXT,
+                note  TEXT
+            )
+        """))
+
+    # 협력업체 주소록(회사)
+    if is_postgres():
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS companies (
+                id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                name TEXT NOT NULL,
+                manager TEXT,
+                phone TEXT,
+                group_name TEXT,
+                created_at TIMESTAMP DEFAULT NOW(),
+                memo TEXT
+            )
+        """))
+    else:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS companies (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                manager TEXT,
+                phone TEXT,
+                group_name TEXT,
+                created_at TEXT DEFAULT (datetime('now','localtime')),
+                memo TEXT
+            )
+        """))
+
+    # 사내 주소록(Employees / Departments / Ranks)
+    if is_postgres():
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS departments (
+                id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+        """))
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS ranks (
+                id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+        """))
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS employees (
+                id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                name TEXT NOT NULL,
+                phone TEXT,
+                email TEXT,
+                dept_id INTEGER,
+                rank_id INTEGER,
+                created_at TIMESTAMP DEFAULT NOW()
+            )
+        """))
+        for col in ("userid", "password", "department", "position"):
+            conn.execute(text(f"ALTER TABLE employees ADD COLUMN IF NOT EXISTS {col} TEXT"))
+    else:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS departments (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE
+            )
+        """))
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS ranks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE
+            )
+        """))
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS employees (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                phone TEXT,
+                email TEXT,
+                dept_id INTEGER,
+                rank_id INTEGER,
+                created_at TEXT DEFAULT (datetime('now','localtime'))
+            )
+        """))
+        for col in ("userid", "password", "department", "position"):
+            try:
+                conn.execute(text(f"ALTER TABLE employees ADD COLUMN {col} TEXT"))
+            except Exception:
+                pass
+
+    # 장비 재고(묶음)
+    if is_postgres():
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS equipment (
+                id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                item_name TEXT NOT NULL,
+                model_name TEXT NOT NULL,
+                category TEXT,
+                location TEXT,
+                total_qty INTEGER DEFAULT 0,
+                available_qty INTEGER DEFAULT 0
+            )
+        """))
+    else:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS equipment (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                item_name TEXT NOT NULL,
+                model_name TEXT NOT NULL,
+                category TEXT,
+                location TEXT,
+                total_qty INTEGER DEFAULT 0,
+                available_qty INTEGER DEFAULT 0
+            )
+        """))
+
+    # 개별 장비(단말)
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS walkie_talkie_units (
+            unit_no TEXT PRIMARY KEY,
+            serial_no TEXT NOT NULL,
+            item_name TEXT
+        )
+    """))
+    if is_postgres():
+        conn.execute(text("ALTER TABLE walkie_talkie_units ADD COLUMN IF NOT EXISTS bundle_id INTEGER"))
+        conn.execute(text("ALTER TABLE walkie_talkie_units ADD COLUMN IF NOT EXISTS model_name TEXT"))
+    else:
+        for col_sql in [
+            "ALTER TABLE walkie_talkie_units ADD COLUMN bundle_id INTEGER",
+            "ALTER TABLE walkie_talkie_units ADD COLUMN model_name TEXT",
+        ]:
+            try:
+                conn.execute(text(col_sql))
+            except Exception:
+                pass
+
+    # 대여기록
+    if is_postgres():
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS rental (
+                id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                user_name TEXT,
+                dept TEXT,
+                phone TEXT,
+                start_date TEXT,
+                end_date TEXT,
+                signature TEXT,
+                serial_no TEXT,
+                qty INTEGER DEFAULT 1,
+                rental_date TEXT,
+                status TEXT DEFAULT 'rented',
+                unit_no TEXT
+            )
+        """))
+    else:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS rental (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_name TEXT,
+                dept TEXT,
+                phone TEXT,
+                start_date TEXT,
+                end_date TEXT,
+                signature TEXT,
+                serial_no TEXT,
+                qty INTEGER DEFAULT 1,
+                rental_date TEXT,
+                status TEXT DEFAULT 'rented',
+                unit_no TEXT
+            )
+        """))
+
+    # 반납 로그
+    if is_postgres():
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS returns_log (
+                id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                rental_id INTEGER NOT NULL,
+                dept TEXT NOT NULL,
+                returner_name TEXT,
+                returner_phone TEXT,
+                returned_at TEXT NOT NULL,
+                FOREIGN KEY (rental_id) REFERENCES rental(id)
+            )
+        """))
+    else:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS returns_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                rental_id INTEGER NOT NULL,
+                dept TEXT NOT NULL,
+                returner_name TEXT,
+                returner_phone TEXT,
+                returned_at TEXT NOT NULL,
+                FOREIGN KEY (rental_id) REFERENCES rental(id)
+            )
+        """))
+
+    # 🧩 오늘의 할 일 (To-Do)
+    if is_postgres():
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS todos (
+                id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                user_name TEXT NOT NULL,
+                content TEXT NOT NULL,
+                status TEXT DEFAULT '진행',
+                created_at TEXT
+            )
+        """))
+    else:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS todos (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_name TEXT NOT NULL,
+                content TEXT NOT NULL,
+                status TEXT DEFAULT '진행',
+                created_at TEXT DEFAULT (datetime('now','localtime'))
+            )
+        """))
+
+    # 근무자
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS shifts (
+            day TEXT PRIMARY KEY,
+            name TEXT NOT NULL
+        )
+    """))
+
+def normalize_rental_rows(conn):
+    """
+    기존 대여기록 정규화 (status 소문자, unit_no 공백 제거 + 단말 테이블 표기로 통일)
+    - 이후 조회는 LOWER()/TRIM(UPPER()) 없이 r.unit_no = u.unit_no, status = 'rented'
+    """
+    conn.execute(text("""
+        UPDATE rental SET status = LOWER(TRIM(status))
+         WHERE status <> LOWER(TRIM(status))
+    """))
+    conn.execute(text("""
+        UPDATE rental SET unit_no = TRIM(unit_no)
+         WHERE unit_no <> TRIM(unit_no)
+    """))
+    conn.execute(text("""
+        UPDATE rental
+           SET unit_no = (SELECT u.unit_no FROM walkie_talkie_units u
+                           WHERE UPPER(u.unit_no) = UPPER(rental.unit_no))
+         WHERE unit_no NOT IN (SELECT unit_no FROM walkie_talkie_units)
+           AND EXISTS (SELECT 1 FROM walkie_talkie_units u
+                        WHERE UPPER(u.unit_no) = UPPER(rental.unit_no))
+    """))
+
+def duplicate_active_rentals(conn) -> list:
+    """같은 단말이 2건 이상 대여중인 행 [(unit_no, id, user_name, dept, rental_date), ...]"""
+    return conn.execute(text("""
+        SELECT unit_no, id, user_name, dept, rental_date
+          FROM rental
+         WHERE status = 'rented'
+           AND unit_no IN (SELECT unit_no FROM rental
+                            WHERE status = 'rented' AND unit_no IS NOT NULL
+                            GROUP BY unit_no HAVING COUNT(*) > 1)
+         ORDER BY unit_no, id
+    """)).all()
+
+def _m002_rental_reservation(conn):
+    """
+    대여기록 정규화 + 대여중 단말 유일 인덱스
+    - uq_rental_active_unit: 대여중(status='rented') 단말은 unit_no 당 1건만 허용
+      → 동시에 두 키오스크가 같은 단말을 대여해도 한 쪽 INSERT만 성공
+    - 대여 완료는 이 인덱스의 ON CONFLICT 에 의존 → 만들 수 없으면 기동 실패
+      (기존 데이터에 중복 대여중 행이 있으면 목록을 출력 → 반납 처리 후 재기동)
+    """
+    normalize_rental_rows(conn)
+    duplicates = duplicate_active_rentals(conn)
+    if duplicates:
+        lines = "\n".join(
+            f"  - {unit_no}: rental.id={rid} {user or '-'} / {dept or '-'} / {date or '-'}"
+            for unit_no, rid, user, dept, date in duplicates
+        )
+        raise RuntimeError(
+            f"대여중 중복 행 {len(duplicates)}건 — 한 단말에 1건만 남기고 반납 처리 후 재기동하세요\n{lines}"
+        )
+    conn.execute(text("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_rental_active_unit
+            ON rental (unit_no) WHERE status = 'rented'
+    """))
+
+def _m003_unit_state(conn):
+    """
+    단말별 현재 대여상태(unit_state) — 이후 대여/반납 트랜잭션에서 함께 갱신
+    - 행이 있으면 대여중, 없으면 가용 → 가용 조회는 PK 탐색, 집계는 COUNT(unit_state)
+    - 생성 시 rental의 대여중 행으로 채움
+    """
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS unit_state (
+            unit_no   TEXT PRIMARY KEY,
+            rental_id INTEGER NOT NULL,
+            user_name TEXT,
+            dept      TEXT,
+            phone     TEXT,
+            since     TEXT
+        )
+    """))
+    conn.execute(text("DELETE FROM unit_state"))
+    conn.execute(text("""
+        INSERT INTO unit_state (unit_no, rental_id, user_name, dept, phone, since)
+        SELECT unit_no, id, user_name, dept, phone, rental_date
+          FROM rental
+         WHERE id IN (SELECT MAX(id) FROM rental
+                       WHERE status = 'rented' AND unit_no IS NOT NULL
+                       GROUP BY unit_no)
+    """))
+
+# 조회 경로별 인덱스 (이름, 테이블, 컬럼) — 추가/변경은 여기서만
+INDEXES = [
+    ("idx_rental_dept_status",  "rental",              "dept, status"),        # 반납 목록 / 일괄 반납
+    ("idx_rental_unit_status",  "rental",              "unit_no, status"),     # 단말별 대여상태, 대여 완료
+    ("idx_rental_status_end",   "rental",              "status, end_date"),    # 대여/반납 현황
+    ("idx_returns_log_rental",  "returns_log",         "rental_id"),
+    ("idx_unit_state_rental",   "unit_state",          "rental_id"),           # 반납 시 unit_state 정리
+    ("idx_board_type_pin",      "board",               "board_type, is_pinned, id"),  # 게시판 목록
+    ("idx_board_pin",           "board",               "is_pinned, id"),       # 전체 게시판 / 관리자 메뉴
+    ("idx_units_bundle",        "walkie_talkie_units", "bundle_id"),           # 묶음별 단말
+    ("idx_todos_user_status",   "todos",               "user_name, status"),   # 오늘의 할 일
+    ("idx_jobs_status_updated", "jobs",                "status, updated_at"),  # 백그라운드 작업 정리
+]
+
+def create_indexes(conn, names=None):
+    for name, table, cols in INDEXES:
+        if names is None or name in names:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({cols})"))
+
+def _m004_indexes(conn):
+    create_indexes(conn, {name for name, table, _ in INDEXES if table != "jobs"})
+
+def _m006_search_index(conn):
+    """
+    게시판/주소록 한글 n-gram 검색 색인 (rentalapp/search.py)
+    - SQLite: FTS5 {table}_fts / PostgreSQL: {table}_search (tsvector + GIN)
+    """
+    for name in SEARCH_INDEXES:
+        create_search_index(conn, name)
+        rebuild_search_index(conn, name)
+
+def duplicate_companies(conn) -> list:
+    """연락처가 있는데 (업체명, 연락처)가 같은 행 [(name, phone, id, manager), ...]"""
+    return conn.execute(text("""
+        SELECT name, phone, id, manager
+          FROM companies c
+         WHERE phone <> ''
+           AND EXISTS (SELECT 1 FROM companies d
+                        WHERE d.name = c.name AND d.phone = c.phone AND d.id <> c.id)
+         ORDER BY name, phone, id
+    """)).all()
+
+def _check_duplicate_companies(conn):
+    duplicates = duplicate_companies(conn)
+    if duplicates:
+        lines = "\n".join(
+            f"  - {name} / {phone}: companies.id={cid} 담당자 {manager or '-'}"
+            for name, phone, cid, manager in duplicates
+        )
+        raise RuntimeError(
+            f"협력업체 (업체명, 연락처) 중복 {len(duplicates)}건 — 합치거나 지운 뒤 재기동하세요\n{lines}"
+        )
+
+def _m007_companies_unique(conn):
+    """
+    가져오기 upsert 기준 (name, phone) 유일 인덱스 — 연락처가 있는 행만
+    - 업체명 trim, 연락처는 clean_phone과 같게 정리 (NULL 은 그대로)
+    - 연락처가 없는 행은 같은 업체명이어도 담당자별 연락처로 따로 남음 (인덱스 대상 아님)
+    - (업체명, 연락처)까지 같은 행이 이미 있으면 지우지 않고 목록을 출력하며 실패 → 정리 후 재기동
+    """
+    conn.execute(text("""
+        UPDATE companies
+           SET name = TRIM(name),
+               phone = TRIM(REPLACE(phone, '-', ''))
+         WHERE name <> TRIM(name) OR phone <> TRIM(REPLACE(phone, '-', ''))
+    """))
+    _check_duplicate_companies(conn)
+    conn.execute(text("""
+        CREATE UNIQUE INDEX IF NOT EXISTS uq_companies_name_phone
+            ON companies (name, phone) WHERE phone <> ''
+    """))
+    rebuild_search_index(conn, "companies")
+
+def _m008_jobs(conn):
+    """백그라운드 작업 상태 (내보내기/가져오기) — 시각은 KST 문자열"""
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id          TEXT PRIMARY KEY,
+            kind        TEXT NOT NULL,
+            status      TEXT NOT NULL DEFAULT 'queued',
+            params      TEXT,
+            done        INTEGER DEFAULT 0,
+            total       INTEGER,
+            message     TEXT,
+            file_path   TEXT,
+            file_name   TEXT,
+            result      TEXT,
+            created_by  TEXT,
+            created_at  TEXT,
+            updated_at  TEXT
+        )
+    """))
+    create_indexes(conn, {"idx_jobs_status_updated"})
+
+def _m009_board_pin_not_null(conn):
+    """
+    board.is_pinned NULL → 0, 이후 NULL 금지 — 목록 커서 (is_pinned, id) < (...) 비교에서
+    NULL 행은 참/거짓 어느 쪽도 아니라 어느 페이지에도 안 나옴 (paging.keyset_query)
+    - PostgreSQL: NOT NULL 제약 / SQLite: 컬럼 제약을 못 붙여 INSERT·UPDATE 트리거로 거부
+    """
+    conn.execute(text("UPDATE board SET is_pinned = 0 WHERE is_pinned IS NULL"))
+    if is_postgres():
+        conn.execute(text("ALTER TABLE board ALTER COLUMN is_pinned SET DEFAULT 0"))
+        conn.execute(text("ALTER TABLE board ALTER COLUMN is_pinned SET NOT NULL"))
+        return
+    for event in ("INSERT", "UPDATE OF is_pinned"):
+        name = "board_pin_not_null_" + event.split()[0].lower()
+        conn.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS {name}
+            BEFORE {event} ON board
+            WHEN NEW.is_pinned IS NULL
+            BEGIN
+                SELECT RAISE(ABORT, 'NOT NULL constraint failed: board.is_pinned');
+            END
+        """))
+
+def _m010_company_phone_separators(conn):
+    """
+    협력업체 연락처의 공백/괄호/점도 제거 — clean_phone(PHONE_SEPARATORS)과 같은 규칙
+    - 정리 후 (업체명, 연락처)가 겹치면 007과 같이 목록을 출력하며 실패 → 정리 후 재기동
+    """
+    cleaned = "phone"
+    for ch in (" ", "(", ")", ".", "-"):
+        cleaned = f"REPLACE({cleaned}, '{ch}', '')"
+    conn.execute(text(f"UPDATE companies SET phone = {cleaned} WHERE phone <> {cleaned}"))
+    _check_duplicate_companies(conn)
+    rebuild_search_index(conn, "companies")
+
+def _m011_search_syllables(conn):
+    """
+    검색 색인에 음절(unigram) 추가 — 한 글자 검색이 단어 끝 음절도 찾게 (rentalapp/search.py)
+    - SQLite: FTS5 는 컬럼을 추가할 수 없어 {table}_fts 를 다시 만듦 / PostgreSQL: 다시 색인만
+    """
+    for name in SEARCH_INDEXES:
+        if not is_postgres():
+            conn.execute(text(f"DROP TABLE IF EXISTS {name}_fts"))
+        create_search_index(conn, name)
+        rebuild_search_index(conn, name)
+
+# (버전, 설명, 함수) — 적용된 버전은 schema_version에 기록, 번호는 재사용 금지
+# (5는 배포 전에 006으로 합친 게시판 단어 색인 — 비워 둠)
+MIGRATIONS = [
+    (1, "기본 스키마", _m001_base_schema),
+    (2, "대여중 단말 유일 인덱스", _m002_rental_reservation),
+    (3, "unit_state", _m003_unit_state),
+    (4, "조회 인덱스", _m004_indexes),
+    (6, "한글 n-gram 검색 색인", _m006_search_index),
+    (7, "협력업체 (업체명, 연락처) 유일 인덱스", _m007_companies_unique),
+    (8, "백그라운드 작업", _m008_jobs),
+    (9, "게시판 고정 여부 NOT NULL", _m009_board_pin_not_null),
+    (10, "협력업체 연락처 구분 문자 정리", _m010_company_phone_separators),
+    (11, "검색 색인 음절 추가", _m011_search_syllables),
+]
+
+def run_migrations(eng: Engine = None):
+    """
+    미적용 마이그레이션을 순서대로 실행 (기동 시 1회)
+    - 모든 마이그레이션은 재실행해도 안전하게 작성 (여러 워커 동시 기동 대비)
+    - 최신 상태면 SELECT 1회로 끝남 → 요청 경로에는 DDL 없음
+    """
+    eng = eng or engine
+    with eng.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version    INTEGER PRIMARY KEY,
+                name       TEXT,
+                applied_at TEXT
+            )
+        """))
+        applied = set(conn.execute(text("SELECT version FROM schema_version")).scalars().all())
+
+    for version, name, migrate in MIGRATIONS:
+        if version in applied:
+            continue
+        with eng.begin() as conn:
+            migrate(conn)
+            conn.execute(text("""
+                INSERT INTO schema_version (version, name, applied_at)
+                VALUES (:version, :name, :applied_at)
+                ON CONFLICT (version) DO NOTHING
+            """), {"version": version, "name": name, "applied_at": now_kst_str()})
+        print(f"🧱 마이그레이션 {version:03d} 적용: {name}")
@@ -0,0 +1,105 @@
+# rentalapp/paging.py
+import os, time, threading
+from sqlalchemy import text
+
+# ---------------------------------------------------------------------
+# 키셋(커서) 페이지네이션 — 처음/이전/다음/마지막 모두 OFFSET 없이 경계 행의 키로 조회
+# ---------------------------------------------------------------------
+def encode_cursor(*keys) -> str:
+    return ".".join(str(int(k or 0)) for k in keys)
+
+def decode_cursor(raw, size: int):
+    try:
+        keys = tuple(int(x) for x in (raw or "").split("."))
+    except ValueError:
+        return None
+    return keys if len(keys) == size else None
+
+def keyset_query(select_sql: str, where_clause: str, params: dict, key_cols: list,
+                 per_page: int, after=None, before=None, last: int = 0):
+    """
+    keyset_page 가 실행하는 SQL (check-plans 도 같은 문장을 EXPLAIN)
+    - 커서가 없으면 첫 페이지, last(>0)면 끝에서부터 last 행 (역순 키셋 — 마지막 페이지)
+    반환: (sql, params, cursor, backwards) — OFFSET 은 쓰지 않음
+    """
+    size = len(key_cols)
+    cursor = decode_cursor(after or before, size)
+    backwards = bool(cursor and not after) or bool(last and not cursor)
+    params = dict(params)
+
+    where = where_clause
+    if cursor:
+        op = ">" if backwards else "<"
+        cond = f"({', '.join(key_cols)}) {op} ({', '.join(f':_k{i}' for i in range(size))})"
+        params.update({f"_k{i}": v for i, v in enumerate(cursor)})
+        where = f"{where} AND {cond}" if where else f"WHERE {cond}"
+
+    order = ", ".join(f"{c} {'ASC' if backwards else 'DESC'}" for c in key_cols)
+    sql = f"{select_sql} {where} ORDER BY {order} LIMIT :_limit"
+    params["_limit"] = (last if last and not cursor else per_page) + 1
+    return sql, params, cursor, backwards
+
+def keyset_page(conn, select_sql: str, where_clause: str, params: dict, key_cols: list,
+                per_page: int, after=None, before=None, last: int = 0):
+    """
+    ORDER BY key_cols DESC 목록의 한 페이지
+    - after: 직전 페이지 마지막 행의 커서(다음), before: 첫 행의 커서(이전)
+    - 커서가 없으면 첫 페이지, last: 마지막 페이지의 행 수 (총 건수 % per_page, 0 이면 per_page)
+    반환: (rows, prev_cursor, next_cursor) — 없으면 None
+    """
+    sql, params, cursor, backwards = keyset_query(
+        select_sql, where_clause, params, key_cols, per_page, after=after, before=before, last=last,
+    )
+    rows = conn.execute(text(sql), params).all()
+    size = params["_limit"] - 1
+    has_more = len(rows) > size
+    rows = rows[:size]
+    if backwards:
+        rows.reverse()
+        has_prev, has_next = has_more, bool(cursor)
+    else:
+        has_prev, has_next = bool(cursor), has_more
+
+    def _cursor(row):
+        return encode_cursor(*(row._mapping[c] for c in key_cols))
+    prev_cursor = _cursor(rows[0]) if rows and has_prev else None
+    next_cursor = _cursor(rows[-1]) if rows and has_next else None
+    return rows, prev_cursor, next_cursor
+
+def page_window(total: int, per_page: int, page: int, cursor: bool, last: bool):
+    """
+    (표시할 페이지 번호, 총 페이지 수, 마지막 페이지면 그 행 수 아니면 0)
+    - 커서 없이 온 요청은 첫 페이지 (예전 ?page=N 링크도 OFFSET 으로 가지 않음)
+    """
+    total_pages = max(1, (total + per_page - 1) // per_page)
+    if last:
+        return total_pages, total_pages, (total - (total_pages - 1) * per_page) or per_page
+    return (min(max(page, 1), total_pages) if cursor else 1), total_pages, 0
+
+# ---------------------------------------------------------------------
+# 목록 건수/합계 캐시 — 페이지를 넘길 때마다 COUNT(*) 를 다시 세지 않음
+#  - 같은 프로세스의 쓰기 라우트는 forget_counts(테이블)로 바로 무효화
+#  - 다른 워커의 쓰기는 COUNT_CACHE_SECONDS 안에 반영
+# ---------------------------------------------------------------------
+COUNT_CACHE_SECONDS = float(os.getenv("COUNT_CACHE_SECONDS", "30"))
+
+_counts = {}   # (테이블, sql, 바인딩) → (행, 시각)
+_counts_lock = threading.Lock()
+
+def cached_counts(conn, table: str, sql: str, params: dict) -> tuple:
+    """집계 SQL(한 행)의 결과 — COUNT_CACHE_SECONDS 동안 재사용"""
+    key = (table, sql, tuple(sorted(params.items())))
+    now = time.monotonic()
+    with _counts_lock:
+        hit = _counts.get(key)
+    if hit and now - hit[1] < COUNT_CACHE_SECONDS:
+        return hit[0]
+    row = tuple(conn.execute(text(sql), params).one())
+    with _counts_lock:
+        _counts[key] = (row, now)
+    return row
+
+def forget_counts(table: str):
+    with _counts_lock:
+        for key in [k for k in _counts if k[0] == table]:
+            del _counts[key]
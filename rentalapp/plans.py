@@ -0,0 +1,126 @@
+# rentalapp/plans.py
+import re
+import click
+from sqlalchemy import text, bindparam
+
+from .db import engine, is_sqlite
+
+# ---------------------------------------------------------------------
+# 🔍 쿼리 플랜 점검 — flask --app app check-plans
+#   라우트가 실행하는 SQL 상수(각 blueprint 모듈)를 그대로 EXPLAIN QUERY PLAN,
+#   rental/board 풀스캔이면 실패 → 라우트 SQL이 바뀌면 점검 대상도 같이 바뀜
+# ---------------------------------------------------------------------
+def hot_queries() -> list:
+    """(이름, SQL, 바인딩) 목록 — 목록 값 바인딩은 IN :name 으로 펼침"""
+    # blueprint 모듈은 점검할 때만 로드 (APP_FEATURES 로 고른 기능만 import 하는 워커 대비)
+    from .admin import (BUNDLE_UNITS_SQL, DELETE_RENTED_SQL, DELETE_RENTED_STATE_SQL, RECENT_POSTS_SQL,
+                        RENT_STATUS_SEARCH, RENT_STATUS_SQL, RETURN_COUNT_SQL, RETURN_STATUS_SQL)
+    from .board import (BOARD_COUNT_SQL, BOARD_KEY_COLS, BOARD_LIST_SQL, BOARD_POST_SQL,
+                        BOARD_SEARCH_COLUMNS, board_list_filters)
+    from .contacts import COMPANY_SEARCH_COLUMNS, COMPANY_SEARCH_LIMIT
+    from .equipment import EQUIPMENT_KEY_COLS, EQUIPMENT_LIST_SQL
+    from .paging import keyset_query
+    from .rental import (AVAILABLE_UNITS_SQL, RELEASE_UNIT_STATE_SQL, RENTAL_DONE_SQL, RENTED_BY_DEPT_SQL,
+                         RETURN_UNITS_SQL, UNIT_SERIALS_SQL, UNIT_STATE_FROM_RENTAL_SQL, checkout_sql)
+    from .search import parse_search_query, search_query
+    from .todos import TODOS_SQL
+
+    checkout_params = {"user_name": "홍길동", "dept": "운영팀", "phone": "01000000000",
+                       "start_date": "", "end_date": "", "signature": "", "rental_date": ""}
+    for i in range(2):
+        checkout_params.update({f"u{i}": f"No.{i + 1}", f"s{i}": f"00000{i + 1}"})
+
+    queries = [
+        ("rental_items: 가용 단말", AVAILABLE_UNITS_SQL, {}),
+        ("rental_items: 시리얼 조회", UNIT_SERIALS_SQL, {"units": ["No.1", "No.2"]}),
+        ("rental_items: 대여 INSERT ON CONFLICT", checkout_sql(2), checkout_params),
+        ("rental_items: unit_state 기록", UNIT_STATE_FROM_RENTAL_SQL, {"ids": [1, 2]}),
+        ("rental_done", RENTAL_DONE_SQL, {"units": ["No.1", "No.2"]}),
+        ("return_items: 대여중 목록", RENTED_BY_DEPT_SQL, {"dept": "운영팀"}),
+        ("return_items: 일괄 반납", RETURN_UNITS_SQL,
+         {"end_date": "", "dept": "운영팀", "serials": ["000001", "000002"]}),
+        ("return_items: unit_state 정리", RELEASE_UNIT_STATE_SQL, {"ids": [1, 2]}),
+        ("delete_rentals: unit_state", DELETE_RENTED_STATE_SQL, {"serials": ["000001"]}),
+        ("delete_rentals", DELETE_RENTED_SQL, {"serials": ["000001"]}),
+        ("admin_rent_status: 대여중 목록", RENT_STATUS_SQL + RENT_STATUS_SEARCH + " ORDER BY id DESC", {"kw": "%1%"}),
+        ("admin_return_status: 목록", RETURN_STATUS_SQL, {}),
+        ("admin_return_status: 건수", RETURN_COUNT_SQL, {}),
+        ("get_bundle_units", BUNDLE_UNITS_SQL.format(where="u.bundle_id = :bid"), {"bid": 1}),
+        ("admin_menu: 최근 공지", RECENT_POSTS_SQL, {}),
+        ("board post", BOARD_POST_SQL, {"id": 1}),
+        ("todos", TODOS_SQL, {"user": "guest"}),
+    ]
+
+    # 게시판 목록: 처음 / 다음·이전(커서) / 마지막(역순 키셋) — 라우트와 같은 keyset_query
+    for board_type, category in (("general", ""), ("general", "공지"), ("all", "")):
+        where, params = board_list_filters(board_type, category)
+        label = f"admin_board_type[{board_type}{'/' + category if category else ''}]"
+        queries.append((f"{label}: 건수", BOARD_COUNT_SQL.format(where=where), params))
+        for page, cursor in (("첫 페이지", {}), ("다음", {"after": "0.100"}), ("이전", {"before": "0.100"}),
+                             ("마지막", {"last": 7})):
+            sql, page_params, _, _ = keyset_query(BOARD_LIST_SQL, where, params, BOARD_KEY_COLS, 10, **cursor)
+            queries.append((f"{label}: {page}", sql, page_params))
+
+    for page, cursor in (("첫 페이지", {}), ("다음", {"after": "100"}), ("마지막", {"last": 7})):
+        sql, params, _, _ = keyset_query(EQUIPMENT_LIST_SQL, "", {}, EQUIPMENT_KEY_COLS, 10, **cursor)
+        queries.append((f"admin_equipment: {page}", sql, params))
+
+    # 검색: 라우트와 같은 search_query (건수 + 관련도순 목록)
+    where, params = board_list_filters("general")
+    columns = BOARD_SEARCH_COLUMNS.format(created_at="t.created_at")
+    count_sql, rows_sql, params = search_query("board", parse_search_query("무전기 -점검"), columns,
+                                               where, params, 10, 0)
+    queries += [("admin_board_type: 검색 건수", count_sql, params), ("admin_board_type: 검색", rows_sql, params)]
+    _, rows_sql, params = search_query("board", parse_search_query("-점검"), columns,
+                                       where, params, 10, 0)
+    queries.append(("admin_board_type: 제외어만 검색", rows_sql, params))
+    columns = COMPANY_SEARCH_COLUMNS.format(created_at="t.created_at")
+    _, rows_sql, params = search_query("companies", parse_search_query("ㅎㅈ"), columns,
+                                       "WHERE 1=1", {}, COMPANY_SEARCH_LIMIT, 0)
+    queries.append(("admin_contacts: 검색", rows_sql, params))
+    return queries
+
+PLAN_GUARDED_TABLES = ("rental", "board")
+
+def find_full_scans(conn, sql: str, params: dict) -> list:
+    """EXPLAIN QUERY PLAN 결과 중 rental/board(별칭 포함) 인덱스 없는 SCAN 행"""
+    names = set(PLAN_GUARDED_TABLES)
+    for table, alias in re.findall(
+        r"\b(?:FROM|JOIN|UPDATE)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?", sql, re.IGNORECASE
+    ):
+        if table in PLAN_GUARDED_TABLES and alias and alias.upper() not in {
+            "WHERE", "ORDER", "LEFT", "JOIN", "SET", "LIMIT", "GROUP", "ON"
+        }:
+            names.add(alias)
+
+    stmt = text("EXPLAIN QUERY PLAN " + sql)
+    expanding = [bindparam(k, expanding=True) for k, v in params.items() if isinstance(v, (list, tuple))]
+    if expanding:
+        stmt = stmt.bindparams(*expanding)
+
+    bad = []
+    for row in conn.execute(stmt, params).all():
+        detail = row[-1]
+        m = re.match(r"SCAN (\w+)", detail)
+        if m and m.group(1) in names and "INDEX" not in detail:
+            bad.append(detail)
+    return bad
+
+@click.command("check-plans")
+def check_plans_command():
+    """주요 SQL의 실행 계획 점검 (rental/board 풀스캔 시 종료코드 1)"""
+    if not is_sqlite():
+        print("EXPLAIN QUERY PLAN 점검은 SQLite에서만 지원합니다.")
+        return
+
+    failed = 0
+    with engine.connect() as conn:
+        for label, sql, params in hot_queries():
+            bad = find_full_scans(conn, sql, params)
+            if bad:
+                failed += 1
+                print(f"❌ {label}: {' / '.join(bad)}")
+            else:
+                print(f"✅ {label}")
+    if failed:
+        raise SystemExit(1)
@@ -0,0 +1,436 @@
+# rentalapp/rental.py
+from flask import Blueprint, render_template, request, redirect, session, url_for, flash, abort, current_app
+import os, time
+from sqlalchemy import text, bindparam
+
+from .db import clean_phone, engine, format_phone_kor, normalize_unit_no, now_kst_str
+
+bp = Blueprint("rental", __name__)
+
+# ---------------------------------------------------------------------
+# 사용자 메뉴
+# ---------------------------------------------------------------------
+@bp.route('/')
+def index():
+    return render_template('index.html')
+
+# 사용자 선택 페이지
+@bp.route('/user')
+def user_choice():
+    return render_template('user_choice.html')
+
+# 장비 대여 메뉴
+@bp.route('/user/menu')
+def user_menu():
+    return render_template('user_menu.html')
+
+
+# ---------------------------------------------------------------------
+# 1️⃣ 장애조치 대분류 선택 페이지
+# ---------------------------------------------------------------------
+@bp.route("/fault/select")
+def fault_select():
+    """
+    메인 페이지 — 사용자가 장비 종류(YT, RS, STS, PC 등)를 선택하는 화면
+    """
+    return render_template("fault_select.html")
+
+
+# ---------------------------------------------------------------------
+# 2️⃣ 장비별 중분류 페이지 (fault_category 폴더 내의 HTML 로드)
+# ---------------------------------------------------------------------
+@bp.route("/fault/<category>")
+def fault_category(category):
+    """
+    예시:
+    /fault/yt      → templates/fault_category/yt_category.html
+    /fault/sts     → templates/fault_category/sts_category.html
+    /fault/rs      → templates/fault_category/rs_category.html
+    /fault/pc      → templates/fault_category/pc_category.html
+    /fault/printer → templates/fault_category/printer_category.html
+    /fault/monitor → templates/fault_category/monitor_category.html
+    /fault/gate    → templates/fault_category/gate_category.html
+    /fault/cctv    → templates/fault_category/cctv_category.html
+    /fault/pda     → templates/fault_category/pda_category.html
+    /fault/rfid    → templates/fault_category/rfid_category.html
+    /fault/etc     → templates/fault_category/etc_category.html
+    """
+
+    category = category.strip().lower()
+    template_name = f"fault_category/{category}_category.html"
+    full_path = os.path.join(current_app.root_path, current_app.template_folder, template_name)
+
+    if os.path.exists(full_path):
+        return render_template(template_name)
+    else:
+        abort(404)  # 해당 장비용 HTML이 없을 경우
+
+
+# ---------------------------------------------------------------------
+# 3️⃣ 조치 요령 페이지 (fault_guides 폴더 내의 HTML 로드)
+# ---------------------------------------------------------------------
+@bp.route("/fault/guide/<category>/<guide>")
+def fault_guide(category, guide):
+    template_path = f"fault_guides/{category}/{guide}.html"
+    try:
+        return render_template(template_path)
+    except Exception as e:
+        return f"Guide not found: {template_path}<br>Error: {e}", 404
+
+# ---------------------------------------------------------------------
+# 대여 흐름
+# ---------------------------------------------------------------------
+@bp.route("/rental_info", methods=["GET", "POST"])
+def rental_info():
+    if request.method == "POST":
+        if "agree_terms" not in request.form:
+            return "<h3>개인정보 수집 및 이용에 동의해야 다음으로 진행할 수 있습니다.</h3>"
+
+        dept = request.form["dept"]
+        user_name = request.form["user_name"]
+        phone = clean_phone(request.form["phone"])
+
+        session["rental_info"] = {
+            "dept": dept,
+            "user_name": user_name,
+            "phone": phone,
+            "start_date": request.form["start_date"],
+            "end_date": request.form["end_date"],
+            "signature": request.form["signature"]
+        }
+        return redirect("/rental_items")
+    return render_template("rental_info.html")
+
+# ---------------------------------------------------------------------
+# 대여/반납 SQL — 라우트와 check-plans(rentalapp/plans.py)가 같은 문장을 사용
+# ---------------------------------------------------------------------
+AVAILABLE_UNITS_SQL = """
+    SELECT u.unit_no, u.serial_no, u.item_name
+      FROM walkie_talkie_units u
+ LEFT JOIN unit_state s ON s.unit_no = u.unit_no
+     WHERE s.unit_no IS NULL
+  ORDER BY u.unit_no
+"""
+
+UNIT_SERIALS_SQL = "SELECT unit_no, serial_no FROM walkie_talkie_units WHERE unit_no IN :units"
+
+CHECKOUT_ROW_SQL = (
+    "(:user_name, :dept, :phone, :start_date, :end_date, "
+    ":signature, :s{i}, 1, :rental_date, 'rented', :u{i})"
+)
+
+def checkout_sql(count: int) -> str:
+    """단말 count 대를 한 번에 넣는 INSERT (행 바인딩은 :u0/:s0, :u1/:s1, ...)"""
+    return f"""
+        INSERT INTO rental (
+            user_name, dept, phone, start_date, end_date,
+            signature, serial_no, qty, rental_date, status, unit_no
+        ) VALUES {", ".join(CHECKOUT_ROW_SQL.format(i=i) for i in range(count))}
+        ON CONFLICT (unit_no) WHERE status = 'rented' DO NOTHING
+        RETURNING id, unit_no
+    """
+
+UNIT_STATE_FROM_RENTAL_SQL = """
+    INSERT INTO unit_state (unit_no, rental_id, user_name, dept, phone, since)
+    SELECT unit_no, id, user_name, dept, phone, rental_date
+      FROM rental
+     WHERE id IN :ids
+"""
+
+RENTAL_DONE_SQL = """
+    SELECT r.unit_no,
+           r.serial_no,
+           COALESCE(w.item_name, '무전기') AS item_name,
+           COALESCE(r.qty, 1) AS qty
+      FROM rental r
+ LEFT JOIN walkie_talkie_units w ON w.unit_no = r.unit_no
+     WHERE r.unit_no IN :units
+       AND r.status = 'rented'
+  ORDER BY r.unit_no
+"""
+
+RENTED_BY_DEPT_SQL = """
+    SELECT serial_no, '무전기' AS item_name, 'XiR-E8600' AS model_name, unit_no
+    FROM rental
+    WHERE dept = :dept AND status = 'rented'
+    ORDER BY id DESC
+"""
+
+RETURN_UNITS_SQL = """
+    UPDATE rental
+       SET status = 'returned', end_date = :end_date
+     WHERE dept = :dept AND serial_no IN :serials AND status = 'rented'
+    RETURNING id
+"""
+
+RELEASE_UNIT_STATE_SQL = "DELETE FROM unit_state WHERE rental_id IN :ids"
+
+class UnitsUnavailable(Exception):
+    """이미 다른 대여에 잡혀 있는 단말이 포함된 경우 (unit_nos: 선점된 단말 목록)"""
+    def __init__(self, unit_nos):
+        super().__init__(", ".join(unit_nos))
+        self.unit_nos = list(unit_nos)
+
+def checkout_units(conn, info: dict, unit_nos: list, rental_date: str) -> int:
+    """
+    선택된 단말 일괄 대여 (트랜잭션 내부에서 호출)
+    - 시리얼 조회 1회 + rental 다건 INSERT 1회 → 단말 수와 무관하게 2 round trip
+    - uq_rental_active_unit(대여중 unit_no 유일) 충돌 행은 INSERT 되지 않음
+      → 하나라도 선점돼 있으면 UnitsUnavailable 발생, 호출측 트랜잭션 전체 롤백
+    - 대여된 단말은 같은 트랜잭션에서 unit_state에 기록
+    """
+    unit_nos = list(dict.fromkeys(u for u in map(normalize_unit_no, unit_nos) if u))  # 순서 유지 중복 제거
+    if not unit_nos:
+        return 0
+
+    serial_map = dict(conn.execute(
+        text(UNIT_SERIALS_SQL).bindparams(bindparam("units", expanding=True)),
+        {"units": unit_nos},
+    ).all())
+
+    params = {
+        "user_name": info["user_name"],
+        "dept": info["dept"],
+        "phone": info["phone"],
+        "start_date": info["start_date"],
+        "end_date": info["end_date"],
+        "signature": info["signature"],
+        "rental_date": rental_date,
+    }
+    for i, unit_no in enumerate(unit_nos):
+        params[f"u{i}"] = unit_no
+        params[f"s{i}"] = serial_map.get(unit_no) or f"Unknown-{unit_no}"
+
+    inserted = conn.execute(text(checkout_sql(len(unit_nos))), params).all()
+
+    inserted_units = {r[1] for r in inserted}
+    taken = [u for u in unit_nos if u not in inserted_units]
+    if taken:
+        raise UnitsUnavailable(taken)
+
+    conn.execute(text(UNIT_STATE_FROM_RENTAL_SQL).bindparams(bindparam("ids", expanding=True)),
+                 {"ids": [r[0] for r in inserted]})
+    return len(inserted)
+
+@bp.route("/rental_items", methods=["GET", "POST"])
+def rental_items():
+    """
+    총 개수(total_count) = 전체 보유 수
+    현재 개수(current_count) = 'rented'가 아닌 가용 수
+    """
+    def _load_inventory():
+        with engine.connect() as conn:
+            total_count = conn.execute(text("SELECT COUNT(*) FROM walkie_talkie_units")).scalar_one()
+            rows = conn.execute(text(AVAILABLE_UNITS_SQL)).all()
+
+        equipments = [{
+            "item_name": r[2] or "무전기",
+            "model_name": "XiR-E8600",
+            "unit_no": r[0],
+            "serial_no": r[1],
+        } for r in rows]
+        current_count = len(equipments)
+        return equipments, total_count, current_count
+
+    if request.method == "POST":
+        csv = (request.form.get("items") or "").strip()
+        selected_units = [x for x in csv.split(",") if x]
+        if not selected_units:
+            selected_units = (
+                request.form.getlist("items") or
+                request.form.getlist("equipment_ids") or
+                request.form.getlist("equipment_ids[]")
+            )
+        selected_units = [u for u in map(normalize_unit_no, selected_units) if u]
+
+        if not selected_units:
+            equipments, total_count, current_count = _load_inventory()
+            flash("장비를 한 개 이상 선택해야 대여할 수 있습니다.", "warning")
+            return render_template(
+                "rental_items.html",
+                equipments=equipments,
+                total_count=total_count,
+                current_count=current_count,
+            )
+
+        info = session.get("rental_info")
+        if info is None:
+            return "<h3>세션이 초기화되었거나 잘못된 접근입니다.</h3>"
+
+        now_kst = now_kst_str()
+
+        t0 = time.perf_counter()
+        try:
+            with engine.begin() as conn:
+                checkout_units(conn, info, selected_units, now_kst)
+        except UnitsUnavailable as e:
+            equipments, total_count, current_count = _load_inventory()
+            flash(f"이미 대여된 장비가 포함되어 있습니다: {', '.join(e.unit_nos)}", "danger")
+            return render_template(
+                "rental_items.html",
+                equipments=equipments,
+                total_count=total_count,
+                current_count=current_count,
+            ), 409
+        print(f"⏱ checkout {len(selected_units)}대: {(time.perf_counter() - t0) * 1000:.1f} ms")
+
+        # 완료 페이지에서 사용할 정보 저장
+        session["last_renter"] = {
+            "dept": info["dept"],
+            "user_name": info["user_name"],
+            "phone": info["phone"],
+            "start_date": info["start_date"],
+            "end_date": info["end_date"],
+        }
+        session["last_rental_units"] = selected_units
+        session["last_rental_time"] = now_kst
+
+        return redirect("/rental_done")
+
+    # GET
+    equipments, total_count, current_count = _load_inventory()
+    return render_template(
+        "rental_items.html",
+        equipments=equipments,
+        total_count=total_count,
+        current_count=current_count,
+    )
+
+@bp.route("/rental_done")
+def rental_done():
+    units = session.get("last_rental_units") or []
+    renter = session.get("last_renter") or {}
+    if not units or not renter:
+        flash("표시할 대여 내역이 없습니다.", "warning")
+        return redirect(url_for("rental.user_menu"))
+
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(RENTAL_DONE_SQL).bindparams(bindparam("units", expanding=True)),
+            {"units": units},
+        ).mappings().all()
+
+    items = [{
+        "equipment_no": row["unit_no"],
+        "equipment_name": row["item_name"],
+        "qty": int(row["qty"]),
+    } for row in rows]
+
+    total_qty = sum(it["qty"] for it in items) if items else 0
+
+    phone_fmt = format_phone_kor(renter.get("phone", ""))
+    start = renter.get("start_date", "")
+    end = renter.get("end_date", "")
+    period_str = f"{start} ~ {end}" if start or end else ""
+
+    header = {
+        "dept": renter.get("dept", ""),
+        "username": renter.get("user_name", ""),
+        "phone": renter.get("phone", ""),
+        "phone_fmt": phone_fmt,
+        "start_date": start,
+        "end_date": end,
+        "period": period_str,
+        "created_at": session.get("last_rental_time", ""),
+    }
+
+    return render_template(
+        "rental_done.html",
+        renter=renter,
+        items=items,
+        total_qty=total_qty,
+        header=header,
+    )
+
+
+# ---------------------------------------------------------------------
+# 반납 흐름
+# ---------------------------------------------------------------------
+@bp.route("/return_info", methods=["GET", "POST"])
+def return_info():
+    if request.method == "POST":
+        dept = request.form["dept"]
+        user_name = request.form["user_name"]
+        phone = clean_phone(request.form["phone"])
+        if not dept or not user_name or not phone:
+            flash("소속/성함/연락처를 모두 입력하세요.", "warning")
+            return render_template("return_info.html")
+        session["return_info"] = {"dept": dept, "user_name": user_name, "phone": phone}
+        return redirect("/return_items")
+    return render_template("return_info.html")
+
+def return_units(conn, info: dict, serial_nos: list, returned_at: str) -> list:
+    """
+    소속(dept)의 대여중 장비 일괄 반납 (트랜잭션 내부에서 호출)
+    - UPDATE ... RETURNING 1회 + unit_state 정리 1회 + returns_log 다건 INSERT 1회
+    - 반납 처리된 rental id 목록 반환 (이미 반납된 시리얼은 무시)
+    """
+    serial_nos = list(dict.fromkeys(s for s in serial_nos if s))
+    if not serial_nos:
+        return []
+
+    rental_ids = conn.execute(text(RETURN_UNITS_SQL).bindparams(bindparam("serials", expanding=True)), {
+        "end_date": returned_at, "dept": info["dept"], "serials": serial_nos,
+    }).scalars().all()
+    if not rental_ids:
+        return []
+
+    conn.execute(text(RELEASE_UNIT_STATE_SQL).bindparams(bindparam("ids", expanding=True)),
+                 {"ids": rental_ids})
+
+    conn.execute(text("""
+        INSERT INTO returns_log (rental_id, dept, returner_name, returner_phone, returned_at)
+        VALUES (:rental_id, :dept, :returner_name, :returner_phone, :returned_at)
+    """), [{
+        "rental_id": rental_id,
+        "dept": info["dept"],
+        "returner_name": info["user_name"],
+        "returner_phone": info["phone"],
+        "returned_at": returned_at,
+    } for rental_id in rental_ids])
+    return rental_ids
+
+@bp.route("/return_items", methods=["GET", "POST"])
+def return_items():
+    info = session.get("return_info")
+    if info is None:
+        return "<h3>세션이 초기화되었거나 잘못된 접근입니다.</h3>"
+
+    def _load_rented():
+        with engine.connect() as conn:
+            rows = conn.execute(text(RENTED_BY_DEPT_SQL), {"dept": info["dept"]}).all()
+        total = len(rows)
+        current = total
+        return rows, total, current
+
+    if request.method == "POST":
+        selected_serials = request.form.getlist("items")
+        if not selected_serials:
+            rented_items, total_count, current_count = _load_rented()
+            flash("반납할 장비를 선택하세요.", "warning")
+            return render_template(
+                "return_items.html",
+                rented_items=rented_items,
+                total_count=total_count,
+                current_count=current_count
+            )
+
+        now_str = now_kst_str()
+        t0 = time.perf_counter()
+        with engine.begin() as conn:
+            returned = return_units(conn, info, selected_serials, now_str)
+        print(f"⏱ return {len(returned)}/{len(selected_serials)}대: {(time.perf_counter() - t0) * 1000:.1f} ms")
+        return redirect("/return_done")
+
+    rented_items, total_count, current_count = _load_rented()
+    return render_template(
+        "return_items.html",
+        rented_items=rented_items,
+        total_count=total_count,
+        current_count=current_count
+    )
+
+
+@bp.route("/return_done")
+def return_done():
+    return render_template("return_done.html")
@@ -0,0 +1,253 @@
+# rentalapp/search.py
+from markupsafe import Markup, escape
+import re
+from sqlalchemy import text, bindparam
+
+from .db import is_postgres
+
+# ---------------------------------------------------------------------
+# 한글 n-gram 검색 색인 (게시판 / 주소록)
+#  - 한글은 음절 bigram, 영문/숫자는 단어 단위 → "전기"로 "무전기" 검색
+#  - 음절(unigram) 색인 → 한 글자 "기"로 "무전기" 검색
+#  - 초성 색인 → "ㅁㅈㄱ"으로 "무전기" 검색
+#  - SQLite: FTS5 {table}_fts / PostgreSQL: {table}_search (tsvector + GIN)
+#  - 원본 행을 바꾼 트랜잭션 안에서 sync_search_index() 호출
+# ---------------------------------------------------------------------
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_TOKEN_RUN = re.compile(r"[가-힣]+|[ㄱ-ㅎ]+|[0-9a-z]+")
+_TAG = re.compile(r"<[^>]*>")
+
+# 색인 이름(=원본 테이블) → 검색 필드(가중치 순), 초성 색인 필드, bm25 가중치(필드…, 초성, 음절)
+SEARCH_INDEXES = {
+    "board":     {"fields": ("title", "content"),         "initials": ("title",),
+                  "weights": (10.0, 1.0, 5.0, 1.0)},
+    "companies": {"fields": ("name", "manager", "memo"),  "initials": ("name", "manager"),
+                  "weights": (10.0, 5.0, 1.0, 5.0, 1.0)},
+}
+_PG_WEIGHTS = "ABC"  # 필드 순서대로, 초성/음절은 D
+_SEARCH_CHUNK = 500
+
+def ngram_tokens(value) -> list:
+    """문자열 → 색인 토큰 (한글/초성 2글자 이상은 bigram, 나머지는 단어 그대로)"""
+    tokens = []
+    for run in _TOKEN_RUN.findall(_TAG.sub(" ", value or "").lower()):
+        if len(run) > 1 and not run[0].isascii():
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+def syllables_of(values) -> list:
+    """bigram 으로만 색인되는 2글자 이상 한글 단어의 음절 (중복 없이) — 한 글자 검색용"""
+    runs = (run for value in values for run in _TOKEN_RUN.findall(_TAG.sub(" ", value or "")))
+    return list(dict.fromkeys(ch for run in runs if len(run) > 1 and "가" <= run[0] <= "힣" for ch in run))
+
+def initials_of(value) -> str:
+    """한글 음절 → 초성 (그 외 문자는 공백)"""
+    return "".join(
+        _CHOSUNG[(ord(ch) - 0xAC00) // 588] if "가" <= ch <= "힣" else " "
+        for ch in value or ""
+    )
+
+def parse_search_query(q: str) -> list:
+    """
+    검색어 → 검색 조건 목록 [{negate, target, tokens, prefix, text}]
+    - 공백으로 나눈 단어는 모두 포함(AND), "따옴표"는 붙어 있는 구절, -단어는 제외
+    - 초성만 입력하면 초성 색인(target="initials"), 한글 한 글자는 음절 색인까지(target="syllable"),
+      초성 한 글자/영문·숫자는 접두 일치
+    """
+    terms = []
+    for m in re.finditer(r'(-?)"([^"]*)"|(-?)(\S+)', q or ""):
+        negate = bool(m.group(1) or m.group(3))
+        if m.group(2) is not None:
+            tokens = ngram_tokens(m.group(2))
+            if tokens:
+                terms.append({"negate": negate, "target": "text", "tokens": tokens,
+                              "prefix": False, "text": m.group(2).strip()})
+            continue
+        for run in _TOKEN_RUN.findall(m.group(4).lower()):
+            syllable = len(run) == 1 and "가" <= run <= "힣"
+            terms.append({
+                "negate": negate,
+                "target": "initials" if "ㄱ" <= run[0] <= "ㅎ" else ("syllable" if syllable else "text"),
+                "tokens": ngram_tokens(run),
+                "prefix": not syllable and (len(run) == 1 or run.isascii()),
+                "text": run,
+            })
+    return terms[:10]
+
+def _fts5_match(terms: list, fields) -> str:
+    """FTS5 MATCH 식 — 제외어만 있으면 제외할 행을 찾는 식 (search_query 가 NOT IN 으로 사용)"""
+    def expr(t):
+        cols = {"initials": ("initials",), "syllable": (*fields, "syllables")}.get(t["target"], fields)
+        return "{" + " ".join(cols) + "}" + f' : "{" ".join(t["tokens"])}"' + ("*" if t["prefix"] else "")
+    included = [expr(t) for t in terms if not t["negate"]]
+    excluded = [expr(t) for t in terms if t["negate"]]
+    if not included:
+        return " OR ".join(excluded)
+    match = " AND ".join(included)
+    if excluded:
+        match = f"({match}) NOT ({' OR '.join(excluded)})"
+    return match
+
+def _pg_tsquery(terms: list, fields) -> str:
+    """tsquery 식 — 제외어만 있으면 제외할 행을 찾는 식 (search_query 가 NOT IN 으로 사용)"""
+    def expr(t):
+        weights = {"initials": "D", "syllable": ""}.get(t["target"], _PG_WEIGHTS[:len(fields)])
+        star = "*" if t["prefix"] else ""
+        sep = ":" if star or weights else ""
+        return "(" + " <-> ".join(f"'{tok}'{sep}{star}{weights}" for tok in t["tokens"]) + ")"
+    if all(t["negate"] for t in terms):
+        return " | ".join(expr(t) for t in terms)
+    return " & ".join(("!" if t["negate"] else "") + expr(t) for t in terms)
+
+def _pg_tsvector(values: list) -> str:
+    """(가중치, 토큰 목록) → tsvector 리터럴 (필드 사이에는 위치를 한 칸 띄워 구절이 이어지지 않게)"""
+    positions, pos = {}, 0
+    for weight, tokens in values:
+        for tok in tokens:
+            pos = min(pos + 1, 16383)
+            positions.setdefault(tok, []).append(f"{pos}{weight}")
+        pos += 1
+    return " ".join(f"'{tok}':{','.join(p[:256])}" for tok, p in positions.items())
+
+def create_search_index(conn, name: str):
+    spec = SEARCH_INDEXES[name]
+    if is_postgres():
+        conn.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS {name}_search (
+                id  INTEGER PRIMARY KEY,
+                doc tsvector NOT NULL
+            )
+        """))
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS idx_{name}_search ON {name}_search USING GIN (doc)"))
+    else:
+        cols = ", ".join(spec["fields"])
+        conn.execute(text(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {name}_fts
+            USING fts5({cols}, initials, syllables, tokenize = 'unicode61')
+        """))
+
+def sync_search_index(conn, name: str, ids):
+    """원본 행 id 목록의 색인을 다시 만듦 (없어진 행은 색인에서만 삭제)"""
+    spec = SEARCH_INDEXES[name]
+    fields = spec["fields"]
+    ids = list(ids)
+    for i in range(0, len(ids), _SEARCH_CHUNK):
+        chunk = ids[i:i + _SEARCH_CHUNK]
+        if is_postgres():
+            conn.execute(text(f"DELETE FROM {name}_search WHERE id IN :ids")
+                         .bindparams(bindparam("ids", expanding=True)), {"ids": chunk})
+        else:
+            conn.execute(text(f"DELETE FROM {name}_fts WHERE rowid IN :ids")
+                         .bindparams(bindparam("ids", expanding=True)), {"ids": chunk})
+
+        rows = conn.execute(text(f"SELECT id, {', '.join(fields)} FROM {name} WHERE id IN :ids")
+                            .bindparams(bindparam("ids", expanding=True)), {"ids": chunk}).mappings().all()
+        if not rows:
+            continue
+
+        docs = []
+        for r in rows:
+            initials = ngram_tokens(" ".join(initials_of(r[f]) for f in spec["initials"]))
+            syllables = syllables_of(r[f] for f in fields)
+            if is_postgres():
+                values = [(w, ngram_tokens(r[f])) for w, f in zip(_PG_WEIGHTS, fields)]
+                docs.append({"id": r["id"], "doc": _pg_tsvector(values + [("D", initials), ("D", syllables)])})
+            else:
+                doc = {f: " ".join(ngram_tokens(r[f])) for f in fields}
+                docs.append({"id": r["id"], **doc, "initials": " ".join(initials), "syllables": " ".join(syllables)})
+
+        if is_postgres():
+            conn.execute(text(f"INSERT INTO {name}_search (id, doc) VALUES (:id, CAST(:doc AS tsvector))"), docs)
+        else:
+            cols = ", ".join(fields)
+            binds = ", ".join(f":{f}" for f in fields)
+            conn.execute(text(f"INSERT INTO {name}_fts (rowid, {cols}, initials, syllables) "
+                              f"VALUES (:id, {binds}, :initials, :syllables)"), docs)
+
+def rebuild_search_index(conn, name: str):
+    ids = conn.execute(text(f"SELECT id FROM {name}")).scalars().all()
+    conn.execute(text(f"DELETE FROM {name}_search" if is_postgres() else f"DELETE FROM {name}_fts"))
+    sync_search_index(conn, name, ids)
+
+def search_query(name: str, terms: list, columns: str, where: str, params: dict,
+                 limit: int, offset: int):
+    """
+    search_table 이 실행하는 SQL (check-plans 도 같은 문장을 EXPLAIN)
+    반환: (건수 SQL, 목록 SQL, params) — 검색어가 없으면 None
+    - 제외어(-단어)만 있으면 검색 전 목록에서 일치하는 행만 뺌 (최신순)
+    """
+    spec = SEARCH_INDEXES[name]
+    if not terms:
+        return None
+    params = {**params, "limit": limit, "offset": offset}
+    if all(t["negate"] for t in terms):
+        if is_postgres():
+            params["match"] = _pg_tsquery(terms, spec["fields"])
+            excluded = f"SELECT id FROM {name}_search WHERE doc @@ CAST(:match AS tsquery)"
+        else:
+            params["match"] = _fts5_match(terms, spec["fields"])
+            excluded = f"SELECT rowid FROM {name}_fts WHERE {name}_fts MATCH :match"
+        base = f"FROM {name} t {where} AND t.id NOT IN ({excluded})"
+        order = "t.id DESC"
+    elif is_postgres():
+        params["match"] = _pg_tsquery(terms, spec["fields"])
+        base = f"""
+            FROM {name}_search s JOIN {name} t ON t.id = s.id
+            {where} AND s.doc @@ CAST(:match AS tsquery)
+        """
+        order = "ts_rank(s.doc, CAST(:match AS tsquery)) DESC, t.id DESC"
+    else:
+        params["match"] = _fts5_match(terms, spec["fields"])
+        base = f"""
+            FROM {name}_fts JOIN {name} t ON t.id = {name}_fts.rowid
+            {where} AND {name}_fts MATCH :match
+        """
+        order = f"bm25({name}_fts, {', '.join(str(w) for w in spec['weights'])}), t.id DESC"
+
+    rows_sql = f"""
+        SELECT {columns} {base}
+        ORDER BY {order}
+        LIMIT :limit OFFSET :offset
+    """
+    return f"SELECT COUNT(*) {base}", rows_sql, params
+
+def search_table(conn, name: str, terms: list, columns: str, where: str, params: dict,
+                 limit: int, offset: int):
+    """
+    n-gram 색인 검색 (관련도순) — (총 건수, 행 목록)
+    - columns: 원본 테이블은 t 별칭 ("t.id, t.title, ...")
+    - where: "WHERE 1=1 AND ..." 형태의 원본 테이블 조건
+    """
+    query = search_query(name, terms, columns, where, params, limit, offset)
+    if query is None:
+        return 0, []
+    count_sql, rows_sql, params = query
+    total = conn.execute(text(count_sql), params).scalar_one()
+    rows = conn.execute(text(rows_sql), params).all()
+    return total, rows
+
+def highlight_terms(value, terms: list, width: int = None) -> Markup:
+    """
+    원문에서 검색어를 <mark>로 표시 (HTML 태그 제거 후 escape)
+    - width: 첫 일치 위치 주변만 잘라서 표시 (목록의 본문 미리보기)
+    """
+    value = " ".join(_TAG.sub(" ", value or "").split())
+    words = sorted({t["text"] for t in terms if not t["negate"] and t["target"] != "initials"}, key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(w) for w in words), re.I) if words else None
+
+    if width and len(value) > width:
+        m = pattern.search(value) if pattern else None
+        start = max(0, m.start() - width // 3) if m else 0
+        value = ("…" if start else "") + value[start:start + width] + ("…" if start + width < len(value) else "")
+    if not pattern:
+        return escape(value)
+
+    parts, last = [], 0
+    for m in pattern.finditer(value):
+        parts.append(escape(value[last:m.start()]))
+        parts.append(Markup("<mark>%s</mark>") % m.group(0))
+        last = m.end()
+    parts.append(escape(value[last:]))
+    return Markup("").join(parts)
@@ -0,0 +1,93 @@
+# rentalapp/static_cache.py
+"""
+정적 파일 캐시 — 지문(fingerprint) URL + 1년 immutable
+
+    url_for('static', filename='js/jobs.js')   →  /static/js/jobs.js?v=5c1f0a93be27
+    /static/manual/blobs/<sha256>.jpg           →  이름이 곧 내용 해시 (v 없음)
+
+- 내용 주소 파일(메뉴얼 blob 과 그 파생본)이거나 v 가 지금 파일의 지문과 같으면
+  Cache-Control: public, max-age=31536000, immutable → 다시 방문할 때 요청 자체를 안 보냄
+- 그 밖(v 없음 / 예전 v)은 지금처럼 no-cache + ETag 재검증(304)
+- 지문은 (mtime_ns, 크기)로 만든다: 예전 폴더의 큰 사진을 첫 렌더링 때 전부 읽지 않도록.
+  확인은 파일마다 STATIC_CHECK_SECONDS 에 stat 1번
+- STATIC_FINGERPRINT=0 이면 끔
+"""
+import os, time, hashlib, threading
+
+from flask import request, send_from_directory
+from werkzeug.security import safe_join
+
+from .manual_images import BLOB_DIR, DERIVED_DIR
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+STATIC_CHECK_SECONDS = float(os.getenv("STATIC_CHECK_SECONDS", "1.0"))
+CONTENT_ADDRESSED_PREFIX = f"manual/{BLOB_DIR}/"
+
+_fingerprints = {}  # (static 폴더, 파일) → {"key", "token", "checked"}
+_fingerprints_lock = threading.Lock()
+
+def content_addressed_etag(filename: str):
+    """blobs/<sha256>.<ext>, blobs/.derived/<sha256>.<폭>w.<형식> → 파일 이름(ETag 로 사용), 아니면 None"""
+    if not filename.startswith(CONTENT_ADDRESSED_PREFIX):
+        return None
+    rest = filename[len(CONTENT_ADDRESSED_PREFIX):]
+    if rest.startswith(DERIVED_DIR + "/"):
+        rest = rest[len(DERIVED_DIR) + 1:]
+    return rest if rest and "/" not in rest else None
+
+def fingerprint(static_folder: str, filename: str):
+    """정적 파일의 현재 지문 (파일이 없으면 None)"""
+    cache_key = (static_folder, filename)
+    now = time.monotonic()
+    with _fingerprints_lock:
+        entry = _fingerprints.get(cache_key)
+        if entry and now - entry["checked"] < STATIC_CHECK_SECONDS:
+            return entry["token"]
+
+    path = safe_join(static_folder, filename)
+    try:
+        st = os.stat(path) if path else None
+    except OSError:
+        st = None
+    key = (st.st_mtime_ns, st.st_size) if st else None
+    if entry and entry["key"] == key:
+        entry["checked"] = now
+        return entry["token"]
+
+    token = hashlib.sha1(f"{key[0]}-{key[1]}".encode()).hexdigest()[:12] if key else None
+    with _fingerprints_lock:
+        _fingerprints[cache_key] = {"key": key, "token": token, "checked": now}
+    return token
+
+def init_static_cache(app):
+    """url_for('static') 에 v 추가 + static 뷰를 캐시 헤더를 붙이는 뷰로 교체"""
+    if os.getenv("STATIC_FINGERPRINT", "1") == "0" or not app.has_static_folder:
+        return
+
+    @app.url_defaults
+    def add_static_fingerprint(endpoint, values):
+        if endpoint != "static" or "v" in values:
+            return
+        filename = values.get("filename")
+        if filename and not content_addressed_etag(filename):
+            token = fingerprint(app.static_folder, filename)
+            if token:
+                values["v"] = token
+
+    def static(filename):
+        etag = content_addressed_etag(filename)
+        if etag:
+            immutable = True
+        else:
+            token = fingerprint(app.static_folder, filename)
+            immutable = token is not None and request.args.get("v") == token
+        rv = send_from_directory(
+            app.static_folder, filename,
+            max_age=IMMUTABLE_MAX_AGE if immutable else None,
+            etag=etag or True,
+        )
+        if immutable:
+            rv.cache_control.immutable = True
+        return rv
+
+    app.view_functions["static"] = static
@@ -0,0 +1,59 @@
+# rentalapp/todos.py
+from flask import Blueprint, request, session, jsonify
+from sqlalchemy import text
+
+from .db import engine, now_kst_str
+
+bp = Blueprint("todos", __name__)
+
+# 라우트와 check-plans(rentalapp/plans.py)가 같은 문장을 사용
+TODOS_SQL = """
+    SELECT id, user_name, content, status, created_at
+    FROM todos
+    WHERE user_name = :user
+      AND status != '삭제'
+    ORDER BY id DESC
+"""
+
+# ---------------------------------------------------------------------
+# 🧩 오늘의 할 일 (To-Do)
+# ---------------------------------------------------------------------
+@bp.route("/todos", methods=["GET"])
+def get_todos():
+    """할 일 목록 조회"""
+    user = session.get("admin_name") or session.get("user_name") or "guest"
+    with engine.begin() as conn:
+        rows = conn.execute(text(TODOS_SQL), {"user": user}).mappings().all()
+    return jsonify([dict(r) for r in rows])
+
+@bp.route("/todos/add", methods=["POST"])
+def add_todo():
+    """할 일 추가"""
+    data = request.get_json()
+    content = data.get("content", "").strip()
+    if not content:
+        return jsonify({"ok": False, "error": "내용이 비어 있음"}), 400
+    user = session.get("admin_name") or session.get("user_name") or "guest"
+    with engine.begin() as conn:
+        conn.execute(text("""
+            INSERT INTO todos (user_name, content, status, created_at)
+            VALUES (:user_name, :content, '진행', :created_at)
+        """), {"user_name": user, "content": content, "created_at": now_kst_str()})
+    return jsonify({"ok": True})
+
+@bp.route("/todos/update/<int:todo_id>", methods=["POST"])
+def update_todo(todo_id):
+    """할 일 상태 변경 (진행/완료/삭제)"""
+    data = request.get_json()
+    status = data.get("status")
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE todos SET status = :status WHERE id = :id"),
+                     {"status": status, "id": todo_id})
+    return jsonify({"ok": True})
+
+@bp.route("/todos/delete_all", methods=["POST"])
+def delete_all_todos():
+    """삭제 상태의 항목을 전체 삭제"""
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM todos WHERE status = '삭제'"))
+    return jsonify({"ok": True})
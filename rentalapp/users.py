@@ -0,0 +1,126 @@
+# rentalapp/users.py
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from sqlalchemy import text
+from werkzeug.security import generate_password_hash
+
+from .db import engine, now_kst_str
+
+bp = Blueprint("users", __name__)
+
+# ---------------------------------------------------------------------
+# 👤 사원 관리 (리스트 / 추가 / 수정 / 삭제)
+# ---------------------------------------------------------------------
+
+# ✅ 사원 리스트
+@bp.route("/admin/users/list", endpoint="admin_user_list")
+def admin_user_list():
+    with engine.connect() as conn:
+        employees = conn.execute(text("""
+            SELECT id, name, phone, department, position, email, created_at
+            FROM employees
+            ORDER BY id DESC
+        """)).mappings().all()
+    return render_template("users/list.html", employees=employees)
+
+
+
+# ✅ 사원 추가 (텍스트 입력 버전)
+@bp.route("/admin/users/add", methods=["GET", "POST"], endpoint="admin_user_add")
+def admin_user_add():
+    if request.method == "POST":
+        name = request.form.get("name")
+        phone = request.form.get("phone")
+        department = request.form.get("department")
+        position = request.form.get("position")
+        userid = request.form.get("userid")
+        password = request.form.get("temp_password")
+        email = request.form.get("email")
+
+        # ✅ 비밀번호 해시 (로그인 시 검증 가능하게)
+        hashed_pw = generate_password_hash(password)
+
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("""
+                    INSERT INTO employees (name, phone, department, position, userid, password, email, created_at)
+                    VALUES (:name, :phone, :department, :position, :userid, :password, :email, :created_at)
+                """), {
+                    "created_at": now_kst_str(),
+                    "name": name,
+                    "phone": phone,
+                    "department": department,
+                    "position": position,
+                    "userid": userid,
+                    "password": hashed_pw,
+                    "email": email
+                })
+
+            flash("✅ 사원이 성공적으로 등록되었습니다.", "success")
+            return redirect(url_for("users.admin_user_list"))
+
+        except Exception as e:
+            print("❌ admin_user_add error:", e)
+            flash("❌ 등록 중 오류가 발생했습니다.", "danger")
+
+    # ✅ 부서/직급 드롭다운 제거 후 단순 페이지 렌더링
+    return render_template("users/new.html", edit_mode=False)
+
+
+# ✅ 사원 수정
+@bp.route("/admin/users/edit/<int:user_id>", methods=["GET", "POST"], endpoint="admin_user_edit")
+def admin_user_edit(user_id):
+    with engine.connect() as conn:
+        user = conn.execute(text("SELECT * FROM employees WHERE id=:id"), {"id": user_id}).mappings().first()
+        depts = conn.execute(text("SELECT id, name FROM departments ORDER BY name")).mappings().all()
+        ranks = conn.execute(text("SELECT id, name FROM ranks ORDER BY name")).mappings().all()
+
+    if not user:
+        flash("❌ 해당 사원을 찾을 수 없습니다.", "danger")
+        return redirect(url_for("users.admin_user_list"))
+
+    if request.method == "POST":
+        name = request.form.get("name")
+        phone = request.form.get("phone")
+        dept_id = request.form.get("dept_id") or None
+        rank_id = request.form.get("rank_id") or None
+        userid = request.form.get("userid")
+        password = request.form.get("temp_password")
+        email = request.form.get("email")
+
+        with engine.begin() as conn:
+            conn.execute(text("""
+                UPDATE employees
+                   SET name=:name, phone=:phone, dept_id=:dept_id, rank_id=:rank_id,
+                       userid=:userid, password=:password, email=:email
+                 WHERE id=:id
+            """), {
+                "id": user_id, "name": name, "phone": phone, "dept_id": dept_id,
+                "rank_id": rank_id, "userid": userid, "password": password, "email": email
+            })
+        flash("✅ 사원 정보가 수정되었습니다.", "success")
+        return redirect(url_for("users.admin_user_list"))
+
+    return render_template("users/new.html", user=user, departments=depts, ranks=ranks, edit_mode=True)
+
+# ✅ 사원 삭제
+@bp.route("/admin/users/delete/<int:user_id>", methods=["POST"], endpoint="admin_user_delete")
+def admin_user_delete(user_id):
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM employees WHERE id = :id"), {"id": user_id})
+        flash("🗑️ 사원 정보가 삭제되었습니다.", "success")
+    except Exception as e:
+        print("❌ admin_user_delete error:", e)
+        flash("❌ 삭제 중 오류가 발생했습니다.", "danger")
+    return redirect(url_for("users.admin_user_list"))
+
+
+# ---------------------------------------------------------------------
+# 🧩 직급 및 부서 리스트
+# ---------------------------------------------------------------------
+@bp.route("/admin/users/rank-dept", methods=["GET"], endpoint="admin_rank_dept_list")
+def admin_rank_dept_list():
+    with engine.connect() as conn:
+        depts = conn.execute(text("SELECT id, name FROM departments ORDER BY name")).mappings().all()
+        ranks = conn.execute(text("SELECT id, name FROM ranks ORDER BY name")).mappings().all()
+    return render_template("users/rank-dept.html", departments=depts, ranks=ranks)
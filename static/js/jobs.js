@@ -0,0 +1,75 @@
+// 백그라운드 작업(내보내기/가져오기) 등록 + 진행률 폴링
+//  - <button data-job-url="/admin/jobs/export/...">  : 완료되면 파일 다운로드
+//  - <form data-job-action="/admin/jobs/import/..." data-job-status="#요소"> : 결과를 요소에 표시
+(function () {
+  const POLL_MS = 1000;
+
+  async function submitJob(url, body) {
+    const res = await fetch(url, { method: 'POST', body: body, credentials: 'same-origin' });
+    const data = await res.json().catch(() => ({}));
+    if (!res.ok || !data.ok) throw new Error(data.error || `요청 실패 (${res.status})`);
+    return data;
+  }
+
+  async function waitJob(statusUrl, onProgress) {
+    for (;;) {
+      const res = await fetch(statusUrl, { credentials: 'same-origin' });
+      const job = await res.json();
+      if (!res.ok || !job.ok) throw new Error(job.error || '작업 상태를 확인할 수 없습니다.');
+      if (job.status === 'done') return job;
+      if (job.status === 'failed') throw new Error(job.message || '작업이 실패했습니다.');
+      onProgress(job);
+      await new Promise(r => setTimeout(r, POLL_MS));
+    }
+  }
+
+  function progressText(job) {
+    if (job.progress != null) return `${job.progress}%`;
+    return job.done ? `${job.done.toLocaleString()}행` : '대기 중';
+  }
+
+  function escapeHtml(s) {
+    return String(s ?? '').replace(/[&<>"']/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' }[c]));
+  }
+
+  document.addEventListener('click', async (e) => {
+    const btn = e.target.closest('[data-job-url]');
+    if (!btn || btn.disabled) return;
+    e.preventDefault();
+    const label = btn.innerHTML;
+    btn.disabled = true;
+    try {
+      const { status_url } = await submitJob(btn.dataset.jobUrl);
+      const job = await waitJob(status_url, j => { btn.textContent = `처리 중 ${progressText(j)}`; });
+      if (job.download_url) window.location = job.download_url;
+    } catch (err) {
+      alert(err.message);
+    } finally {
+      btn.disabled = false;
+      btn.innerHTML = label;
+    }
+  });
+
+  document.addEventListener('submit', async (e) => {
+    const form = e.target.closest('form[data-job-action]');
+    if (!form) return;
+    e.preventDefault();
+    const out = document.querySelector(form.dataset.jobStatus);
+    const show = html => { if (out) out.innerHTML = html; };
+    const buttons = form.querySelectorAll('button');
+    buttons.forEach(b => { b.disabled = true; });
+    try {
+      const { status_url } = await submitJob(form.dataset.jobAction, new FormData(form));
+      const job = await waitJob(status_url, j => show(`<div class="alert alert-info mt-2">처리 중 ${progressText(j)}</div>`));
+      const rejected = (job.result && job.result.rejected) || [];
+      show(`<div class="alert ${rejected.length ? 'alert-warning' : 'alert-success'} mt-2">
+              <div>${escapeHtml(job.message)} <a href="" class="ms-2">새로고침</a></div>
+              ${rejected.map(r => `<div class="small">${r.row}행 ${escapeHtml(r.name)} — ${escapeHtml(r.reason)}</div>`).join('')}
+            </div>`);
+    } catch (err) {
+      show(`<div class="alert alert-danger mt-2">${escapeHtml(err.message)}</div>`);
+    } finally {
+      buttons.forEach(b => { b.disabled = false; });
+    }
+  });
+})();